@@ -0,0 +1,191 @@
+"""
+Micro-benchmark for the per-node dispatch overhead of the Refurb visitor.
+
+This compares the previous dispatch strategy (visitor methods were created for every file, and
+the signature of each check was inspected every time it was called) against the current one
+(one visitor class per set of checks, with the checks normalized when they are loaded).
+
+To isolate the dispatch overhead, every check is replaced with a no-op function that has the same
+signature as the original check.
+
+Usage: python -m bench.dispatch [--repeat N] [FILES...]
+"""
+
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from functools import partial
+
+from mypy.build import build
+from mypy.nodes import CallExpr, MypyFile, Node
+
+from refurb.error import Error
+from refurb.loader import load_checks
+from refurb.main import get_mypy_options
+from refurb.settings import Settings
+from refurb.types import Check, Checks
+from refurb.visitor import METHOD_NODE_MAPPINGS, TraverserVisitor, build_visitor_class
+
+LegacyVisitorMethod = Callable[["LegacyRefurbVisitor", Node], None]
+
+
+class LegacyRefurbVisitor(TraverserVisitor):
+    """
+    The dispatch strategy used by `RefurbVisitor` before visitor classes were built ahead of
+    time, kept here as a reference point.
+    """
+
+    def __init__(self, checks: defaultdict[type[Node], list[Check]], settings: Settings) -> None:
+        self.errors: list[Error] = []
+        self.checks = checks
+        self.settings = settings
+
+        for name, ty in METHOD_NODE_MAPPINGS.items():
+            if ty in checks and name != "visit_call_expr":
+                setattr(self, name, self.build_visitor(name, ty).__get__(self))
+
+    def build_visitor(self, name: str, ty: type[Node]) -> LegacyVisitorMethod:
+        checks = self.checks
+
+        def inner(self: LegacyRefurbVisitor, o: Node) -> None:
+            for check in checks[ty]:
+                self.run_check(o, check)
+
+            getattr(TraverserVisitor, name)(self, o)
+
+        return inner
+
+    def visit_call_expr(self, o: CallExpr) -> None:
+        for check in self.checks[CallExpr]:
+            self.run_check(o, check)
+
+        for arg in o.args:
+            self.accept(arg)
+
+        self.accept(o.callee)
+
+    def run_check(self, node: Node, check: Check) -> None:
+        if len(check.__annotations__) == 4:
+            check(node, self.errors, self.settings)  # type: ignore[call-arg]
+
+        else:
+            check(node, self.errors)  # type: ignore[call-arg]
+
+
+def noop(node: Node, errors: list[Error]) -> None:
+    pass
+
+
+def noop_with_settings(node: Node, errors: list[Error], settings: Settings) -> None:
+    pass
+
+
+def make_noop_checks(checks: Checks) -> tuple[defaultdict[type[Node], list[Check]], Checks]:
+    legacy: defaultdict[type[Node], list[Check]] = defaultdict(list)
+    current: Checks = defaultdict(list)
+
+    settings = Settings()
+
+    for ty, funcs in checks.items():
+        for func in funcs:
+            if isinstance(func, partial):
+                legacy[ty].append(noop_with_settings)
+                current[ty].append(partial(noop_with_settings, settings=settings))
+
+            else:
+                legacy[ty].append(noop)
+                current[ty].append(noop)
+
+    return legacy, current
+
+
+class NodeCounter(TraverserVisitor):
+    def __init__(self, checks: Checks) -> None:
+        self.count = 0
+
+        for name, ty in METHOD_NODE_MAPPINGS.items():
+            if ty in checks:
+                setattr(self, name, self.counter(name))
+
+    def counter(self, name: str) -> Callable[[Node], None]:
+        def inner(o: Node) -> None:
+            self.count += 1
+
+            getattr(TraverserVisitor, name)(self, o)
+
+        return inner
+
+
+def main(args: list[str]) -> None:
+    repeat = 10
+
+    if args[:1] == ["--repeat"]:
+        repeat = int(args[1])
+        args = args[2:]
+
+    settings = Settings(files=args or ["test/data"], enable_all=True)
+
+    mypy_options = get_mypy_options(settings)
+    assert not isinstance(mypy_options, list)
+
+    files, opt = mypy_options
+    result = build(files, options=opt)
+
+    trees: list[MypyFile] = []
+
+    for file in files:
+        tree = result.graph[file.module].tree
+        assert tree
+
+        trees.append(tree)
+
+    legacy_checks, current_checks = make_noop_checks(load_checks(settings))
+
+    node_count = 0
+
+    for tree in trees.copy():
+        counter = NodeCounter(current_checks)
+
+        try:
+            counter.accept(tree)
+
+        except RecursionError:
+            # Refurb skips files which are nested too deeply, so these are skipped here as well
+            trees.remove(tree)
+
+        else:
+            node_count += counter.count
+
+    def time_legacy() -> float:
+        start = time.perf_counter()
+
+        for tree in trees:
+            LegacyRefurbVisitor(legacy_checks, settings).accept(tree)
+
+        return time.perf_counter() - start
+
+    def time_current() -> float:
+        start = time.perf_counter()
+
+        visitor_type = build_visitor_class(current_checks)
+
+        for tree in trees:
+            visitor_type(current_checks, settings).accept(tree)
+
+        return time.perf_counter() - start
+
+    legacy = min(time_legacy() for _ in range(repeat))
+    current = min(time_current() for _ in range(repeat))
+
+    def per_node(elapsed: float) -> str:
+        return f"{elapsed / node_count * 1_000_000_000:.0f}ns/node"
+
+    print(f"files: {len(trees)}, dispatched nodes: {node_count}, best of {repeat} runs")
+    print(f"before: {legacy * 1_000:.2f}ms ({per_node(legacy)})")
+    print(f"after:  {current * 1_000:.2f}ms ({per_node(current)})")
+    print(f"speedup: {legacy / current:.2f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,455 @@
+"""
+Benchmark suite for Refurb. This times each phase of `run_refurb()` against a fixed corpus (the
+test data folders plus a few generated large modules), and then times each check in isolation,
+broken down by the node types it is registered for. The memory usage of checking the corpus is
+measured with and without `--low-memory` as well.
+
+The results are written as JSON, and can be compared against a previous run (the baseline), in
+which case a non-zero exit code is returned if anything got slower than the given threshold.
+
+Usage: python -m bench.suite [--repeat N] [--output FILE] [--baseline FILE] [--threshold PCT]
+"""
+
+import json
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from importlib import metadata
+from itertools import chain
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from mypy.build import BuildResult, BuildSource
+from mypy.nodes import MypyFile
+
+from refurb.error import AnalysisTier, Error
+from refurb.loader import get_check_name, load_checks
+from refurb.main import (
+    check_file,
+    format_errors,
+    get_mypy_options,
+    run_mypy,
+    set_builtins_mypy_file,
+    sort_errors,
+)
+from refurb.settings import Settings
+from refurb.source import SourceStore
+from refurb.suppressions import Suppressions
+from refurb.types import Checks
+from refurb.visitor import RefurbVisitor, build_visitor_class
+
+BENCHMARK_VERSION = 1
+
+# Regressions smaller than this are ignored, since they are most likely just noise
+MIN_REGRESSION_IN_MS = 1.0
+
+LARGE_MODULE_COUNT = 4
+LARGE_MODULE_BLOCKS = 250
+
+LARGE_MODULE_BLOCK = """
+def func_{i}(items: list[int], name: str, path: str) -> int:
+    total = 0
+
+    for index, item in enumerate(items):
+        if item % 2 == 0 and item > 10:
+            total += item * index
+        elif isinstance(item, int) or isinstance(item, float):
+            total -= int(item)
+
+    values = [str(x) for x in items if x]
+    mapping = {{key: value for key, value in zip(values, items)}}
+
+    if name == "a" or name == "b":
+        print(name + " " + str(total))
+
+    with open(path) as f:
+        data = f.read()
+
+    return len(values) + len(mapping) + len(data)
+
+
+class Class{i}:
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def method(self, other: "Class{i}") -> bool:
+        if self.value == other.value:
+            return True
+
+        return not not self.value
+"""
+
+
+def generate_large_modules(folder: Path) -> None:
+    for module in range(LARGE_MODULE_COUNT):
+        blocks = (LARGE_MODULE_BLOCK.format(i=i) for i in range(LARGE_MODULE_BLOCKS))
+
+        (folder / f"large_{module}.py").write_text("".join(blocks))
+
+
+def get_corpus(generated: Path) -> list[Path]:
+    """
+    Get the folders to benchmark against. Each folder is built separately since the test data
+    folders share some module names.
+    """
+
+    test_folder = Path(__file__).parent.parent / "test"
+
+    folders = [test_folder / "data"]
+
+    for folder in sorted(test_folder.glob("data_3.*")):
+        version = tuple(int(x) for x in folder.name.removeprefix("data_").split("."))
+
+        if version <= sys.version_info[:2]:
+            folders.append(folder)
+
+    generate_large_modules(generated)
+
+    return [*folders, generated]
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    """
+    Run `func` `repeat` times, returning the fastest time in milliseconds.
+    """
+
+    times: list[float] = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    return min(times) * 1_000
+
+
+LOAD_CHECKS_SCRIPT = """\
+import time
+
+from refurb.loader import load_checks
+from refurb.settings import Settings
+
+start = time.perf_counter()
+load_checks(Settings(enable_all=True))
+print(time.perf_counter() - start)
+"""
+
+
+def time_load_checks(repeat: int) -> float:
+    """
+    Checks are only imported once per process, so each run is done in a fresh process.
+    """
+
+    times: list[float] = []
+
+    for _ in range(repeat):
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", LOAD_CHECKS_SCRIPT], capture_output=True, check=True, text=True
+        ).stdout
+
+        times.append(float(output))
+
+    return min(times) * 1_000
+
+
+MEASURE_MEMORY_SCRIPT = """\
+import json
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from refurb.main import main
+
+flags, *folders = sys.argv[1:]
+check_rss = 0.0
+
+with TemporaryDirectory() as tmp:
+    stats = Path(tmp) / "stats.json"
+
+    for folder in folders:
+        main([folder, "--enable-all", "--quiet", "--timing-stats", str(stats), *flags.split()])
+
+        memory = json.loads(stats.read_text())["memory"]["check"]
+        check_rss = max(check_rss, memory["rss_in_mb"])
+
+print(json.dumps({"peak_rss": memory["peak_rss_in_mb"], "check_rss": check_rss}))
+"""
+
+MEMORY_MODES = {"default": "", "low_memory": "--low-memory"}
+
+
+def measure_memory(corpus: list[Path]) -> dict[str, dict[str, float]]:
+    """
+    Measure the peak RSS of checking the corpus, and the highest RSS once a folder was checked,
+    with and without `--low-memory`. The peak RSS never goes down, so each mode is ran in a fresh
+    process. Memory usage doesn't vary much between runs, so each mode is only ran once.
+    """
+
+    results: dict[str, dict[str, float]] = {}
+
+    for mode, flags in MEMORY_MODES.items():
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", MEASURE_MEMORY_SCRIPT, flags, *map(str, corpus)],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+
+        # The errors for each folder are printed before the results
+        results[mode] = json.loads(output.splitlines()[-1])
+
+    return results
+
+
+@dataclass
+class BuiltFolder:
+    files: list[BuildSource]
+    result: BuildResult
+    trees: list[MypyFile]
+
+
+def build_folder(folder: Path, settings: Settings) -> BuiltFolder:
+    mypy_options = get_mypy_options(Settings.merge(settings, Settings(files=[str(folder)])))
+    assert not isinstance(mypy_options, list)
+
+    files, opt = mypy_options
+
+    result = run_mypy(files, opt, AnalysisTier.TYPES)
+    assert isinstance(result, BuildResult)
+
+    trees = [tree for file in files if (tree := result.graph[file.module].tree)]
+
+    return BuiltFolder(files, result, trees)
+
+
+def time_phases(
+    corpus: list[Path], settings: Settings, checks: Checks, repeat: int
+) -> tuple[dict[str, float], list[BuiltFolder]]:
+    phases: dict[str, float] = {"load_checks": time_load_checks(repeat)}
+
+    built: list[BuiltFolder] = []
+
+    def build() -> None:
+        built.clear()
+        built.extend(build_folder(folder, settings) for folder in corpus)
+
+    phases["build"] = best_of(repeat, build)
+
+    visitor_type = build_visitor_class(checks)
+    errors: list[list[list[Error | str]]] = []
+
+    def visit() -> None:
+        errors.clear()
+
+        for folder in built:
+            set_builtins_mypy_file(folder.result)
+
+            errors.append(
+                [
+                    check_file(file, folder.result, checks, settings, visitor_type).errors
+                    for file in folder.files
+                ]
+            )
+
+    phases["visitor"] = best_of(repeat, visit)
+
+    key = partial(sort_errors, settings=settings)
+
+    def filter_and_format() -> None:
+        for folder, folder_errors in zip(built, errors, strict=True):
+            suppressions = Suppressions(settings, SourceStore.from_result(folder.result))
+
+            runs = (
+                sorted(
+                    (
+                        error
+                        for error in file_errors
+                        if not suppressions.should_ignore_error(error)
+                    ),
+                    key=key,
+                )
+                for file_errors in folder_errors
+            )
+
+            format_errors(list(chain.from_iterable(runs)), settings)
+
+    phases["filter_and_format"] = best_of(repeat, filter_and_format)
+
+    empty_visitor_type = build_visitor_class(Checks(list))
+
+    def visit_without_checks() -> None:
+        for folder in built:
+            for tree in folder.trees:
+                empty_visitor_type(Checks(list), settings).accept(tree)
+
+    phases["traversal_only"] = best_of(repeat, visit_without_checks)
+
+    return phases, built
+
+
+def time_checks(
+    built: list[BuiltFolder], settings: Settings, checks: Checks, repeat: int
+) -> dict[str, dict[str, float]]:
+    """
+    Time each check on its own, once for each node type it is registered for. The time includes
+    traversing the trees, which can be found in the `traversal_only` phase.
+    """
+
+    results: defaultdict[str, dict[str, float]] = defaultdict(dict)
+
+    for ty, funcs in checks.items():
+        for func in funcs:
+            single: Checks = Checks(list, {ty: [func]})
+            visitor_type = build_visitor_class(single)
+
+            def run(
+                visitor_type: type[RefurbVisitor] = visitor_type, single: Checks = single
+            ) -> None:
+                for folder in built:
+                    set_builtins_mypy_file(folder.result)
+
+                    for tree in folder.trees:
+                        visitor_type(single, settings).accept(tree)
+
+            results[get_check_name(func)][ty.__name__] = best_of(repeat, run)
+
+    return {
+        name: {"total": sum(node_types.values()), **dict(sorted(node_types.items()))}
+        for name, node_types in sorted(results.items())
+    }
+
+
+def find_regressions(
+    current: dict[str, object], baseline: dict[str, object], threshold: float
+) -> list[str]:
+    """
+    Compare the phase times and the total time of each check against the baseline. Checks which
+    are missing from either run are skipped.
+    """
+
+    def flatten(data: dict[str, object]) -> dict[str, float]:
+        phases = data.get("phases_in_ms", {})
+        checks = data.get("checks_in_ms", {})
+
+        assert isinstance(phases, dict)
+        assert isinstance(checks, dict)
+
+        return {
+            **{f"phase {name}": float(value) for name, value in phases.items()},
+            **{f"check {name}": float(value["total"]) for name, value in checks.items()},
+        }
+
+    new = flatten(current)
+    old = flatten(baseline)
+
+    regressions: list[str] = []
+
+    for name, before in old.items():
+        after = new.get(name)
+
+        if after is None:
+            continue
+
+        if after - before > MIN_REGRESSION_IN_MS and after > before * (1 + threshold):
+            change = (after / before - 1) * 100 if before else float("inf")
+
+            regressions.append(f"{name}: {before:.2f}ms -> {after:.2f}ms (+{change:.0f}%)")
+
+    return regressions
+
+
+def main(args: list[str]) -> int:
+    parser = ArgumentParser(prog="python -m bench.suite", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark (default: 3)")
+    parser.add_argument("--output", type=Path, help="write the results (as JSON) to this file")
+    parser.add_argument("--baseline", type=Path, help="compare against this results file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=20,
+        help="percent slowdown that counts as a regression (default: 20)",
+    )
+    opts = parser.parse_args(args)
+
+    settings = Settings(enable_all=True, color=False, quiet=True)
+    checks = load_checks(settings)
+
+    with TemporaryDirectory() as tmp:
+        corpus = get_corpus(Path(tmp))
+
+        phases, built = time_phases(corpus, settings, checks, opts.repeat)
+        checks_in_ms = time_checks(built, settings, checks, opts.repeat)
+        memory_in_mb = measure_memory(corpus)
+
+        lines = sum(
+            len(file.read_text().splitlines())
+            for file in chain.from_iterable(folder.glob("*.py") for folder in corpus)
+        )
+
+    results: dict[str, object] = {
+        "version": BENCHMARK_VERSION,
+        "python": ".".join(str(x) for x in sys.version_info[:3]),
+        "refurb": metadata.version("refurb"),
+        "mypy": metadata.version("mypy"),
+        "repeat": opts.repeat,
+        "corpus": {
+            "folders": len(corpus),
+            "files": sum(len(folder.files) for folder in built),
+            "lines": lines,
+        },
+        "phases_in_ms": {name: round(value, 3) for name, value in phases.items()},
+        "checks_in_ms": {
+            name: {ty: round(value, 3) for ty, value in node_types.items()}
+            for name, node_types in checks_in_ms.items()
+        },
+        "memory_in_mb": memory_in_mb,
+    }
+
+    output = json.dumps(results, indent=2)
+
+    if opts.output:
+        opts.output.write_text(output + "\n")
+
+    for name, value in phases.items():
+        print(f"{name:<20} {value:>10.2f}ms")
+
+    print("\nmemory usage (peak RSS, RSS after checking):")
+
+    for mode, memory in memory_in_mb.items():
+        print(f"{mode:<20} {memory['peak_rss']:>10.1f}MB {memory['check_rss']:>10.1f}MB")
+
+    slowest = sorted(checks_in_ms.items(), key=lambda item: item[1]["total"], reverse=True)
+
+    print("\nslowest checks (including traversal):")
+
+    for name, node_types in slowest[:10]:
+        print(f"{name:<20} {node_types['total']:>10.2f}ms")
+
+    if opts.baseline:
+        baseline = json.loads(opts.baseline.read_text())
+
+        if baseline.get("version") != BENCHMARK_VERSION:
+            print(f"\nbaseline {opts.baseline} is from a different benchmark version, skipping")
+
+            return 0
+
+        if regressions := find_regressions(results, baseline, opts.threshold / 100):
+            print(f"\nregressions (more than {opts.threshold:g}% slower than baseline):")
+
+            for regression in regressions:
+                print(f"  {regression}")
+
+            return 1
+
+        print(f"\nno regressions compared to {opts.baseline}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,13 +1,21 @@
+import importlib
 import re
 from pathlib import Path
 from textwrap import dedent
 
 from refurb.error import ErrorCode
-from refurb.loader import get_error_class, get_modules
+from refurb.loader import get_error_class
+from refurb.manifest import read_manifest
 
 docs: dict[str, str] = {}
 
-for module in get_modules([]):
+manifest = read_manifest()
+
+assert manifest, "Run `python3 -m refurb.manifest` first"
+
+for entry in manifest:
+    module = importlib.import_module(entry.module)
+
     if error := get_error_class(module):
         error_code = ErrorCode.from_error(error)
 
@@ -1,10 +1,19 @@
 import sys
 
-from refurb.main import main as _main
+from refurb.daemon import daemon_main
 
 
 def main() -> None:
-    sys.exit(_main(sys.argv[1:]))
+    args = sys.argv[1:]
+
+    # Daemon commands are handled before importing `refurb.main` since it imports Mypy, which is
+    # slow to import and not needed by the daemon client.
+    if args[:1] == ["daemon"]:
+        sys.exit(daemon_main(args[1:]))
+
+    from refurb.main import main as _main  # noqa: PLC0415
+
+    sys.exit(_main(args))
 
 
 if __name__ == "__main__":
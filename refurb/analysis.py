@@ -0,0 +1,89 @@
+"""
+Support for running only part of the Mypy pipeline. When all of the enabled checks only need the
+syntax tree, each file is parsed on its own instead of running a full Mypy build, which has to
+analyze (and type check) every imported module as well, including the standard library.
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from mypy.build import BuildResult, BuildSource
+from mypy.errors import CompileError, Errors
+from mypy.fscache import FileSystemCache
+from mypy.nodes import MypyFile
+from mypy.options import Options
+from mypy.parse import parse
+from mypy.util import decode_python_encoding
+
+
+@dataclass
+class ParsedModule:
+    """
+    A stand-in for the Mypy `State` of a module which has only been parsed. Since nothing is
+    resolved across modules, the module has no dependencies.
+    """
+
+    tree: MypyFile
+    dependencies: list[str] = field(default_factory=list)
+    source_hash: str = ""
+
+
+@dataclass
+class ParseResult:
+    graph: dict[str, ParsedModule]
+
+    # Holds the contents of the files that were read, same as the `BuildManager.fscache`
+    fscache: FileSystemCache
+
+
+AnalysisResult = BuildResult | ParseResult
+
+
+def read_source(file: BuildSource, fscache: FileSystemCache) -> str:
+    if file.text is not None:
+        return file.text
+
+    assert file.path
+
+    try:
+        return decode_python_encoding(fscache.read(file.path))
+
+    except OSError as ex:
+        msg = os.strerror(ex.errno) if ex.errno else str(ex)
+
+        raise CompileError([f"mypy: can't read file '{file.path}': {msg}"]) from ex
+
+
+def parse_files(files: list[BuildSource], options: Options) -> ParseResult:
+    """
+    Parse each file without doing any semantic analysis or type checking. A `CompileError` is
+    raised if any of the files have syntax errors, the same as `mypy.build.build()` would.
+    """
+
+    sources: dict[str, str] = {}
+
+    # Used by Mypy to show the offending line when the `--pretty` flag is set
+    def get_source_lines(path: str) -> list[str] | None:
+        source = sources.get(path)
+
+        return None if source is None else source.splitlines()
+
+    errors = Errors(options, read_source=get_source_lines)
+    errors.set_ignore_prefix(str(Path.cwd()))
+
+    graph: dict[str, ParsedModule] = {}
+    fscache = FileSystemCache()
+
+    for file in files:
+        path = file.path or "<string>"
+        source = sources[path] = read_source(file, fscache)
+
+        errors.set_file(path, file.module, options)
+
+        graph[file.module] = ParsedModule(parse(source, path, file.module, errors, options))
+
+    if errors.is_errors():
+        raise CompileError(errors.new_messages())
+
+    return ParseResult(graph, fscache)
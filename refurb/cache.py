@@ -0,0 +1,253 @@
+import hashlib
+import json
+import os
+import sys
+from dataclasses import dataclass
+from functools import partial
+from importlib import import_module, metadata
+from pathlib import Path
+
+from mypy import defaults
+from mypy.build import BuildSource
+from mypy.options import Options
+
+from .analysis import AnalysisResult
+from .error import Error
+from .settings import Settings
+from .types import Checks
+
+CACHE_DIR = Path(".refurb_cache")
+
+# Once the cache grows past this size the least recently used entries are deleted.
+MAX_CACHE_SIZE_IN_BYTES = 64 * 1024 * 1024
+
+# Mypy's cache is stored here (in a folder per set of options) instead of `.mypy_cache`, since
+# Refurb runs Mypy with different options (and plugins) than when Mypy is ran by itself. Sharing
+# a folder means that each run invalidates the cache of the other.
+MYPY_CACHE_DIR = CACHE_DIR / "mypy"
+
+SerializedError = dict[str, str | int | None]
+
+
+def serialize_error(error: Error) -> SerializedError:
+    return {
+        "type": f"{type(error).__module__}:{type(error).__qualname__}",
+        "line": error.line,
+        "column": error.column,
+        "msg": error.msg,
+        "line_end": error.line_end,
+        "column_end": error.column_end,
+    }
+
+
+def deserialize_error(data: SerializedError, filename: str | None = None) -> Error:
+    module, _, name = str(data["type"]).partition(":")
+
+    error_type: object = import_module(module)
+
+    for part in name.split("."):
+        error_type = getattr(error_type, part)
+
+    if not (isinstance(error_type, type) and issubclass(error_type, Error)):
+        raise TypeError(f'"{data["type"]}" is not an Error type')
+
+    line_end = data["line_end"]
+    column_end = data["column_end"]
+
+    return error_type(
+        line=int(data["line"] or 0),
+        column=int(data["column"] or 0),
+        msg=str(data["msg"]),
+        filename=filename,
+        line_end=None if line_end is None else int(line_end),
+        column_end=None if column_end is None else int(column_end),
+    )
+
+
+def hash_str(s: str) -> str:
+    return hashlib.sha256(s.encode()).hexdigest()
+
+
+def get_check_fingerprint(checks: Checks) -> str:
+    """
+    Build a fingerprint of the currently enabled checks. The source code of the module that each
+    check lives in is included so that editing a local (`--load`-ed) check invalidates the cache,
+    even if the Refurb version stays the same.
+    """
+
+    parts: list[str] = []
+
+    for ty, funcs in sorted(checks.items(), key=lambda item: item[0].__name__):
+        for check in funcs:
+            # Unwrap checks which had their settings bound when they were loaded
+            func = check.func if isinstance(check, partial) else check
+
+            module = sys.modules.get(func.__module__)
+            filename = getattr(module, "__file__", None) or ""
+
+            source_hash = (
+                hashlib.sha256(Path(filename).read_bytes()).hexdigest()
+                if filename and Path(filename).is_file()
+                else ""
+            )
+
+            parts.append(f"{ty.__name__}:{func.__module__}.{func.__qualname__}:{source_hash}")
+
+    return hash_str("\n".join(parts))
+
+
+def get_settings_fingerprint(settings: Settings) -> str:
+    # Only settings that can change what the checks emit are included here. Ignored errors are
+    # filtered out after the fact, so they can be changed without invalidating the cache.
+    return hash_str(repr((settings.get_python_version(), settings.mypy_args)))
+
+
+def get_version_fingerprint() -> str:
+    return hash_str(f"{metadata.version('refurb')}:{metadata.version('mypy')}")
+
+
+def get_all_dependencies(dependencies: list[str], result: AnalysisResult) -> set[str]:
+    """
+    Get the modules which are depended on, directly or indirectly. Modules which aren't in the
+    graph (ie, missing imports) are skipped.
+    """
+
+    seen: set[str] = set()
+    stack = dependencies.copy()
+
+    while stack:
+        dep = stack.pop()
+
+        if dep in seen or not (state := result.graph.get(dep)):
+            continue
+
+        seen.add(dep)
+        stack.extend(state.dependencies)
+
+    return seen
+
+
+@dataclass
+class ResultCache:
+    """
+    An on-disk cache of the errors emitted for each file. The key for a file is built from the
+    file's contents, the source hashes of everything the file depends on (directly or not, since
+    Mypy doesn't compute interface hashes in fine-grained incremental mode), the enabled checks,
+    the relevant settings, and the Refurb and Mypy versions. If any of these change then the file
+    will be re-checked.
+    """
+
+    path: Path
+    fingerprint: str
+    max_size: int = MAX_CACHE_SIZE_IN_BYTES
+    hits: int = 0
+    misses: int = 0
+
+    @classmethod
+    def create(cls, checks: Checks, settings: Settings, path: Path | None = None) -> "ResultCache":
+        fingerprint = hash_str(
+            ":".join(
+                [
+                    get_check_fingerprint(checks),
+                    get_settings_fingerprint(settings),
+                    get_version_fingerprint(),
+                ]
+            )
+        )
+
+        return cls(path or CACHE_DIR, fingerprint)
+
+    def get_key(self, file: BuildSource, result: AnalysisResult) -> str | None:
+        if not file.path or not (state := result.graph.get(file.module)):
+            return None
+
+        try:
+            contents = Path(file.path).read_bytes()
+
+        except OSError:
+            return None
+
+        dependency_hashes = [
+            f"{dep}:{result.graph[dep].source_hash}"
+            for dep in sorted(get_all_dependencies(state.dependencies, result))
+        ]
+
+        return hash_str(
+            "\n".join(
+                [
+                    self.fingerprint,
+                    file.module,
+                    hashlib.sha256(contents).hexdigest(),
+                    *dependency_hashes,
+                ]
+            )
+        )
+
+    def get_entry_path(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def get(self, key: str, filename: str | None) -> list[Error] | None:
+        entry = self.get_entry_path(key)
+
+        try:
+            data = json.loads(entry.read_text("utf8"))
+
+            errors = [deserialize_error(error, filename) for error in data]
+
+        except (OSError, ValueError, TypeError, AttributeError, ImportError):
+            self.misses += 1
+
+            return None
+
+        # Bump the modification time so that recently used entries are evicted last.
+        entry.touch()
+
+        self.hits += 1
+
+        return errors
+
+    def put(self, key: str, errors: list[Error]) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        gitignore = self.path / ".gitignore"
+
+        if not gitignore.exists():
+            gitignore.write_text("# Automatically created by refurb\n*\n")
+
+        entry = self.get_entry_path(key)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+
+        tmp.write_text(json.dumps([serialize_error(error) for error in errors]), "utf8")
+        tmp.replace(entry)
+
+    def prune(self) -> None:
+        entries = [(entry, entry.stat()) for entry in self.path.glob("*.json")]
+
+        total_size = sum(stat.st_size for _, stat in entries)
+
+        for entry, stat in sorted(entries, key=lambda x: x[1].st_mtime):
+            if total_size <= self.max_size:
+                break
+
+            entry.unlink(missing_ok=True)
+            total_size -= stat.st_size
+
+
+def get_mypy_options_fingerprint(opt: Options) -> str:
+    options = {
+        **opt.select_options_affecting_cache(),
+        "semantic_analysis_only": opt.semantic_analysis_only,
+        "mypy_version": metadata.version("mypy"),
+    }
+
+    return hash_str(json.dumps(options, sort_keys=True, default=str))[:16]
+
+
+def set_mypy_cache_dir(opt: Options) -> None:
+    """
+    Point Mypy at the cache folder for the given options, unless a different cache folder was
+    picked (ie, via `--cache-dir`).
+    """
+
+    if opt.cache_dir == defaults.CACHE_DIR:
+        opt.cache_dir = str(MYPY_CACHE_DIR / get_mypy_options_fingerprint(opt))
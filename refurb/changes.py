@@ -0,0 +1,123 @@
+"""
+Support for only checking the lines which have changed since a given Git ref (or the lines which
+are staged for commit), which is useful for CI and pre-commit hooks where only the errors in the
+changed code are of interest.
+"""
+
+import re
+import subprocess
+from collections import defaultdict
+from pathlib import Path
+
+from mypy.build import BuildSource
+
+from .error import Error
+from .settings import Settings
+
+# Maps a (resolved) file path to the inclusive line ranges that were added or modified
+ChangedLines = dict[Path, list[tuple[int, int]]]
+
+HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+class GitError(Exception):
+    pass
+
+
+def run_git(args: list[str], cwd: Path | None = None) -> str:
+    try:
+        proc = subprocess.run(  # noqa: S603
+            ["git", "-c", "core.quotePath=false", *args],  # noqa: S607
+            capture_output=True,
+            check=False,
+            cwd=cwd,
+            text=True,
+        )
+
+    except OSError as ex:
+        raise GitError(f"refurb: could not run git: {ex.strerror}") from ex
+
+    if proc.returncode:
+        msg = proc.stderr.strip().splitlines()
+
+        raise GitError(f"refurb: git {args[0]} failed: {msg[-1] if msg else proc.returncode}")
+
+    return proc.stdout
+
+
+def parse_diff(diff: str, root: Path) -> ChangedLines:
+    """
+    Parse the output of `git diff --unified=0`. Hunks which only remove lines are skipped since
+    there is nothing left to check.
+    """
+
+    changes: defaultdict[Path, list[tuple[int, int]]] = defaultdict(list)
+    file: Path | None = None
+
+    for line in diff.splitlines():
+        if line.startswith("+++ "):
+            # Git adds a tab after file names which contain spaces
+            name = line[4:].removesuffix("\t")
+
+            file = (root / name.removeprefix("b/")).resolve() if name != "/dev/null" else None
+
+        elif file and (hunk := HUNK_HEADER.match(line)):
+            start = int(hunk.group(1))
+            count = int(hunk.group(2) or 1)
+
+            if count:
+                changes[file].append((start, start + count - 1))
+
+    return dict(changes)
+
+
+def get_changed_lines(settings: Settings) -> ChangedLines:
+    """
+    Get the lines which changed since `settings.changed_since`. If `settings.staged` is set the
+    staged changes are used instead of the working tree, which is what pre-commit hooks expect.
+    """
+
+    root = Path(run_git(["rev-parse", "--show-toplevel"]).strip())
+
+    # The prefixes are set explicitly since `diff.noprefix` and `diff.mnemonicPrefix` change them
+    args = [
+        "diff",
+        "--unified=0",
+        "--no-color",
+        "--no-ext-diff",
+        "--no-renames",
+        "--src-prefix=a/",
+        "--dst-prefix=b/",
+    ]
+
+    if settings.staged:
+        args.append("--cached")
+
+    if settings.changed_since:
+        args.append(settings.changed_since)
+
+    return parse_diff(run_git([*args, "--", "*.py"], cwd=root), root)
+
+
+def filter_changed_files(files: list[BuildSource], changes: ChangedLines) -> list[BuildSource]:
+    """
+    Only keep the files which have changed. Mypy will still analyze any modules which the
+    changed files depend on, but they won't be checked.
+    """
+
+    return [file for file in files if file.path and Path(file.path).resolve() in changes]
+
+
+def is_in_changed_lines(error: Error | str, changes: ChangedLines) -> bool:
+    if isinstance(error, str):
+        return True
+
+    assert error.filename
+
+    start = error.line
+    end = max(error.line_end or start, start)
+
+    return any(
+        start <= hunk_end and hunk_start <= end
+        for hunk_start, hunk_end in changes.get(Path(error.filename).resolve(), [])
+    )
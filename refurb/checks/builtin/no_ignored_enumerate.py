@@ -16,10 +16,10 @@ from mypy.nodes import (
 )
 
 from refurb.checks.common import (
-    ReadCountVisitor,
     check_block_like,
     check_for_loop_like,
     get_mypy_type,
+    get_name_read_count,
     is_name_unused_in_contexts,
     is_subclass,
     stringify,
@@ -75,9 +75,7 @@ def _assigns_name(stmt: Statement, name: NameExpr) -> bool:
 
 def _node_contains_name(node: Node, name: NameExpr) -> bool:
     """Check if a node contains a NameExpr with the same fullname."""
-    visitor = ReadCountVisitor(name)
-    visitor.accept(node)
-    return bool(visitor.was_read)
+    return get_name_read_count(name.fullname, node) > 0
 
 
 def _is_name_read_after_loop(name: NameExpr, remaining_stmts: list[Statement]) -> bool:
@@ -92,18 +90,10 @@ def _is_name_read_after_loop(name: NameExpr, remaining_stmts: list[Statement]) -
             elif isinstance(stmt, ForStmt):
                 rhs = stmt.expr
 
-            if rhs is not None:
-                visitor = ReadCountVisitor(name)
-                visitor.accept(rhs)
-                if visitor.was_read:
-                    return True
-
-            return False
+            return rhs is not None and _node_contains_name(rhs, name)
 
         # Check if name is read in this statement
-        visitor = ReadCountVisitor(name)
-        visitor.accept(stmt)
-        if visitor.was_read:
+        if _node_contains_name(stmt, name):
             return True
 
     return False
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import CallExpr, ComparisonExpr, NameExpr
 
 from refurb.checks.common import is_type_none_call, stringify
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -34,6 +34,8 @@ class ErrorInfo(Error):
     name = "no-is-type-none"
     code = 169
     categories = ("pythonic", "readability")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_comparisons = ("is", "is not", "==", "!=")
 
 
 def check(node: ComparisonExpr, errors: list[Error]) -> None:
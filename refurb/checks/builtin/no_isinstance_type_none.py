@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import CallExpr, Expression, NameExpr, OpExpr, TupleExpr
 
 from refurb.checks.common import is_type_none_call
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -34,6 +34,8 @@ class ErrorInfo(Error):
     name = "no-isinstance-type-none"
     code = 168
     categories = ("pythonic", "readability")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_callees = ("builtins.isinstance",)
 
 
 def get_type_none_index(node: Expression, index: int = 0) -> int:
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import CallExpr, IndexExpr, IntExpr, NameExpr, UnaryExpr
 
 from refurb.checks.common import is_true_literal, stringify
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -34,6 +34,7 @@ class ErrorInfo(Error):
     name = "no-sorted-min-max"
     code = 192
     categories = ("builtin", "performance", "readability")
+    tier = AnalysisTier.SEMANTIC
 
 
 def check(node: IndexExpr, errors: list[Error]) -> None:
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import CallExpr, NameExpr, StrExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -15,6 +15,8 @@ class ErrorInfo(Error):
     code = 105
     msg: str = 'Replace `print("")` with `print()`'
     categories = ("builtin", "readability")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_callees = ("builtins.print",)
 
 
 def check(node: CallExpr, errors: list[Error]) -> None:
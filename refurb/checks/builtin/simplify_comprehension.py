@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import CallExpr, GeneratorExpr, ListComprehension, NameExpr, SetComprehension
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -38,6 +38,8 @@ class ErrorInfo(Error):
     enabled = False
     code = 137
     categories = ("builtin", "iterable", "readability")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_callees = ("builtins.list", "builtins.set", "builtins.frozenset", "builtins.tuple")
 
 
 FUNCTION_MAPPINGS = {
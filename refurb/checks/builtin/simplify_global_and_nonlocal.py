@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import Block, GlobalDecl, NonlocalDecl
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -34,6 +34,7 @@ class ErrorInfo(Error):
     name = "simplify-global-and-nonlocal"
     code = 154
     categories = ("builtin", "readability")
+    tier = AnalysisTier.SYNTAX
 
 
 def emit_error_if_needed(found: list[GlobalDecl | NonlocalDecl], errors: list[Error]) -> None:
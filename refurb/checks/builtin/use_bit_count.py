@@ -11,7 +11,7 @@ from mypy.nodes import (
     StrExpr,
 )
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 from refurb.settings import Settings
 
 
@@ -42,6 +42,8 @@ class ErrorInfo(Error):
     name = "use-bit-count"
     code = 161
     categories = ("builtin", "performance", "python310", "readability")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_methods = ("count",)
 
 
 def check(node: CallExpr, errors: list[Error], settings: Settings) -> None:
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import ArgKind, CallExpr, IndexExpr, IntExpr, RefExpr, SliceExpr
 
 from refurb.checks.common import stringify
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -49,6 +49,8 @@ class ErrorInfo(Error):
     name = "use-int-base-zero"
     code = 166
     categories = ("builtin", "readability")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_callees = ("builtins.int",)
 
 
 def check(node: CallExpr, errors: list[Error]) -> None:
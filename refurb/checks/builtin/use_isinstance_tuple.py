@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import CallExpr, NameExpr, OpExpr
 
 from refurb.checks.common import extract_binary_oper, is_equivalent
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 from refurb.settings import Settings
 
 
@@ -40,6 +40,8 @@ class ErrorInfo(Error):
     name = "use-isinstance-issubclass-tuple"
     code = 121
     categories = ("python310", "readability")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_ops = ("or",)
 
 
 def check(node: OpExpr, errors: list[Error], settings: Settings) -> None:
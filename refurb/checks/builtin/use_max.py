@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import ComparisonExpr, ConditionalExpr
 
 from refurb.checks.common import is_equivalent
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -34,6 +34,7 @@ class ErrorInfo(Error):
     name = "use-min-max"
     code = 136
     categories = ("builtin", "logical", "readability")
+    tier = AnalysisTier.SEMANTIC
 
 
 FUNC_TABLE = {
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import ClassDef, NameExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -42,6 +42,7 @@ class ErrorInfo(Error):
     name = "no-subclass-builtin"
     code = 189
     categories = ("collections",)
+    tier = AnalysisTier.SEMANTIC
 
 
 CLASS_MAPPING = {
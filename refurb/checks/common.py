@@ -1,5 +1,7 @@
+import ast
+from bisect import bisect_left
 from collections.abc import Callable
-from itertools import chain, combinations
+from itertools import chain
 from typing import Any, TypeGuard
 
 from mypy.nodes import (
@@ -14,6 +16,7 @@ from mypy.nodes import (
     ComparisonExpr,
     ComplexExpr,
     ConditionalExpr,
+    Context,
     DelStmt,
     DictExpr,
     DictionaryComprehension,
@@ -51,6 +54,7 @@ from mypy.types import AnyType, CallableType, Instance, TupleType, Type, TypeAli
 from refurb import types
 from refurb.error import Error
 from refurb.visitor import TraverserVisitor
+from refurb.visitor.traverser import visit
 
 
 def extract_binary_oper(oper: str, node: OpExpr) -> tuple[Expression, Expression] | None:
@@ -125,78 +129,105 @@ def unmangle_name(name: str | None) -> str:
 
 
 def is_equivalent(lhs: Node | None, rhs: Node | None) -> bool:
-    match (lhs, rhs):
-        case None, None:
-            return True
+    """
+    Check if two nodes are the same expression, ignoring where they are in the source and how
+    Mypy mangled the names in them (see `get_structural_id()`).
+    """
 
-        case NameExpr() as lhs, NameExpr() as rhs:
-            return unmangle_name(lhs.fullname) == unmangle_name(rhs.fullname)
+    return lhs is rhs or get_structural_id(lhs) == get_structural_id(rhs)
 
-        case MemberExpr() as lhs, MemberExpr() as rhs:
-            return (
-                lhs.name == rhs.name
-                and unmangle_name(lhs.fullname) == unmangle_name(rhs.fullname)
-                and is_equivalent(lhs.expr, rhs.expr)
-            )
 
-        case IndexExpr() as lhs, IndexExpr() as rhs:
-            return is_equivalent(lhs.base, rhs.base) and is_equivalent(lhs.index, rhs.index)
+NONE_STRUCTURAL_ID = -1
 
-        case CallExpr() as lhs, CallExpr() as rhs:
-            return (
-                is_equivalent(lhs.callee, rhs.callee)
-                and all(map(is_equivalent, lhs.args, rhs.args))
-                and lhs.arg_kinds == rhs.arg_kinds
-                and lhs.arg_names == rhs.arg_names
-            )
 
-        case (
-            (ListExpr() as lhs, ListExpr() as rhs)
-            | (TupleExpr() as lhs, TupleExpr() as rhs)
-            | (SetExpr() as lhs, SetExpr() as rhs)
-        ):
-            return len(lhs.items) == len(rhs.items) and all(  # type: ignore
-                map(is_equivalent, lhs.items, rhs.items)  # type: ignore
-            )
+def get_structural_id(node: Node | None) -> int:
+    """
+    Get an ID for the structure of `node`, where equivalent nodes (ie, `x.y[0]` in two different
+    places) get the same ID. Each new structure is given the next free ID, so comparing two nodes
+    is a single integer comparison. The ID of each node is cached until the next file is checked
+    (see `types.STRUCTURAL_ID_CACHE`).
+    """
 
-        case DictExpr() as lhs, DictExpr() as rhs:
-            return len(lhs.items) == len(rhs.items) and all(
-                is_equivalent(lhs_item[0], rhs_item[0]) and is_equivalent(lhs_item[1], rhs_item[1])
-                for lhs_item, rhs_item in zip(lhs.items, rhs.items)
-            )
+    if node is None:
+        return NONE_STRUCTURAL_ID
 
-        case StarExpr() as lhs, StarExpr() as rhs:
-            return is_equivalent(lhs.expr, rhs.expr)
+    if cached := types.STRUCTURAL_ID_CACHE.get(id(node)):
+        return cached[1]
 
-        case UnaryExpr() as lhs, UnaryExpr() as rhs:
-            return lhs.op == rhs.op and is_equivalent(lhs.expr, rhs.expr)
+    key = _get_structural_key(node)
+    structural_id = types.STRUCTURAL_IDS.setdefault(key, len(types.STRUCTURAL_IDS))
 
-        case OpExpr() as lhs, OpExpr() as rhs:
-            return (
-                lhs.op == rhs.op
-                and is_equivalent(lhs.left, rhs.left)
-                and is_equivalent(lhs.right, rhs.right)
-            )
+    types.STRUCTURAL_ID_CACHE[id(node)] = (node, structural_id)
 
-        case ComparisonExpr() as lhs, ComparisonExpr() as rhs:
-            return lhs.operators == rhs.operators and all(
-                map(is_equivalent, lhs.operands, rhs.operands)
-            )
+    return structural_id
+
+
+def _get_structural_key(node: Node) -> tuple[object, ...]:
+    ids = get_structural_id
 
-        case SliceExpr() as lhs, SliceExpr() as rhs:
+    match node:
+        case NameExpr():
+            return ("NameExpr", unmangle_name(node.fullname))
+
+        case MemberExpr():
+            return ("MemberExpr", node.name, unmangle_name(node.fullname), ids(node.expr))
+
+        case IndexExpr():
+            return ("IndexExpr", ids(node.base), ids(node.index))
+
+        case CallExpr():
             return (
-                is_equivalent(lhs.begin_index, rhs.begin_index)
-                and is_equivalent(lhs.end_index, rhs.end_index)
-                and is_equivalent(lhs.stride, rhs.stride)
+                "CallExpr",
+                ids(node.callee),
+                tuple(map(ids, node.args)),
+                tuple(node.arg_kinds),
+                tuple(node.arg_names),
             )
 
-    return str(lhs) == str(rhs)
+        case ListExpr() | TupleExpr() | SetExpr():
+            return (type(node).__name__, tuple(map(ids, node.items)))
+
+        case DictExpr():
+            return ("DictExpr", tuple((ids(key), ids(value)) for key, value in node.items))
+
+        case StarExpr():
+            return ("StarExpr", ids(node.expr))
+
+        case UnaryExpr():
+            return ("UnaryExpr", node.op, ids(node.expr))
+
+        case OpExpr():
+            return ("OpExpr", node.op, ids(node.left), ids(node.right))
+
+        case ComparisonExpr():
+            return ("ComparisonExpr", tuple(node.operators), tuple(map(ids, node.operands)))
+
+        case SliceExpr():
+            return ("SliceExpr", ids(node.begin_index), ids(node.end_index), ids(node.stride))
+
+        case IntExpr() | StrExpr() | BytesExpr() | FloatExpr() | ComplexExpr():
+            return (type(node).__name__, node.value)
+
+    # Mypy includes line numbers when stringifying the remaining nodes, meaning they are only
+    # equivalent when they are written the same way on the same line.
+    return ("str", str(node))
 
 
 def get_common_expr_positions(*exprs: Expression) -> tuple[int, int] | None:
-    for lhs, rhs in combinations(exprs, 2):
-        if is_equivalent(lhs, rhs):
-            return exprs.index(lhs), exprs.index(rhs)
+    """
+    Get the positions of the first 2 equivalent expressions in `exprs`, in the same order that
+    checking every pair of expressions would find them in.
+    """
+
+    positions: dict[int, list[int]] = {}
+
+    for i, expr in enumerate(exprs):
+        positions.setdefault(get_structural_id(expr), []).append(i)
+
+    # Dicts keep their insertion order, so the first expression with a duplicate comes first
+    for found in positions.values():
+        if len(found) > 1:
+            return found[0], found[1]
 
     return None
 
@@ -233,32 +264,72 @@ def get_common_expr_in_comparison_chain(
     return None  # pragma: no cover
 
 
-class ReadCountVisitor(TraverserVisitor):
-    name: NameExpr
-    read_count: int
+def _index_names(root: Context) -> None:
+    """
+    Walk `root` once, recording the position of every name in it (in the order that they would
+    be visited in), as well as the range of positions that each node in it covers.
+    """
+
+    uses: dict[str | None, list[int]] = {}
+    spans = types.NAME_INDEX_CACHE
 
-    def __init__(self, name: NameExpr) -> None:
-        self.name = name
-        self.read_count = 0
+    # Setting `pending` makes the traverser queue the children of a node instead of visiting them
+    children: list[Context] = []
+    traverser = TraverserVisitor()
+    traverser.pending = children
 
-    def visit_name_expr(self, node: NameExpr) -> None:
-        if node.fullname == self.name.fullname:
-            self.read_count += 1
+    # Nodes are pushed a second time (with their starting position) once their children have been
+    # queued, and are popped again once all of their children have been walked.
+    stack: list[tuple[Context, int | None]] = [(root, None)]
+    position = 0
 
-    @property
-    def was_read(self) -> int:
-        return self.read_count > 0
+    while stack:
+        node, start = stack.pop()
 
+        if start is not None:
+            spans[id(node)] = (node, uses, start, position)
+            continue
 
-def is_name_unused_in_contexts(name: NameExpr, contexts: list[Node]) -> bool:
-    for ctx in contexts:
-        visitor = ReadCountVisitor(name)
-        visitor.accept(ctx)
+        if isinstance(node, NameExpr):
+            uses.setdefault(node.fullname, []).append(position)
 
-        if visitor.was_read:
-            return False
+        stack.append((node, position))
+        position += 1
 
-    return True
+        visit(node, traverser)
+
+        stack.extend((child, None) for child in reversed(children))
+        children.clear()
+
+
+def _get_name_index_span(
+    node: Context,
+) -> tuple[Context, dict[str | None, list[int]], int, int]:
+    if not (span := types.NAME_INDEX_CACHE.get(id(node))):
+        _index_names(node)
+
+        span = types.NAME_INDEX_CACHE[id(node)]
+
+    return span
+
+
+def get_name_read_count(fullname: str | None, node: Context) -> int:
+    """
+    Get the number of times a name (by its full name) is used in `node`. Names are indexed the
+    first time a node is looked up (see `types.NAME_INDEX_CACHE`), so a node and everything in it
+    is only walked once, no matter how many names are looked up in it (and by how many checks).
+    """
+
+    _, uses, start, end = _get_name_index_span(node)
+
+    if not (positions := uses.get(fullname)):
+        return 0
+
+    return bisect_left(positions, end) - bisect_left(positions, start)
+
+
+def is_name_unused_in_contexts(name: NameExpr, contexts: list[Node]) -> bool:
+    return not any(get_name_read_count(name.fullname, ctx) for ctx in contexts)
 
 
 def normalize_os_path(module: str | None) -> str:
@@ -270,8 +341,7 @@ def normalize_os_path(module: str | None) -> str:
     """
 
     # Used for compatibility with older versions of Mypy.
-    if not module:
-        return ""
+    module = module or ""
 
     segments = module.split(".")
 
@@ -281,6 +351,17 @@ def normalize_os_path(module: str | None) -> str:
     return module
 
 
+def get_os_path_fullnames(*names: str) -> tuple[str, ...]:
+    """
+    Get every full name that Mypy might give to the passed `os.path` functions (see
+    `normalize_os_path()`), for use as dispatch keys.
+    """
+
+    modules = ("os.path", "genericpath", "ntpath", "posixpath")
+
+    return tuple(f"{module}.{name}" for name in names for module in modules)
+
+
 def is_type_none_call(node: Expression) -> bool:
     match node:
         case CallExpr(
@@ -340,11 +421,71 @@ def get_fstring_parts(expr: Expression) -> list[tuple[bool, Expression, str]]:
 
 
 def stringify(node: Node) -> str:
+    """
+    Get the source code of `node`. When possible this is taken straight from the file being
+    checked, so that it is formatted the same way as the user wrote it, otherwise it is rebuilt
+    from the AST. The result is cached until the next file is checked.
+
+    Nodes which span multiple lines are always rebuilt (see `_get_source_slice()`). Also, only the
+    node itself is taken from the source, so messages which are built around the stringified
+    parts of a node (ie, `f"{name}({stringify(arg)})"`) will not match the source formatting.
+    Pass the whole node to `stringify()` instead when the original code is being shown.
+    """
+
+    if cached := types.STRINGIFY_CACHE.get(id(node)):
+        return cached[1]
+
     try:
-        return _stringify(node)
+        source = _get_source_slice(node) or _stringify(node)
 
     except ValueError:  # pragma: no cover
-        return "x"
+        source = "x"
+
+    types.STRINGIFY_CACHE[id(node)] = (node, source)
+
+    return source
+
+
+def _get_source_slice(node: Node) -> str | None:
+    if not (current_file := types.CURRENT_FILE):
+        return None
+
+    line, column, end_column = node.line, node.column, node.end_column
+
+    # Multi-line nodes are rebuilt from the AST so that messages stay on one line
+    if line < 1 or node.end_line != line or column < 0 or end_column is None:
+        return None
+
+    text = current_file.get_line(line)
+
+    # Mypy uses the column offsets from the `ast` module, which are in UTF-8 bytes
+    data = text if text.isascii() else text.encode()
+
+    # Nodes don't know which file they are from, so the position of a node from another file (or
+    # a node made by a check) might not even be in the file being checked
+    if end_column > len(data):
+        return None
+
+    if isinstance(data, str):
+        snippet = data[column:end_column]
+
+    else:
+        try:
+            snippet = data[column:end_column].decode()
+
+        except UnicodeDecodeError:  # pragma: no cover
+            return None
+
+    # Before Python 3.12 Mypy gives the nodes inside of f-strings the position of the f-string they
+    # are in, meaning the snippet could be cut off in the middle of the f-string. Snippets which
+    # aren't valid code (including parts of nodes, like slices) are rebuilt from the AST instead.
+    try:
+        ast.parse(snippet)
+
+    except SyntaxError:
+        return None
+
+    return snippet
 
 
 def _stringify(node: Node) -> str:
@@ -608,6 +749,22 @@ def _get_builtin_mypy_type(name: str) -> Instance | None:
 
 
 def get_mypy_type(node: Node) -> Type | SymbolNode | None:
+    """
+    Get the Mypy type of `node`. The result is cached until the next file is checked (see
+    `types.MYPY_TYPE_CACHE`).
+    """
+
+    if cached := types.MYPY_TYPE_CACHE.get(id(node)):
+        return cached[1]
+
+    ty = _get_mypy_type(node)
+
+    types.MYPY_TYPE_CACHE[id(node)] = (node, ty)
+
+    return ty
+
+
+def _get_mypy_type(node: Node) -> Type | SymbolNode | None:
     # forward declaration to make Mypy happy
     ty: Type | SymbolNode | None
 
@@ -764,7 +921,17 @@ def is_sized_type(ty: Type | SymbolNode | None) -> bool:
 
 def is_subclass(ty: Any, *expected: TypeLike) -> bool:  # type: ignore[explicit-any]
     if type_info := extract_typeinfo(ty):
-        return any(is_same_type(x, *expected) for x in type_info.mro)
+        # Walking the MRO is slow, and the same classes (ie, `str`) are checked over and over
+        key = (id(type_info), expected)
+
+        if cached := types.SUBCLASS_CACHE.get(key):
+            return cached[1]
+
+        found = any(is_same_type(x, *expected) for x in type_info.mro)
+
+        types.SUBCLASS_CACHE[key] = (type_info, found)
+
+        return found
 
     return False  # pragma: no cover
 
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import Block, NameExpr, PassStmt, TryStmt, TupleExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -37,6 +37,7 @@ class ErrorInfo(Error):
     name = "use-with-suppress"
     code = 107
     categories = ("contextlib", "readability")
+    tier = AnalysisTier.SYNTAX
 
 
 def check(node: TryStmt, errors: list[Error]) -> None:
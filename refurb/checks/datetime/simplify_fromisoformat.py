@@ -44,6 +44,7 @@ class ErrorInfo(Error):
     name = "simplify-fromisoformat"
     code = 162
     categories = ("datetime", "python311", "readability")
+    dispatch_methods = ("fromisoformat",)
 
 
 def is_string(node: Expression) -> bool:
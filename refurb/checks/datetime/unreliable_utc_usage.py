@@ -3,7 +3,7 @@ from typing import Final
 
 from mypy.nodes import CallExpr, MemberExpr, RefExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -37,6 +37,8 @@ class ErrorInfo(Error):
     name = "unreliable-utc-usage"
     code = 176
     categories = ("datetime",)
+    tier = AnalysisTier.SEMANTIC
+    dispatch_methods = ("utcnow", "utcfromtimestamp")
 
 
 _replacements: Final = {
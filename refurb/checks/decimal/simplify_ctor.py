@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import CallExpr, MemberExpr, NameExpr, RefExpr, StrExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -35,6 +35,8 @@ class ErrorInfo(Error):
     name = "simplify-decimal-ctor"
     code = 157
     categories = ("decimal",)
+    tier = AnalysisTier.SEMANTIC
+    dispatch_callees = ("decimal.Decimal", "_decimal.Decimal")
 
 
 FLOAT_LITERALS = ["inf", "-inf", "infinity", "-infinity", "nan"]
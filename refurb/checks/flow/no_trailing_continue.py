@@ -13,7 +13,7 @@ from mypy.nodes import (
 )
 from mypy.patterns import AsPattern
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -63,6 +63,7 @@ class ErrorInfo(Error):
     code = 133
     msg: str = "Continue is redundant here"
     categories = ("control-flow", "readability")
+    tier = AnalysisTier.SYNTAX
 
 
 def get_trailing_continue(node: Statement) -> Generator[Statement, None, None]:
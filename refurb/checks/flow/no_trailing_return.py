@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from mypy.nodes import Block, FuncItem, IfStmt, MatchStmt, ReturnStmt, Statement, WithStmt
 from mypy.patterns import AsPattern
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -50,6 +50,7 @@ class ErrorInfo(Error):
     code = 125
     msg: str = "Return is redundant here"
     categories = ("control-flow", "readability")
+    tier = AnalysisTier.SYNTAX
 
 
 def get_trailing_return(node: Statement) -> Generator[Statement, None, None]:
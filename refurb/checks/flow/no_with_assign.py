@@ -12,7 +12,7 @@ from mypy.nodes import (
 )
 
 from refurb.checks.common import check_block_like
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -44,6 +44,7 @@ class ErrorInfo(Error):
     code = 127
     msg: str = "This variable is redeclared later, and can be removed here"
     categories = ("readability", "scoping")
+    tier = AnalysisTier.SEMANTIC
 
 
 def check(node: Block | MypyFile, errors: list[Error]) -> None:
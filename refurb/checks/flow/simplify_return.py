@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import Block, Expression, FuncItem, IfStmt, MatchStmt, ReturnStmt, Statement
 from mypy.patterns import AsPattern
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -51,6 +51,7 @@ class ErrorInfo(Error):
     name = "simplify-return"
     code = 126
     categories = ("control-flow", "readability")
+    tier = AnalysisTier.SYNTAX
 
 
 def get_trailing_return(node: Statement) -> Statement | None:
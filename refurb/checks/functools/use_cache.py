@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import ArgKind, CallExpr, Decorator, MemberExpr, RefExpr
 
 from refurb.checks.common import is_none_literal
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 from refurb.settings import Settings
 
 
@@ -38,6 +38,7 @@ class ErrorInfo(Error):
     code = 134
     msg: str = "Replace `@lru_cache(maxsize=None)` with `@cache`"
     categories = ("functools", "python39", "readability")
+    tier = AnalysisTier.SEMANTIC
 
 
 def check(node: Decorator, errors: list[Error], settings: Settings) -> None:
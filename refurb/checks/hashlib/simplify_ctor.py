@@ -15,7 +15,7 @@ from mypy.nodes import (
 
 from refurb.checks.common import check_block_like, stringify
 from refurb.checks.hashlib.use_hexdigest import HASHLIB_ALGOS
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -44,6 +44,7 @@ class ErrorInfo(Error):
 
     name = "simplify-hashlib-ctor"
     categories = ("hashlib", "readability")
+    tier = AnalysisTier.SEMANTIC
     code = 182
 
 
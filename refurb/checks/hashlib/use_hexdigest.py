@@ -31,6 +31,7 @@ class ErrorInfo(Error):
     name = "use-hexdigest-hashlib"
     categories = ("hashlib", "readability")
     code = 181
+    dispatch_methods = ("hex",)
 
 
 HASHLIB_ALGOS = {
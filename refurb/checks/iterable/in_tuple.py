@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import ComparisonExpr, ForStmt, GeneratorExpr, ListExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -36,6 +36,8 @@ class ErrorInfo(Error):
     name = "use-consistent-in-bracket"
     code = 109
     categories = ("iterable", "readability")
+    tier = AnalysisTier.SYNTAX
+    dispatch_comparisons = ("in", "not in")
 
 
 def error_msg(oper: str) -> str:
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import ComparisonExpr, ListExpr, SetExpr, TupleExpr
 
 from refurb.checks.common import stringify
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -29,6 +29,8 @@ class ErrorInfo(Error):
     name = "no-single-item-in"
     code = 171
     categories = ("iterable", "readability")
+    tier = AnalysisTier.SYNTAX
+    dispatch_comparisons = ("in", "not in")
 
 
 def check(node: ComparisonExpr, errors: list[Error]) -> None:
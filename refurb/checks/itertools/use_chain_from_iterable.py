@@ -11,7 +11,7 @@ from mypy.nodes import (
 )
 
 from refurb.checks.common import stringify
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -59,7 +59,9 @@ class ErrorInfo(Error):
 
     name = "use-chain-from-iterable"
     categories = ("itertools", "performance", "readability")
+    tier = AnalysisTier.SEMANTIC
     code = 179
+    dispatch_callees = ("builtins.sum", "functools.reduce", "itertools.chain")
 
 
 def is_flatten_generator(node: GeneratorExpr) -> bool:
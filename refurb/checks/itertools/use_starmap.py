@@ -10,7 +10,7 @@ from mypy.nodes import (
     TupleExpr,
 )
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -55,6 +55,7 @@ class ErrorInfo(Error):
     code = 140
     msg: str = "Replace `f(...) for ... in x` with `starmap(f, x)`"
     categories = ("itertools", "performance")
+    tier = AnalysisTier.SYNTAX
 
 
 ignore = set[int]()
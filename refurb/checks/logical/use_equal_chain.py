@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import OpExpr
 
 from refurb.checks.common import get_common_expr_in_comparison_chain
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -42,6 +42,8 @@ class ErrorInfo(Error):
     name = "use-comparison-chain"
     code = 124
     categories = ("logical", "readability")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_ops = ("and",)
 
 
 def create_message(indices: tuple[int, int], oper: str = "==") -> str:
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import ConditionalExpr
 
 from refurb.checks.common import is_equivalent, stringify
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -30,6 +30,7 @@ class ErrorInfo(Error):
     name = "use-or-oper"
     code = 110
     categories = ("logical", "readability")
+    tier = AnalysisTier.SEMANTIC
 
 
 def check(node: ConditionalExpr, errors: list[Error]) -> None:
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import CallExpr, FloatExpr, IntExpr, RefExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -28,6 +28,8 @@ class ErrorInfo(Error):
     name = "simplify-math-log"
     code = 163
     categories = ("math", "readability")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_callees = ("math.log",)
 
 
 def check(node: CallExpr, errors: list[Error]) -> None:
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import FloatExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -31,6 +31,7 @@ class ErrorInfo(Error):
     name = "use-math-constant"
     code = 152
     categories = ("math", "readability")
+    tier = AnalysisTier.SYNTAX
 
 
 CONSTANTS = {
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import CallExpr, RefExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -26,6 +26,8 @@ class ErrorInfo(Error):
     name = "use-pathlib-cwd"
     code = 104
     categories = ("pathlib",)
+    tier = AnalysisTier.SEMANTIC
+    dispatch_callees = ("os.getcwd", "os.getcwdb")
 
 
 def check(node: CallExpr, errors: list[Error]) -> None:
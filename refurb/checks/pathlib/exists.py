@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import CallExpr, RefExpr
 
-from refurb.checks.common import normalize_os_path
+from refurb.checks.common import get_os_path_fullnames, normalize_os_path
 from refurb.checks.pathlib.util import is_pathlike
 from refurb.error import Error
 
@@ -35,6 +35,7 @@ class ErrorInfo(Error):
     name = "use-pathlib-exists"
     code = 141
     categories = ("pathlib",)
+    dispatch_callees = get_os_path_fullnames("exists")
 
 
 def check(node: CallExpr, errors: list[Error]) -> None:
@@ -2,7 +2,12 @@ from dataclasses import dataclass
 
 from mypy.nodes import CallExpr, RefExpr
 
-from refurb.checks.common import get_mypy_type, is_same_type, normalize_os_path
+from refurb.checks.common import (
+    get_mypy_type,
+    get_os_path_fullnames,
+    is_same_type,
+    normalize_os_path,
+)
 from refurb.checks.pathlib.util import is_pathlike
 from refurb.error import Error
 
@@ -31,6 +36,7 @@ class ErrorInfo(Error):
     name = "use-pathlib-is-funcs"
     code = 146
     categories = ("pathlib",)
+    dispatch_callees = get_os_path_fullnames("isabs", "isdir", "isfile", "islink")
 
 
 PATH_TO_PATHLIB_NAMES = {
@@ -47,7 +53,8 @@ def check(node: CallExpr, errors: list[Error]) -> None:
             normalized_name = normalize_os_path(fullname)
             new_name = PATH_TO_PATHLIB_NAMES.get(normalized_name)
 
-            if not new_name:
+            # Only called for the names in `dispatch_callees`
+            if not new_name:  # pragma: no cover
                 return
 
             if is_pathlike(arg):
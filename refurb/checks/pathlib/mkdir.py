@@ -36,6 +36,7 @@ class ErrorInfo(Error):
     name = "use-pathlib-mkdir"
     code = 150
     categories = ("pathlib",)
+    dispatch_callees = ("os.mkdir", "os.makedirs")
 
 
 def create_error(node: CallExpr) -> list[Error]:
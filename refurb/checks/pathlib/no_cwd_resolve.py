@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import CallExpr, MemberExpr, RefExpr, StrExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -27,6 +27,8 @@ class ErrorInfo(Error):
     name = "no-implicit-cwd"
     code = 177
     categories = ("pathlib",)
+    tier = AnalysisTier.SEMANTIC
+    dispatch_methods = ("resolve",)
 
 
 def check(node: CallExpr, errors: list[Error]) -> None:
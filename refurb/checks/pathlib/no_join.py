@@ -2,8 +2,8 @@ from dataclasses import dataclass
 
 from mypy.nodes import BytesExpr, CallExpr, RefExpr, StrExpr
 
-from refurb.checks.common import normalize_os_path
-from refurb.error import Error
+from refurb.checks.common import get_os_path_fullnames, normalize_os_path
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -48,6 +48,8 @@ class ErrorInfo(Error):
     enabled = False
     code = 147
     categories = ("pathlib",)
+    tier = AnalysisTier.SEMANTIC
+    dispatch_callees = get_os_path_fullnames("join")
 
 
 def check(node: CallExpr, errors: list[Error]) -> None:
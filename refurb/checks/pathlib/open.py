@@ -35,6 +35,7 @@ class ErrorInfo(Error):
     name = "use-pathlib-open"
     code = 117
     categories = ("pathlib",)
+    dispatch_callees = ("builtins.open",)
 
 
 def check(node: CallExpr, errors: list[Error]) -> None:
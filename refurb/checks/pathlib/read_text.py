@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import AssignmentStmt, Block, CallExpr, MemberExpr, NameExpr, StrExpr, WithStmt
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -29,6 +29,7 @@ class ErrorInfo(Error):
     name = "use-pathlib-read-text-read-bytes"
     code = 101
     categories = ("pathlib",)
+    tier = AnalysisTier.SYNTAX
 
 
 def check(node: WithStmt, errors: list[Error]) -> None:
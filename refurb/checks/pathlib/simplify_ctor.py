@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import CallExpr, RefExpr, StrExpr
 
 from refurb.checks.common import normalize_os_path, stringify
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -31,6 +31,8 @@ class ErrorInfo(Error):
     name = "simplify-path-constructor"
     code = 153
     categories = ("pathlib", "readability")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_callees = ("pathlib.Path",)
 
 
 def check(node: CallExpr, errors: list[Error]) -> None:
@@ -38,6 +38,7 @@ class ErrorInfo(Error):
     enabled = False
     code = 151
     categories = ("pathlib",)
+    dispatch_methods = ("close",)
 
 
 def check(node: CallExpr, errors: list[Error]) -> None:
@@ -34,6 +34,7 @@ class ErrorInfo(Error):
     name = "use-pathlib-unlink"
     code = 144
     categories = ("pathlib",)
+    dispatch_callees = ("os.remove", "os.unlink")
 
 
 def check(node: CallExpr, errors: list[Error]) -> None:
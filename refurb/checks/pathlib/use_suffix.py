@@ -41,6 +41,7 @@ class ErrorInfo(Error):
     name = "use-suffix"
     code = 172
     categories = ("pathlib",)
+    dispatch_methods = ("endswith",)
 
 
 FILE_EXTENSION = re.compile(r"^\.[a-zA-Z0-9_-]+$")
@@ -31,6 +31,7 @@ class ErrorInfo(Error):
     name = "use-pathlib-with-suffix"
     code = 100
     categories = ("pathlib",)
+    dispatch_ops = ("+",)
 
 
 def check(node: OpExpr, errors: list[Error]) -> None:
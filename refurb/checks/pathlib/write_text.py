@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import Block, CallExpr, ExpressionStmt, MemberExpr, NameExpr, StrExpr, WithStmt
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -28,6 +28,7 @@ class ErrorInfo(Error):
     name = "use-pathlib-write-text-write-bytes"
     code = 103
     categories = ("pathlib",)
+    tier = AnalysisTier.SYNTAX
 
 
 def check(node: WithStmt, errors: list[Error]) -> None:
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import NameExpr
 from mypy.patterns import AsPattern, ClassPattern
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -33,6 +33,7 @@ class ErrorInfo(Error):
     name = "simplify-as-pattern-with-builtin"
     code = 158
     categories = ("pattern-matching", "readability")
+    tier = AnalysisTier.SEMANTIC
 
 
 BUILTIN_PATTERN_CLASSES = (
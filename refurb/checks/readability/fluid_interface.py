@@ -11,9 +11,8 @@ from mypy.nodes import (
     Statement,
 )
 
-from refurb.checks.common import ReadCountVisitor, check_block_like
-from refurb.error import Error
-from refurb.visitor import TraverserVisitor
+from refurb.checks.common import check_block_like, get_name_read_count
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -71,6 +70,7 @@ class ErrorInfo(Error):
     name = "use-fluid-interface"
     code = 184
     categories = ("readability",)
+    tier = AnalysisTier.SEMANTIC
 
 
 def check(node: FuncDef, errors: list[Error]) -> None:
@@ -83,11 +83,7 @@ def check_call(node: Expression, name: str | None = None) -> bool:
         case CallExpr(callee=MemberExpr(expr=NameExpr(name=x), name=_)):
             if name is None or name == x:
                 # Exclude other references
-                x_expr = NameExpr(x)
-                x_expr.fullname = x
-                visitor = ReadCountVisitor(x_expr)
-                visitor.accept(node)
-                return visitor.read_count == 1
+                return get_name_read_count(x, node) == 1
             return False
 
         # Nested
@@ -97,30 +93,17 @@ def check_call(node: Expression, name: str | None = None) -> bool:
     return False
 
 
-class NameReferenceVisitor(TraverserVisitor):
-    name: NameExpr
-    referenced: bool
-
-    def __init__(self, name: NameExpr, stmt: Statement | None = None) -> None:
-        super().__init__()
-        self.name = name
-        self.stmt = stmt
-        self.referenced = False
-
-    def visit_name_expr(self, node: NameExpr) -> None:
-        if not self.referenced and node.fullname == self.name.fullname:
-            self.referenced = True
-
-
 def check_stmts(stmts: list[Statement], errors: list[Error]) -> None:
     last = ""
-    visitors: list[NameReferenceVisitor] = []
+
+    # Assignments which should be chained, unless the variable they assign is referenced later on
+    unreferenced: list[tuple[str, Statement]] = []
 
     for stmt in stmts:
-        for visitor in visitors:
-            visitor.accept(stmt)
         # No need to track referenced variables anymore
-        visitors = [visitor for visitor in visitors if not visitor.referenced]
+        unreferenced = [
+            (name, assign) for name, assign in unreferenced if not get_name_read_count(name, stmt)
+        ]
 
         match stmt:
             case AssignmentStmt(lvalues=[NameExpr(name=name)], rvalue=rvalue):
@@ -134,9 +117,7 @@ def check_stmts(stmts: list[Statement], errors: list[Error]) -> None:
                         )
                     else:
                         # We need to ensure that the variable is not referenced somewhere else
-                        name_expr = NameExpr(name=last)
-                        name_expr.fullname = last
-                        visitors.append(NameReferenceVisitor(name_expr, stmt))
+                        unreferenced.append((last, stmt))
 
                 last = name if name != "_" and isinstance(rvalue, CallExpr) else ""
             case ReturnStmt(expr=rvalue):
@@ -153,11 +134,7 @@ def check_stmts(stmts: list[Statement], errors: list[Error]) -> None:
     # Ensure that variables are not referenced
     errors.extend(
         [
-            ErrorInfo.from_node(
-                visitor.stmt,
-                "Assignment statement should be chained",
-            )
-            for visitor in visitors
-            if not visitor.referenced and visitor.stmt is not None
+            ErrorInfo.from_node(assign, "Assignment statement should be chained")
+            for _, assign in unreferenced
         ]
     )
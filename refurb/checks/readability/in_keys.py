@@ -34,6 +34,7 @@ class ErrorInfo(Error):
     name = "no-in-dict-keys"
     code = 130
     categories = ("dict", "readability")
+    dispatch_comparisons = ("in", "not in")
 
 
 def check(node: ComparisonExpr, errors: list[Error]) -> None:
@@ -32,6 +32,7 @@ class ErrorInfo(Error):
     name = "no-copy-with-merge"
     categories = ("readability",)
     code = 185
+    dispatch_ops = ("|",)
 
 
 ignored_nodes = set[int]()
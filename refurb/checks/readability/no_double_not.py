@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import UnaryExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -29,6 +29,7 @@ class ErrorInfo(Error):
     code = 114
     msg: str = "Replace `not not x` with `bool(x)`"
     categories = ("builtin", "readability", "truthy")
+    tier = AnalysisTier.SYNTAX
 
 
 def check(node: UnaryExpr, errors: list[Error]) -> None:
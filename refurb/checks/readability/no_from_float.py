@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import CallExpr, MemberExpr, RefExpr
 
 from refurb.checks.common import stringify
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -31,6 +31,8 @@ class ErrorInfo(Error):
     name = "no-from-float"
     code = 164
     categories = ("decimal", "fractions", "readability")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_methods = ("from_float", "from_decimal")
 
 
 KNOWN_FUNCS = {
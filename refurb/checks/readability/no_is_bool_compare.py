@@ -34,6 +34,7 @@ class ErrorInfo(Error):
     name = "no-bool-literal-compare"
     code = 149
     categories = ("logical", "readability", "truthy")
+    dispatch_comparisons = ("is", "is not", "==", "!=")
 
 
 def is_bool_variable(expr: Expression) -> bool:
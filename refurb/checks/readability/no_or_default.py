@@ -51,6 +51,7 @@ class ErrorInfo(Error):
     name = "no-default-or"
     code = 143
     categories = ("logical", "readability")
+    dispatch_ops = ("or",)
 
 
 def check(node: OpExpr, errors: list[Error]) -> None:
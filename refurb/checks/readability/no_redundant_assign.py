@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import AssignmentStmt, NameExpr
 
 from refurb.checks.common import unmangle_name
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -30,6 +30,7 @@ class ErrorInfo(Error):
     code = 160
     name = "no-redundant-assignment"
     categories = ("readability",)
+    tier = AnalysisTier.SEMANTIC
     msg: str = "Remove redundant assignment of variable to itself"
 
 
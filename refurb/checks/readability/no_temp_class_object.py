@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import CallExpr, Decorator, FuncDef, MemberExpr, NameExpr, TypeInfo
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -27,6 +27,7 @@ class ErrorInfo(Error):
     name = "no-temp-class-object"
     code = 165
     categories = ("readability",)
+    tier = AnalysisTier.SEMANTIC
 
 
 def check(node: CallExpr, errors: list[Error]) -> None:
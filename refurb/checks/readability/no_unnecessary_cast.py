@@ -43,6 +43,18 @@ class ErrorInfo(Error):
     name = "no-redundant-cast"
     code = 123
     categories = ("readability",)
+    dispatch_callees = (
+        "builtins.bool",
+        "builtins.bytes",
+        "builtins.complex",
+        "builtins.dict",
+        "builtins.float",
+        "builtins.int",
+        "builtins.list",
+        "builtins.set",
+        "builtins.str",
+        "builtins.tuple",
+    )
 
 
 FUNC_NAME_MAPPING = {
@@ -62,7 +74,7 @@ FUNC_NAME_MAPPING = {
 def check(node: CallExpr, errors: list[Error]) -> None:
     match node:
         case CallExpr(
-            callee=NameExpr(fullname=fullname, name=name),
+            callee=NameExpr(fullname=fullname),
             args=[arg],
             arg_kinds=[ArgKind.ARG_POS],
         ) if found := FUNC_NAME_MAPPING.get(fullname):
@@ -73,6 +85,6 @@ def check(node: CallExpr, errors: list[Error]) -> None:
 
             expr = stringify(arg)
 
-            msg = f"Replace `{name}({stringify(arg)})` with `{expr}{suffix}`"
+            msg = f"Replace `{stringify(node)}` with `{expr}{suffix}`"
 
             errors.append(ErrorInfo.from_node(node, msg))
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import ClassDef, NameExpr, RefExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -29,6 +29,7 @@ class ErrorInfo(Error):
     name = "use-abc-shorthand"
     code = 180
     categories = ("abc", "readability")
+    tier = AnalysisTier.SEMANTIC
 
 
 def check(node: ClassDef, errors: list[Error]) -> None:
@@ -15,8 +15,8 @@ from mypy.nodes import (
     Statement,
 )
 
-from refurb.checks.common import ReadCountVisitor, check_block_like
-from refurb.error import Error
+from refurb.checks.common import check_block_like, get_name_read_count
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -48,6 +48,7 @@ class ErrorInfo(Error):
     code = 138
     msg: str = "Consider using list comprehension"
     categories = ("performance", "readability")
+    tier = AnalysisTier.SEMANTIC
 
 
 def check(node: Block | MypyFile, errors: list[Error]) -> None:
@@ -90,19 +91,13 @@ def check_stmts(stmts: list[Statement], errors: list[Error]) -> None:
                     and name.fullname == assign.fullname
                     and not isinstance(if_expr, AssignmentExpr)
                 ):
-                    name_visitor = ReadCountVisitor(name)
-                    name_visitor.accept(stmt)
-
-                    if name_visitor.read_count == 1:
+                    if get_name_read_count(name.fullname, stmt) == 1:
                         errors.append(ErrorInfo.from_node(assign))
 
                 case ForStmt(body=Block(body=[stmt])) if (
                     name := get_append_func_callee_name(stmt)
                 ) and name.fullname == assign.fullname:
-                    name_visitor = ReadCountVisitor(name)
-                    name_visitor.accept(stmt)
-
-                    if name_visitor.read_count == 1:
+                    if get_name_read_count(name.fullname, stmt) == 1:
                         errors.append(ErrorInfo.from_node(assign))
 
             assign = None
@@ -21,7 +21,7 @@ from mypy.nodes import (
 )
 
 from refurb.checks.common import stringify
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 from refurb.visitor.traverser import TraverserVisitor
 
 
@@ -67,6 +67,7 @@ class ErrorInfo(Error):
     name = "use-func-name"
     code = 111
     categories = ("performance", "readability")
+    tier = AnalysisTier.SEMANTIC
 
 
 def get_lambda_arg_names(args: list[Argument]) -> list[str]:
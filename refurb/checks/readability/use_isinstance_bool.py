@@ -9,7 +9,7 @@ from refurb.checks.common import (
     is_true_literal,
     stringify,
 )
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -36,6 +36,9 @@ class ErrorInfo(Error):
     name = "use-isinstance-bool"
     code = 191
     categories = ("readability",)
+    tier = AnalysisTier.SEMANTIC
+    dispatch_ops = ("or",)
+    dispatch_comparisons = ("in", "not in")
 
 
 def check(node: ComparisonExpr | OpExpr, errors: list[Error]) -> None:
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import CallExpr, NameExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -29,6 +29,18 @@ class ErrorInfo(Error):
     name = "use-literal"
     code = 112
     categories = ("pythonic", "readability")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_callees = (
+        "builtins.bool",
+        "builtins.bytes",
+        "builtins.complex",
+        "builtins.dict",
+        "builtins.float",
+        "builtins.int",
+        "builtins.list",
+        "builtins.str",
+        "builtins.tuple",
+    )
 
 
 FUNC_NAMES = {
@@ -4,7 +4,7 @@ from mypy.nodes import CallExpr, ListExpr, MemberExpr, NameExpr, StrExpr
 
 from refurb.checks.common import stringify
 from refurb.checks.string.use_fstring_fmt import CONVERSIONS as FURB_119_FUNCS
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 from refurb.visitor import TraverserVisitor
 
 
@@ -32,6 +32,8 @@ class ErrorInfo(Error):
     name = "use-str-func"
     code = 183
     categories = ("readability",)
+    tier = AnalysisTier.SEMANTIC
+    dispatch_methods = ("join", "format")
 
 
 ignore = set[int]()
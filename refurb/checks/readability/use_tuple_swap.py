@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import AssignmentStmt, Block, MypyFile, NameExpr, Statement
 
 from refurb.checks.common import check_block_like
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -31,6 +31,7 @@ class ErrorInfo(Error):
     code = 128
     msg: str = "Use tuple unpacking instead of temporary variables to swap values"  # noqa: E501
     categories = ("readability",)
+    tier = AnalysisTier.SYNTAX
 
 
 def check(node: Block | MypyFile, errors: list[Error]) -> None:
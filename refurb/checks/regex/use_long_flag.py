@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import MemberExpr, NameExpr, RefExpr
 
 from refurb.checks.common import stringify
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -32,6 +32,7 @@ class ErrorInfo(Error):
     name = "use-long-regex-flag"
     code = 167
     categories = ("readability", "regex")
+    tier = AnalysisTier.SEMANTIC
 
 
 SHORT_TO_LONG_FLAG = {
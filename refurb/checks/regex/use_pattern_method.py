@@ -37,6 +37,16 @@ class ErrorInfo(Error):
     name = "use-regex-pattern-methods"
     code = 170
     categories = ("performance", "readability", "regex")
+    dispatch_callees = (
+        "re.search",
+        "re.match",
+        "re.fullmatch",
+        "re.split",
+        "re.findall",
+        "re.finditer",
+        "re.sub",
+        "re.subn",
+    )
 
 
 # This table represents the function calls that we will emit errors for. The
@@ -71,7 +81,8 @@ def check(node: CallExpr, errors: list[Error]) -> None:
         ):
             arg_format = REGEX_FUNC_ARGS.get(fullname)
 
-            if not arg_format:
+            # Only called for the names in `dispatch_callees`
+            if not arg_format:  # pragma: no cover
                 return
 
             if not is_same_type(get_mypy_type(pattern), "re.Pattern"):
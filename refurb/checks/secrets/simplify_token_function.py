@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import CallExpr, IndexExpr, IntExpr, MemberExpr, NameExpr, RefExpr, SliceExpr
 
 from refurb.checks.common import is_none_literal, stringify
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -30,6 +30,8 @@ class ErrorInfo(Error):
     name = "simplify-token-function"
     code = 174
     categories = ("readability", "secrets")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_methods = ("hex",)
 
 
 def check(node: CallExpr | IndexExpr, errors: list[Error]) -> None:
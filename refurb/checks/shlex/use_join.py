@@ -12,7 +12,7 @@ from mypy.nodes import (
     StrExpr,
 )
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -41,6 +41,8 @@ class ErrorInfo(Error):
     name = "use-shlex-join"
     code = 178
     categories = ("readability", "shlex")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_methods = ("join",)
 
 
 def handle_join_arg(root: Node, arg: Expression) -> list[Error]:
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import ComparisonExpr, StrExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -43,6 +43,8 @@ class ErrorInfo(Error):
     name = "use-string-charsets"
     code = 156
     categories = ("readability", "string")
+    tier = AnalysisTier.SYNTAX
+    dispatch_comparisons = ("in",)
 
 
 _CHARSETS = [
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import BytesExpr, CallExpr, IntExpr, MemberExpr, NameExpr, OpExpr, StrExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -32,6 +32,8 @@ class ErrorInfo(Error):
     enabled = False
     code = 106
     categories = ("string",)
+    tier = AnalysisTier.SYNTAX
+    dispatch_methods = ("replace",)
 
 
 def check_str(node: CallExpr, errors: list[Error]) -> None:
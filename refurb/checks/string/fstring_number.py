@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import CallExpr, IndexExpr, IntExpr, NameExpr, SliceExpr
 
 from refurb.checks.common import stringify
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -31,6 +31,7 @@ class ErrorInfo(Error):
     name = "use-fstring-number-format"
     code = 116
     categories = ("builtin", "fstring")
+    tier = AnalysisTier.SEMANTIC
 
 
 FUNC_CONVERSIONS = {
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import CallExpr, MemberExpr, StrExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -40,6 +40,8 @@ class ErrorInfo(Error):
     name = "no-multiline-strip"
     code = 139
     categories = ("readability",)
+    tier = AnalysisTier.SYNTAX
+    dispatch_methods = ("lstrip", "rstrip", "strip")
 
 
 def check(node: CallExpr, errors: list[Error]) -> None:
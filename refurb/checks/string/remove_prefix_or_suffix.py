@@ -16,7 +16,7 @@ from mypy.nodes import (
 )
 
 from refurb.checks.common import is_equivalent, stringify
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 from refurb.settings import Settings
 from refurb.visitor.traverser import TraverserVisitor
 
@@ -44,6 +44,7 @@ class ErrorInfo(Error):
 
     name = "remove-prefix-or-suffix"
     categories = ("performance", "readability", "string")
+    tier = AnalysisTier.SEMANTIC
     code = 188
 
 
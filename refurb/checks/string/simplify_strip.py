@@ -36,6 +36,7 @@ class ErrorInfo(Error):
     name = "simplify-strip"
     code = 159
     categories = ("readability", "string")
+    dispatch_methods = ("lstrip", "rstrip", "strip")
 
 
 STRIP_FUNCS = ("lstrip", "rstrip", "strip")
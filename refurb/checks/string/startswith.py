@@ -33,6 +33,7 @@ class ErrorInfo(Error):
     name = "use-startswith-endswith-tuple"
     code = 102
     categories = ("string",)
+    dispatch_ops = ("or", "and")
 
 
 def are_startswith_or_endswith_calls(
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from mypy.nodes import CallExpr, MemberExpr, NameExpr, StrExpr
 
 from refurb.checks.common import stringify
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -36,6 +36,8 @@ class ErrorInfo(Error):
     name = "use-fstring-format"
     code = 119
     categories = ("builtin", "fstring")
+    tier = AnalysisTier.SEMANTIC
+    dispatch_methods = ("format",)
 
 
 CONVERSIONS = {
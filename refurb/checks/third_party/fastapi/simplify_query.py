@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from mypy.nodes import CallExpr, EllipsisExpr, FuncDef, NameExpr
 
-from refurb.error import Error
+from refurb.error import AnalysisTier, Error
 
 
 @dataclass
@@ -31,6 +31,7 @@ class ErrorInfo(Error):
     name = "simplify-fastapi-query"
     code = 175
     categories = ("fastapi", "readability")
+    tier = AnalysisTier.SEMANTIC
 
 
 def check(node: FuncDef, errors: list[Error]) -> None:
@@ -0,0 +1,175 @@
+"""
+Client side of the Refurb daemon. This module is kept light on imports (no Mypy) so that
+`refurb daemon check` doesn't have to pay the cost of importing Mypy on every call.
+"""
+
+import json
+import socket
+import sys
+import time
+from pathlib import Path
+from subprocess import DEVNULL, Popen  # noqa: S404
+
+from .settings import load_settings
+
+SOCKET_PATH = Path(".refurb_daemon.sock")
+
+# How long `refurb daemon start` will wait for the server to start listening.
+STARTUP_TIMEOUT_IN_SECONDS = 10
+
+Request = dict[str, str | bool | list[str]]
+Response = dict[str, str | int]
+
+INVALID_RESPONSE: Response = {
+    "output": "refurb: invalid response from daemon, try restarting it with `refurb daemon stop`",
+    "status": 1,
+}
+
+
+def usage() -> None:
+    print(
+        """\
+usage: refurb daemon start [ARGS...]
+       refurb daemon check [ARGS...]
+       refurb daemon stop
+
+Run Refurb as a background server which keeps the Mypy build in memory. Only files
+which have changed since the last check are re-analyzed. ARGS are the same arguments
+that are normally passed to Refurb. The arguments passed to "start" are used to warm
+up the server.\
+"""
+    )
+
+
+def receive(conn: socket.socket) -> str:
+    chunks: list[bytes] = []
+
+    while chunk := conn.recv(65536):
+        chunks.append(chunk)
+
+    return b"".join(chunks).decode()
+
+
+def send(conn: socket.socket, data: str) -> None:
+    conn.sendall(data.encode())
+    conn.shutdown(socket.SHUT_WR)
+
+
+def send_request(request: Request, socket_path: Path) -> Response | None:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(str(socket_path))
+
+            send(conn, json.dumps(request))
+
+            data = receive(conn)
+
+    except OSError:
+        return None
+
+    try:
+        response = json.loads(data)
+
+    except ValueError:
+        return INVALID_RESPONSE
+
+    match response:
+        case {"output": str(), "status": int()}:
+            return response  # type: ignore[no-any-return]
+
+    return INVALID_RESPONSE
+
+
+def is_daemon_running(socket_path: Path) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(str(socket_path))
+
+    except OSError:
+        return False
+
+    return True
+
+
+def start_daemon(args: list[str], socket_path: Path) -> int:
+    if is_daemon_running(socket_path):
+        print("refurb: daemon is already running")
+        return 1
+
+    # Remove any socket left behind by a daemon that was killed
+    socket_path.unlink(missing_ok=True)
+
+    Popen(  # noqa: S603
+        [sys.executable, "-m", "refurb", "daemon", "serve", *args],
+        stdin=DEVNULL,
+        stdout=DEVNULL,
+        stderr=DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT_IN_SECONDS
+
+    while not socket_path.exists():
+        if time.monotonic() > deadline:
+            print("refurb: daemon failed to start")
+            return 1
+
+        time.sleep(0.05)
+
+    return 0
+
+
+def daemon_main(args: list[str], socket_path: Path = SOCKET_PATH) -> int:
+    if not hasattr(socket, "AF_UNIX"):  # pragma: no cover
+        print("refurb: the daemon is not supported on this platform")
+        return 1
+
+    match args:
+        case ["start", *rest]:
+            return start_daemon(rest, socket_path)
+
+        case ["serve", *rest]:
+            # Imported here since the server pulls in Mypy, which the client doesn't need.
+            from .server import DaemonServer  # noqa: PLC0415
+
+            DaemonServer().serve(socket_path, rest)
+
+            return 0
+
+        case ["check", *rest]:
+            try:
+                # Color support depends on the client's terminal, not the daemon's.
+                color = load_settings(rest).color
+
+            except ValueError as e:
+                print(e)
+                return 1
+
+            request: Request = {"command": "check", "args": rest, "color": color}
+
+            response = send_request(request, socket_path)
+
+            if response is None:
+                print("refurb: daemon is not running, use `refurb daemon start` to start it")
+                return 1
+
+            if output := response["output"]:
+                print(output)
+
+            return int(response["status"])
+
+        case ["stop"]:
+            if send_request({"command": "stop"}, socket_path) is None:
+                print("refurb: daemon is not running")
+                return 1
+
+            return 0
+
+        case ["--help" | "-h"]:
+            usage()
+
+            return 0
+
+    usage()
+
+    return 1
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
@@ -39,12 +40,45 @@ class ErrorCategory:
 ErrorClassifier = ErrorCategory | ErrorCode
 
 
+class AnalysisTier(IntEnum):
+    """
+    How much of the Mypy pipeline needs to be ran in order for a check to work. Refurb only runs
+    as much of the pipeline as is needed by the enabled checks, so checks should use the lowest
+    tier possible.
+    """
+
+    # Only the syntax tree is needed (ie, node types, names, and literal values).
+    SYNTAX = 1
+
+    # Names must be resolved (ie, `NameExpr.fullname` or `RefExpr.node`).
+    SEMANTIC = 2
+
+    # Types must be inferred (ie, `get_mypy_type()` or `OpExpr.method_type`).
+    TYPES = 3
+
+
 @dataclass
 class Error:
     enabled: ClassVar[bool] = True
     name: ClassVar[str | None] = None
     prefix: ClassVar[str] = "FURB"
     categories: ClassVar[tuple[str, ...]] = ()
+    tier: ClassVar[AnalysisTier] = AnalysisTier.TYPES
+
+    # Dispatch keys, which tell the visitor which nodes a check could possibly match, so that the
+    # check isn't called for every node of that type (see `refurb/visitor/dispatch.py`). A check
+    # which doesn't set any keys for a node type is called for every node of that type.
+    #
+    # * `dispatch_callees`: Calls to one of these functions (ie, `builtins.len`). This needs the
+    #   names to be resolved, so it can't be used with `AnalysisTier.SYNTAX`.
+    # * `dispatch_methods`: Calls to a method (or attribute) with one of these names (ie, `join`).
+    # * `dispatch_ops`: Binary operators with one of these operators (ie, `+` or `or`).
+    # * `dispatch_comparisons`: Comparisons which use any of these operators (ie, `in`).
+    dispatch_callees: ClassVar[tuple[str, ...] | None] = None
+    dispatch_methods: ClassVar[tuple[str, ...] | None] = None
+    dispatch_ops: ClassVar[tuple[str, ...] | None] = None
+    dispatch_comparisons: ClassVar[tuple[str, ...] | None] = None
+
     code: ClassVar[int]
     line: int
     column: int
@@ -1,16 +1,36 @@
+import importlib
+from collections.abc import Generator
 from pathlib import Path
 from textwrap import dedent
+from types import ModuleType
 
 from refurb.loader import get_error_class, get_modules
 from refurb.settings import Settings
 
 from .error import ErrorCode
+from .manifest import read_manifest
+
+
+def get_modules_to_search(settings: Settings) -> Generator[ModuleType, None, None]:
+    manifest = read_manifest()
+
+    if manifest is None:
+        yield from get_modules(settings.load)
+
+        return
+
+    # Only import the built-in check that matches, if any
+    for entry in manifest:
+        if ErrorCode(entry.code, entry.prefix) == settings.explain:
+            yield importlib.import_module(entry.module)
+
+    yield from get_modules(settings.load, include_builtin_checks=False)
 
 
 def explain(settings: Settings) -> str:
     lookup = settings.explain
 
-    for module in get_modules(settings.load):
+    for module in get_modules_to_search(settings):
         error = get_error_class(module)
 
         if error and ErrorCode.from_error(error) == lookup:
@@ -3,6 +3,7 @@ import pkgutil
 import sys
 from collections import defaultdict
 from collections.abc import Generator
+from functools import partial
 from importlib.metadata import entry_points
 from inspect import getsourcefile, getsourcelines, signature
 from pathlib import Path
@@ -14,20 +15,25 @@ from mypy.nodes import Node
 from refurb.visitor.mapping import METHOD_NODE_MAPPINGS
 
 from . import checks as checks_module
-from .error import Error, ErrorCategory, ErrorCode
+from .error import AnalysisTier, Error, ErrorCategory, ErrorCode
+from .manifest import ManifestEntry, read_manifest
 from .settings import Settings
-from .types import Check
+from .types import Check, Checks, NormalizedCheck
 
 
-def get_modules(paths: list[str]) -> Generator[ModuleType, None, None]:
+def get_modules(
+    paths: list[str], *, include_builtin_checks: bool = True
+) -> Generator[ModuleType, None, None]:
     sys.path.append(str(Path.cwd()))
 
     plugins = [x.value for x in entry_points(group="refurb.plugins")]
     extra_modules = (importlib.import_module(x) for x in paths + plugins)
 
+    builtin_modules = [checks_module] if include_builtin_checks else []
+
     loaded: set[ModuleType] = set()
 
-    for pkg in (checks_module, *extra_modules):
+    for pkg in (*builtin_modules, *extra_modules):
         if pkg in loaded:
             continue
 
@@ -74,8 +80,8 @@ def get_error_class(module: ModuleType) -> type[Error] | None:
     return None
 
 
-def should_load_check(settings: Settings, error: type[Error]) -> bool:
-    error_code = ErrorCode.from_error(error)
+def should_load_check(settings: Settings, error: type[Error] | ManifestEntry) -> bool:
+    error_code = ErrorCode(error.code, error.prefix)
 
     if error_code in settings.enable:
         return True
@@ -88,7 +94,7 @@ def should_load_check(settings: Settings, error: type[Error]) -> bool:
     if settings.enable & categories:
         return True
 
-    if settings.disable & categories or settings.disable_all:
+    if (settings.disable | settings.ignore) & categories or settings.disable_all:
         return False
 
     return error.enabled or settings.enable_all
@@ -158,17 +164,124 @@ def extract_function_types(  # type: ignore
             )
 
 
-def load_checks(settings: Settings) -> defaultdict[type[Node], list[Check]]:
-    found: defaultdict[type[Node], list[Check]] = defaultdict(list)
+def takes_settings(check: Check) -> bool:
+    return "settings" in signature(check).parameters
+
+
+def normalize_check(
+    check: Check, settings: Settings, *, with_settings: bool | None = None
+) -> NormalizedCheck:
+    """
+    Bind any optional services (ie, `settings`) ahead of time so that every check can be called
+    with just the node and error list, meaning no inspection is needed when the check is ran.
+    Pass `with_settings` if it is already known whether the check takes a `settings` parameter.
+    """
+
+    if with_settings is None:
+        with_settings = takes_settings(check)
+
+    if with_settings:
+        return partial(check, settings=settings)  # type: ignore[call-arg]
+
+    return check  # type: ignore[return-value]
+
+
+def load_checks_from_manifest(
+    manifest: list[ManifestEntry], settings: Settings, found: Checks
+) -> set[str]:
+    """
+    Import only the built-in checks which are enabled. The node types and parameters of the
+    checks are read from the manifest, so they don't need to be inspected either.
+    """
+
+    enabled_errors: set[str] = set()
+
+    for entry in manifest:
+        if should_load_check(settings, entry):
+            if entry.node_types:
+                func = importlib.import_module(entry.module).check
+
+                check = normalize_check(func, settings, with_settings=entry.takes_settings)
+
+                for ty in entry.node_types:
+                    found[ty].append(check)
+
+            enabled_errors.add(f"{entry.prefix}{entry.code}")
+
+    return enabled_errors
+
+
+def get_check_error_class(check: NormalizedCheck) -> type[Error] | None:
+    """
+    Get the error class of the module the given check lives in, if any.
+    """
+
+    func = check.func if isinstance(check, partial) else check
+
+    module = sys.modules.get(func.__module__)
+
+    return get_error_class(module) if module else None
+
+
+def get_error_classes(checks: Checks) -> Generator[type[Error] | None, None, None]:
+    """
+    Get the error class for each of the given checks, or `None` if the check doesn't live in a
+    module with an error class.
+    """
+
+    for funcs in checks.values():
+        for check in funcs:
+            yield get_check_error_class(check)
+
+
+def get_check_name(check: NormalizedCheck) -> str:
+    """
+    Get the error code of a check (ie, `FURB123`), or the module name if the check doesn't live
+    in a module with an error class.
+    """
+
+    if error := get_check_error_class(check):
+        return f"{error.prefix}{error.code}"
+
+    func = check.func if isinstance(check, partial) else check
+
+    return func.__module__
+
+
+def get_analysis_tier(checks: Checks) -> AnalysisTier:
+    """
+    Get the lowest tier of analysis that is needed to run all of the given checks. Checks that
+    don't live in a module with an error class are assumed to need full type information.
+    """
+
+    return max(
+        (error.tier if error else AnalysisTier.TYPES for error in get_error_classes(checks)),
+        default=AnalysisTier.SYNTAX,
+    )
+
+
+def load_checks(settings: Settings) -> Checks:
+    found: Checks = defaultdict(list)
     enabled_errors: set[str] = set()
 
-    for module in get_modules(settings.load):
+    manifest = read_manifest()
+
+    if manifest is not None:
+        enabled_errors |= load_checks_from_manifest(manifest, settings, found)
+
+    builtin_modules = {entry.module for entry in manifest or []}
+
+    for module in get_modules(settings.load, include_builtin_checks=manifest is None):
+        # Built-in checks might also be passed via `--load`, but are already handled above
+        if module.__name__ in builtin_modules:
+            continue
+
         error = get_error_class(module)
 
         if error and should_load_check(settings, error):
             if func := getattr(module, "check", None):
                 for ty in extract_function_types(func):
-                    found[ty].append(func)
+                    found[ty].append(normalize_check(func, settings))
 
             enabled_errors.add(str(ErrorCode.from_error(error)))
 
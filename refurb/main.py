@@ -1,26 +1,58 @@
+import heapq
 import json
+import os
 import re
+import sys
 import time
-from collections.abc import Callable, Sequence
-from contextlib import suppress
-from functools import cache, partial
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import partial
 from importlib import metadata
 from io import StringIO
+from itertools import chain
+from multiprocessing import get_all_start_methods, get_context
 from operator import itemgetter
 from pathlib import Path
 from tempfile import mkstemp
 
-from mypy.build import build
+from mypy.build import BuildResult, BuildSource, build
 from mypy.errors import CompileError
 from mypy.main import process_options
+from mypy.options import Options
 
 from . import types
-from .error import Error, ErrorCode
+from .analysis import AnalysisResult, parse_files
+from .cache import ResultCache, set_mypy_cache_dir
+from .changes import (
+    ChangedLines,
+    GitError,
+    filter_changed_files,
+    get_changed_lines,
+    is_in_changed_lines,
+)
+from .daemon import daemon_main
+from .error import AnalysisTier, Error
 from .explain import explain
 from .gen import main as generate
-from .loader import load_checks
+from .loader import (
+    get_analysis_tier,
+    get_check_name,
+    get_error_classes,
+    load_checks,
+    should_load_check,
+)
+from .memory import MemoryLimitError, MemoryTracker, free_unused_memory, memory_phase
+from .profiler import Profiler
+from .sarif import SarifWriter
 from .settings import Settings, load_settings
-from .visitor import RefurbVisitor
+from .shard import get_shard_files, read_shard_results, record_shard_results
+from .source import SourceStore
+from .suppressions import Suppressions
+from .timing import TimingStats, VisitorStats
+from .trace import Tracer, trace_span
+from .types import Checks
+from .visitor import RefurbVisitor, build_visitor_class
 
 
 def usage() -> None:
@@ -30,11 +62,18 @@ usage: refurb [--ignore err] [--load path] [--debug] [--quiet] [--enable err]
               [--disable err] [--enable-all] [--disable-all]
               [--config-file path] [--python-version version] [--verbose | -v]
               [--format format] [--sort sort] [--timing-stats file]
+              [--trace-file file] [--trace-checks]
+              [--profile folder] [--profile-files glob]
+              [--max-memory size] [--trace-memory] [--low-memory]
+              [--jobs n] [--cache] [--changed-since ref] [--staged]
+              [--report-unused-noqa] [--shard i/N] [--shard-results file]
               SRC [SRCS...] [-- MYPY_ARGS]
        refurb [--help | -h]
        refurb [--version]
        refurb --explain err
        refurb gen
+       refurb merge [--format format] [--sort sort] [--ignore err] RESULTS...
+       refurb daemon (start | check | stop) [ARGS...]
 
 Command Line Options:
 
@@ -52,9 +91,23 @@ Command Line Options:
 --enable-all          Enable all checks by default.
 --python-version x.y  Version of the Python code being checked.
 --verbose             Increase verbosity.
---format format       Output errors in specified format. Can be "text" or "github".
---sort sort           Sort errors by sort. Can be "filename" or "error".
+--format format       Output errors in specified format. Can be "text", "github", "jsonl", or "sarif".
+--sort sort           Sort errors by sort. Can be "filename", "error", or "none".
 --timing-stats file   Export timing information (as JSON) to file.
+--trace-file file     Export a timeline of the run (in the Chrome trace event format) to file.
+--trace-checks        Include a span for every check ran in the trace file (slow).
+--profile folder      Profile Refurb, writing the results (as pstats files) to folder.
+--profile-files glob  Only profile checking files which match glob.
+--max-memory size     Free unneeded memory when nearing size (ie, "2G"), and stop if it's reached.
+--trace-memory        Include where memory was allocated in the timing stats (slow).
+--low-memory          Free the parts of the Mypy build which the checks don't need once it is done.
+--jobs n              Check files using n worker processes (default is 1).
+--cache               Cache the results of unchanged files in the ".refurb_cache" folder.
+--changed-since ref   Only report errors in lines which changed since the git ref "ref".
+--staged              Only report errors in lines which are staged for commit.
+--report-unused-noqa  Report "noqa" comments which don't ignore any errors.
+--shard i/N           Only check the files in shard i of N, and write the errors to a result file.
+--shard-results file  Write the shard result file to file (default is "refurb-shard-i-of-N.json").
 
 Positional Args:
 
@@ -65,6 +118,8 @@ MYPY_ARGS             Extra args to be passed directly to Mypy.
 Subcommands:
 
 gen              Generate boilerplate code for a new check. Useful for developers.
+daemon           Run Refurb as a background server. See `refurb daemon --help` for more info.
+merge            Combine the result files of each shard (see "--shard") and print the errors.
 """
     )
 
@@ -76,64 +131,12 @@ def version() -> str:  # pragma: no cover
     return f"Refurb: v{refurb_version}\nMypy: v{mypy_version}"
 
 
-@cache
-def get_source_lines(filepath: str) -> list[str]:
-    return Path(filepath).read_text("utf8").splitlines()
+def get_mypy_options(settings: Settings) -> tuple[list[BuildSource], Options] | list[str]:
+    """
+    Build the list of source files and Mypy options for the given settings. If Mypy cannot
+    process the options, a list of error messages is returned instead.
+    """
 
-
-def is_ignored_via_comment(error: Error) -> bool:
-    assert error.filename
-
-    line = get_source_lines(error.filename)[error.line - 1].rstrip()
-
-    if comment := re.search(r"""# noqa(: [^'"]*)?$""", line):
-        ignore = str(ErrorCode.from_error(type(error)))
-        error_codes = comment.group(1)
-
-        return not error_codes or any(
-            error_code == ignore for error_code in error_codes[2:].replace(",", " ").split(" ")
-        )
-
-    return False
-
-
-def is_ignored_via_amend(error: Error, settings: Settings) -> bool:
-    assert error.filename
-
-    path = Path(error.filename).resolve()
-    error_code = str(ErrorCode.from_error(type(error)))
-    config_root = Path(settings.config_file).parent if settings.config_file else Path()
-
-    errors_to_ignore = set[str]()
-    categories_to_ignore = set[str]()
-
-    for ignore in settings.ignore:
-        if ignore.path:
-            ignore_path = (config_root / ignore.path).resolve()
-
-            if path.is_relative_to(ignore_path):
-                if isinstance(ignore, ErrorCode):
-                    errors_to_ignore.add(str(ignore))
-                else:
-                    categories_to_ignore.add(ignore.value)
-
-    return error_code in errors_to_ignore or bool(
-        categories_to_ignore.intersection(error.categories)
-    )
-
-
-def should_ignore_error(error: Error | str, settings: Settings) -> bool:
-    if isinstance(error, str):
-        return False
-
-    return (
-        not error.filename
-        or is_ignored_via_comment(error)
-        or is_ignored_via_amend(error, settings)
-    )
-
-
-def run_refurb(settings: Settings) -> Sequence[Error | str]:
     stdout = StringIO()
     stderr = StringIO()
 
@@ -159,30 +162,22 @@ def run_refurb(settings: Settings) -> Sequence[Error | str]:
         stdout.close()
         stderr.close()
 
+    # Fine-grained mode keeps the AST of every module around for the checks to use, though it
+    # also means that Mypy analyzes every module from source instead of loading it from the cache.
     opt.incremental = True
     opt.fine_grained_incremental = True
     opt.cache_fine_grained = True
     opt.local_partial_types = True
     opt.python_version = settings.get_python_version()
 
-    mypy_timing_stats = Path(mkstemp()[1]) if settings.timing_stats else None
-    opt.timing_stats = str(mypy_timing_stats) if mypy_timing_stats else None
-
-    try:
-        start = time.time()
+    return files, opt
 
-        result = build(files, options=opt)
 
-        mypy_build_time = time.time() - start
+def format_compile_error(error: CompileError) -> list[str]:
+    return [re.sub(r"^mypy: ", "refurb: ", msg) for msg in error.messages]
 
-    except CompileError as e:
-        return [re.sub(r"^mypy: ", "refurb: ", msg) for msg in e.messages]
-
-    errors: list[Error | str] = []
-    checks = load_checks(settings)
-
-    refurb_timing_stats_in_ms: dict[str, int] = {}
 
+def set_builtins_mypy_file(result: BuildResult) -> None:
     builtins_file = result.graph["builtins"].tree
     assert builtins_file
 
@@ -191,46 +186,500 @@ def run_refurb(settings: Settings) -> Sequence[Error | str]:
     # creating a new type checker instance.
     types.BUILTINS_MYPY_FILE = builtins_file
 
-    for file in files:
-        tree = result.graph[file.module].tree
 
-        assert tree
+def run_mypy(files: list[BuildSource], opt: Options, tier: AnalysisTier) -> AnalysisResult:
+    """
+    Run only the parts of the Mypy pipeline that are needed for the given analysis tier.
+    """
+
+    if tier == AnalysisTier.SYNTAX:
+        return parse_files(files, opt)
+
+    opt.semantic_analysis_only = tier == AnalysisTier.SEMANTIC
+
+    set_mypy_cache_dir(opt)
+
+    return build(files, options=opt)
+
+
+def run_refurb(settings: Settings) -> Sequence[Error | str]:
+    return list(chain.from_iterable(stream_refurb(settings)))
+
+
+def stream_refurb(settings: Settings) -> Iterator[Iterable[Error | str]]:
+    """
+    Run Refurb, yielding the errors in batches as soon as they are ready to be output (typically
+    one batch per file). See `run_checks()` for more info.
+    """
+
+    mypy_options = get_mypy_options(settings)
+
+    if isinstance(mypy_options, list):
+        yield mypy_options
+
+        return
+
+    files, opt = mypy_options
+
+    tracer = Tracer() if settings.trace_file else None
+
+    changes: ChangedLines | None = None
+
+    if settings.changed_since or settings.staged:
+        try:
+            with trace_span(tracer, "get changed lines", "refurb"):
+                changes = get_changed_lines(settings)
+
+        except GitError as ex:
+            yield [str(ex)]
+
+            return
+
+        files = filter_changed_files(files, changes)
+
+        if not files:
+            return
+
+    if settings.shard:
+        files = get_shard_files(files, settings.shard)
+
+        if not files:
+            return
+
+    needs_mypy_timing_stats = settings.timing_stats or settings.trace_file
+
+    mypy_timing_stats = Path(mkstemp()[1]) if needs_mypy_timing_stats else None
+    opt.timing_stats = str(mypy_timing_stats) if mypy_timing_stats else None
+
+    memory = MemoryTracker.create(settings)
+
+    with trace_span(tracer, "load checks", "refurb"), memory_phase(memory, "load_checks"):
+        checks = load_checks(settings)
+
+    # The full tree is always used in debug mode so that the output doesn't depend on which
+    # checks happen to be enabled.
+    tier = AnalysisTier.TYPES if settings.debug else get_analysis_tier(checks)
+
+    profiler = Profiler.create(settings)
+
+    try:
+        start = time.perf_counter_ns()
+
+        with memory_phase(memory, "build"):
+            if profiler:
+                result = profiler.build.runcall(run_mypy, files, opt, tier)
+
+            else:
+                result = run_mypy(files, opt, tier)
+
+        end = time.perf_counter_ns()
+
+        if memory:
+            memory.check_limit(result, files, "building the Mypy graph")
+
+    except CompileError as e:
+        yield format_compile_error(e)
+
+        return
+
+    except MemoryLimitError as ex:
+        yield [str(ex)]
+
+        return
+
+    if isinstance(result, BuildResult):
+        set_builtins_mypy_file(result)
+
+    if settings.low_memory:
+        # Done before any worker processes are forked so that they don't inherit the memory
+        with (
+            trace_span(tracer, "free unused memory", "refurb"),
+            memory_phase(memory, "free_unused_memory"),
+        ):
+            free_unused_memory(result, files, release_trees=True)
+
+    # Files loaded from the cache aren't checked, so they would be missing from the profile
+    use_cache = settings.cache and not settings.debug and not profiler
+
+    cache = ResultCache.create(checks, settings) if use_cache else None
 
-        if settings.debug:
-            errors.append(str(tree))
+    mypy_module_times = read_mypy_timing_stats(mypy_timing_stats) if mypy_timing_stats else {}
 
-        start = time.time()
+    if mypy_timing_stats:
+        mypy_timing_stats.unlink()
 
-        visitor = RefurbVisitor(checks, settings)
+    if tracer:
+        tracer.add_mypy_spans(result, tier, start, end, mypy_module_times)
 
-        # See: https://github.com/dosisod/refurb/issues/302
-        with suppress(RecursionError):
-            visitor.accept(tree)
+    refurb_timing_stats = TimingStats() if settings.timing_stats else None
 
-        elapsed = time.time() - start
+    batches = run_checks(
+        files, result, checks, settings, cache, refurb_timing_stats, tracer, profiler, memory
+    )
 
-        refurb_timing_stats_in_ms[file.module] = int(elapsed * 1_000)
+    try:
+        # Errors are output as they are yielded, so this phase includes outputting the errors
+        with memory_phase(memory, "check"):
+            for batch in batches:
+                if changes is None:
+                    yield batch
 
-        for error in visitor.errors:
-            error.filename = file.path
+                else:
+                    yield (error for error in batch if is_in_changed_lines(error, changes))
 
-        errors += visitor.errors
+    except MemoryLimitError as ex:
+        yield [str(ex)]
+
+        return
+
+    finally:
+        if memory:
+            memory.stop()
 
     output_timing_stats(
         settings,
-        mypy_build_time,
-        mypy_timing_stats,
-        refurb_timing_stats_in_ms,
+        (end - start) / 1_000_000_000,
+        mypy_module_times,
+        refurb_timing_stats,
+        cache,
+        memory,
     )
 
-    if mypy_timing_stats:
-        mypy_timing_stats.unlink()
+    if tracer:
+        assert settings.trace_file
+
+        tracer.write(settings.trace_file)
+
+    if profiler:
+        # Printed to stderr so that the summary isn't mixed up with the errors
+        print(profiler.write(), file=sys.stderr)
+
+
+@dataclass
+class FileResult:
+    errors: list[Error | str]
+
+    # When the file started and finished being checked (see `time.perf_counter_ns()`), and the ID
+    # of the process which checked it. These are all zero for files loaded from the cache.
+    start_ns: int = 0
+    end_ns: int = 0
+    pid: int = 0
+
+    # Only set when the visitor is timed, see `build_visitor_class()`
+    stats: VisitorStats | None = None
+
+    @property
+    def elapsed_in_ms(self) -> int:
+        return (self.end_ns - self.start_ns) // 1_000_000
+
+
+def check_file(  # noqa: PLR0913, PLR0917
+    file: BuildSource,
+    result: AnalysisResult,
+    checks: Checks,
+    settings: Settings,
+    visitor_type: type[RefurbVisitor],
+    sources: SourceStore,
+) -> FileResult:
+    tree = result.graph[file.module].tree
+
+    assert tree
+
+    errors: list[Error | str] = []
+
+    if settings.debug:
+        errors.append(str(tree))
+
+    start = time.perf_counter_ns()
+
+    visitor = visitor_type(checks, settings)
 
-    return sorted(
-        [error for error in errors if not should_ignore_error(error, settings)],
-        key=partial(sort_errors, settings=settings),
+    # Lets checks take the source of a node straight from the file (see `stringify()`)
+    types.CURRENT_FILE = sources.get_build_source_file(file)
+
+    try:
+        visitor.accept(tree)
+
+    finally:
+        types.CURRENT_FILE = None
+
+    end = time.perf_counter_ns()
+
+    for error in visitor.errors:
+        error.filename = file.path
+
+    errors += visitor.errors
+
+    errors.extend(
+        f'refurb: {name} hit the recursion limit in "{file.path}", some errors might be missing'
+        for name in sorted({get_check_name(check) for check in visitor.skipped_checks})
     )
 
+    return FileResult(errors, start, end, os.getpid(), visitor.stats)
+
+
+# Set by the parent process right before the worker pool is created. Since the workers are forked
+# they inherit the build result through copy-on-write memory instead of having to re-build or
+# un-pickle the Mypy graph.
+_worker_state: (
+    tuple[list[BuildSource], AnalysisResult, Checks, Settings, type[RefurbVisitor], SourceStore]
+    | None
+) = None
+
+
+def check_files_in_worker(indices: list[int]) -> list[tuple[int, FileResult]]:
+    assert _worker_state
+
+    files, result, checks, settings, visitor_type, sources = _worker_state
+
+    return [
+        (i, check_file(files[i], result, checks, settings, visitor_type, sources)) for i in indices
+    ]
+
+
+def can_run_in_parallel(files: list[BuildSource], settings: Settings) -> bool:
+    return (
+        settings.jobs is not None
+        and settings.jobs > 1
+        and len(files) > 1
+        and "fork" in get_all_start_methods()
+        # Workers can't add to the profile of the main process
+        and not settings.profile
+    )
+
+
+def check_files(  # noqa: PLR0913, PLR0917
+    files: list[BuildSource],
+    result: AnalysisResult,
+    checks: Checks,
+    settings: Settings,
+    sources: SourceStore,
+    cache: ResultCache | None = None,
+    profiler: Profiler | None = None,
+) -> Iterator[tuple[int, FileResult]]:
+    """
+    Check each file, yielding the index and result of each file as soon as it is done. Files are
+    checked in the order they are passed, though when running in parallel they may finish out of
+    order.
+    """
+
+    cache_keys: dict[int, str] = {}
+    pending: list[int] = []
+
+    for i, file in enumerate(files):
+        if cache and (key := cache.get_key(file, result)):
+            if (cached := cache.get(key, file.path)) is not None:
+                yield i, FileResult(list(cached))
+
+                continue
+
+            cache_keys[i] = key
+
+        pending.append(i)
+
+    pending_files = [files[i] for i in pending]
+
+    timed = bool(settings.timing_stats or settings.trace_checks)
+
+    visitor_type = build_visitor_class(checks, timed=timed)
+
+    if can_run_in_parallel(pending_files, settings):
+        new_results = run_checks_in_parallel(
+            pending_files, result, checks, settings, visitor_type, sources
+        )
+
+    elif profiler:
+        new_results = enumerate(
+            profiler.run_check(
+                file.path, check_file, file, result, checks, settings, visitor_type, sources
+            )
+            for file in pending_files
+        )
+
+    else:
+        new_results = enumerate(
+            check_file(file, result, checks, settings, visitor_type, sources)
+            for file in pending_files
+        )
+
+    for j, file_result in new_results:
+        i = pending[j]
+
+        errors = [error for error in file_result.errors if isinstance(error, Error)]
+
+        # Files with messages (ie, checks which hit the recursion limit) aren't cached, since
+        # the messages would be lost when loading the file from the cache
+        if cache and (key := cache_keys.get(i)) and len(errors) == len(file_result.errors):
+            cache.put(key, errors)
+
+        yield i, file_result
+
+    if cache:
+        cache.prune()
+
+
+def add_file_spans(tracer: Tracer, file: BuildSource, result: FileResult) -> None:
+    """
+    Add a span for checking the given file, as well as a span for each check that was ran on it
+    (if recorded). Files loaded from the cache weren't checked, so they don't get any spans.
+    """
+
+    if not result.pid:
+        return
+
+    errors = sum(isinstance(error, Error) for error in result.errors)
+    args: dict[str, object] = {"module": file.module, "errors": errors}
+
+    if result.stats:
+        args["nodes_visited"] = result.stats.nodes_visited
+
+    name = file.path or file.module
+
+    tracer.add_span(name, "file", result.start_ns, result.end_ns, tid=result.pid, args=args)
+
+    if result.stats and result.stats.spans:
+        for check_name, node_type, start, end in result.stats.spans:
+            tracer.add_span(
+                check_name, "check", start, end, tid=result.pid, args={"node_type": node_type}
+            )
+
+
+def run_checks(  # noqa: PLR0913, PLR0917
+    files: list[BuildSource],
+    result: AnalysisResult,
+    checks: Checks,
+    settings: Settings,
+    cache: ResultCache | None = None,
+    timing_stats: TimingStats | None = None,
+    tracer: Tracer | None = None,
+    profiler: Profiler | None = None,
+    memory: MemoryTracker | None = None,
+) -> Iterator[Iterable[Error | str]]:
+    """
+    Check the given files, yielding the filtered and sorted errors for each file as soon as they
+    can be output instead of waiting for every file to be checked:
+
+    * When sorting by filename the files are checked in sorted order, and since a file only has
+      errors for that file, the sorted runs can be output one after another. Files which finish
+      early (when running in parallel) are held on to until it is their turn.
+    * When sorting by error the sorted runs have to be merged, which can only happen once every
+      file has been checked.
+    * When not sorting, errors are output as soon as each file is done.
+
+    With `--debug` nothing is output until every file has been checked, so that the AST of each
+    file is output before any of the errors (like it was before errors were output per file).
+
+    The time spent checking each file (and the stats collected by the visitor) are stored in
+    `timing_stats` if passed, and spans for checking and filtering each file are added to
+    `tracer` if passed. Checking each file is profiled with `profiler` if passed, and the memory
+    usage is checked against `--max-memory` after each file if `memory` is passed.
+    """
+
+    if settings.sort_by in {None, "filename"}:
+        # Sorted into a new list so that the caller's list isn't modified
+        files = sorted(files, key=lambda file: file.path or "")  # noqa: FURB186
+
+    key = partial(sort_errors, settings=settings)
+
+    # The sources are shared so that each file is only decoded once, both for `stringify()` and
+    # for finding the `noqa` comments
+    sources = SourceStore.from_result(result)
+    suppressions = Suppressions(settings, sources)
+
+    enabled_codes = {f"{error.prefix}{error.code}" for error in get_error_classes(checks) if error}
+
+    stream = not settings.debug
+
+    runs: dict[int, list[Error | str]] = {}
+    next_run = 0
+
+    for i, file_result in check_files(files, result, checks, settings, sources, cache, profiler):
+        if timing_stats is not None:
+            timing_stats.add_file(files[i].module, file_result.elapsed_in_ms, file_result.stats)
+
+        if tracer:
+            add_file_spans(tracer, files[i], file_result)
+
+        if memory:
+            memory.check_limit(result, files, f'checking "{files[i].path}"')
+
+        start = time.perf_counter_ns()
+
+        errors = [
+            error for error in file_result.errors if not suppressions.should_ignore_error(error)
+        ]
+
+        if settings.report_unused_noqa and (path := files[i].path):
+            # Only known once the other errors have been filtered, but they can be ignored (or
+            # amended, or `noqa`-ed) just like any other error
+            unused_noqa = suppressions.get_unused_noqa_errors(path, enabled_codes)
+
+            errors += [
+                error for error in unused_noqa if not suppressions.should_ignore_error(error)
+            ]
+
+        if settings.sort_by != "none":
+            errors.sort(key=key)
+
+        if tracer:
+            tracer.add_span("filter errors", "refurb", start, time.perf_counter_ns())
+
+        if settings.sort_by == "none" and stream:
+            yield errors
+
+            continue
+
+        runs[i] = errors
+
+        while stream and settings.sort_by != "error" and next_run in runs:
+            yield runs.pop(next_run)
+
+            next_run += 1
+
+    if runs and settings.sort_by == "none":
+        # The debug output is moved to the front, but the errors are left as-is
+        yield sorted(
+            chain.from_iterable(runs.values()), key=lambda error: isinstance(error, Error)
+        )
+
+    elif runs:
+        yield heapq.merge(*runs.values(), key=key)
+
+
+# Upper limit on how many files are sent to a worker at a time. Smaller chunks mean results come
+# back (and can be output) sooner, and workers that finish early can pick up more work.
+MAX_CHUNK_SIZE = 32
+
+
+def run_checks_in_parallel(  # noqa: PLR0913, PLR0917
+    files: list[BuildSource],
+    result: AnalysisResult,
+    checks: Checks,
+    settings: Settings,
+    visitor_type: type[RefurbVisitor],
+    sources: SourceStore,
+) -> Iterator[tuple[int, FileResult]]:
+    global _worker_state  # noqa: PLW0603
+
+    assert settings.jobs
+
+    jobs = min(settings.jobs, len(files))
+
+    size = max(1, min(MAX_CHUNK_SIZE, len(files) // (jobs * 4)))
+    chunks = [list(range(i, min(i + size, len(files)))) for i in range(0, len(files), size)]
+
+    _worker_state = (files, result, checks, settings, visitor_type, sources)
+
+    try:
+        with ProcessPoolExecutor(jobs, mp_context=get_context("fork")) as pool:
+            futures = [pool.submit(check_files_in_worker, chunk) for chunk in chunks]
+
+            for future in as_completed(futures):
+                yield from future.result()
+
+    finally:
+        _worker_state = None
+
 
 def sort_errors(error: Error | str, settings: Settings) -> tuple[str | int, ...]:
     if isinstance(error, str):
@@ -272,6 +721,44 @@ def format_as_github_annotation(error: Error | str) -> str:
     )
 
 
+JSON_LINE_FIELDS = (
+    "code",
+    "name",
+    "categories",
+    "filename",
+    "line",
+    "column",
+    "line_end",
+    "column_end",
+    "msg",
+)
+
+
+def format_as_json_line(error: Error | str) -> str:
+    """
+    Format an error as a single line of JSON. Like the text output, columns start at 1, and the
+    end column is exclusive. Messages that aren't errors only have the "msg" field set.
+    """
+
+    if isinstance(error, str):
+        data: dict[str, object] = dict.fromkeys(JSON_LINE_FIELDS) | {"msg": error}
+
+    else:
+        data = {
+            "code": f"{error.prefix}{error.code}",
+            "name": error.name,
+            "categories": list(error.categories),
+            "filename": error.filename,
+            "line": error.line,
+            "column": error.column + 1,
+            "line_end": error.line_end,
+            "column_end": None if error.column_end is None else error.column_end + 1,
+            "msg": error.msg,
+        }
+
+    return json.dumps(data, separators=(",", ":"))
+
+
 ERROR_DIFF_PATTERN = re.compile(r"`([^`]*)`([^`]*)`([^`]*)`")
 
 
@@ -310,59 +797,190 @@ def format_with_color(error: Error | str) -> str:
     return "".join(parts)
 
 
-def format_errors(errors: Sequence[Error | str], settings: Settings) -> str:
+EXPLAIN_MESSAGE = (
+    "Run `refurb --explain ERR` to further explain an error. Use `--quiet` to silence this message"
+)
+
+
+# Formats which are meant to be read by other programs, and so shouldn't include anything but
+# the errors themselves.
+STRUCTURED_FORMATS = {"jsonl", "sarif"}
+
+
+def get_formatter(settings: Settings) -> Callable[[Error | str], str]:
     if settings.format == "github":
-        formatter: Callable[[Error | str], str] = format_as_github_annotation
-    elif settings.color:
-        formatter = format_with_color
-    else:
-        formatter = str
+        return format_as_github_annotation
+
+    if settings.format == "jsonl":
+        return format_as_json_line
+
+    return format_with_color if settings.color else str
+
+
+def should_print_explain_message(had_errors: bool, settings: Settings) -> bool:
+    return had_errors and not settings.quiet and settings.format not in STRUCTURED_FORMATS
+
+
+def format_errors(errors: Sequence[Error | str], settings: Settings) -> str:
+    if settings.format == "sarif":
+        sarif = SarifWriter()
+
+        results = (sarif.format(error) for error in errors)
+
+        return "\n".join([sarif.start(), *(line for line in results if line), sarif.finish()])
+
+    formatter = get_formatter(settings)
 
     done = "\n".join(formatter(error) for error in errors)
 
-    if not settings.quiet and any(isinstance(err, Error) for err in errors):
-        done += "\n\nRun `refurb --explain ERR` to further explain an error. Use `--quiet` to silence this message"
+    if should_print_explain_message(any(isinstance(err, Error) for err in errors), settings):
+        done += f"\n\n{EXPLAIN_MESSAGE}"
 
     return done
 
 
-def output_timing_stats(
+def print_errors(batches: Iterable[Iterable[Error | str]], settings: Settings) -> bool:
+    """
+    Print each batch of errors as soon as it is ready, flushing stdout after each batch so that
+    the output shows up right away, even when piped. Return whether anything was printed (not
+    counting the start and end of the SARIF log, which are always printed).
+    """
+
+    sarif = SarifWriter() if settings.format == "sarif" else None
+
+    formatter: Callable[[Error | str], str | None] = (
+        sarif.format if sarif else get_formatter(settings)
+    )
+
+    if sarif:
+        print(sarif.start())
+
+    had_output = False
+    had_errors = False
+
+    for batch in batches:
+        lines: list[str] = []
+
+        for error in batch:
+            if (line := formatter(error)) is not None:
+                lines.append(line)
+
+            had_output = True
+            had_errors = had_errors or isinstance(error, Error)
+
+        if lines:
+            print("\n".join(lines), flush=True)
+
+    if sarif:
+        print(sarif.finish())
+
+    if should_print_explain_message(had_errors, settings):
+        print(f"\n{EXPLAIN_MESSAGE}")
+
+    return had_output
+
+
+def read_mypy_timing_stats(path: Path) -> dict[str, int]:
+    """
+    Read the time (in microseconds) Mypy spent on each module, as written by the
+    `--timing-stats` Mypy option.
+    """
+
+    stats: dict[str, int] = {}
+
+    for line in path.read_text().splitlines():
+        module, micro_seconds = line.split()
+
+        stats[module] = int(micro_seconds)
+
+    return stats
+
+
+def output_timing_stats(  # noqa: PLR0913, PLR0917
     settings: Settings,
     mypy_total_time_spent: float,
-    mypy_timing_stats: Path | None,
-    refurb_timing_stats_in_ms: dict[str, int],
+    mypy_module_times_in_us: dict[str, int],
+    refurb_timing_stats: TimingStats | None,
+    cache: ResultCache | None = None,
+    memory: MemoryTracker | None = None,
 ) -> None:
     if not settings.timing_stats:
         return
 
-    assert mypy_timing_stats
+    assert refurb_timing_stats
 
-    mypy_stats: dict[str, int] = {}
-    lines = mypy_timing_stats.read_text().splitlines()
-
-    for line in lines:
-        module, micro_seconds = line.split()
-
-        mypy_stats[module] = int(micro_seconds) // 1_000
+    mypy_stats = {module: us // 1_000 for module, us in mypy_module_times_in_us.items()}
 
     data = {
         "mypy_total_time_spent_in_ms": int(mypy_total_time_spent * 1_000),
         "mypy_time_spent_parsing_modules_in_ms": dict(
             sorted(mypy_stats.items(), key=itemgetter(1), reverse=True)
         ),
-        "refurb_time_spent_checking_file_in_ms": dict(
-            sorted(
-                refurb_timing_stats_in_ms.items(),
-                key=itemgetter(1),
-                reverse=True,
-            )
-        ),
+        **refurb_timing_stats.to_json(),
     }
 
+    if cache:
+        data["refurb_cache"] = {"hits": cache.hits, "misses": cache.misses}
+
+    if memory:
+        data |= memory.to_json()
+
     settings.timing_stats.write_text(json.dumps(data, separators=(",", ":")))
 
 
+def merge_shards(settings: Settings) -> list[Error | str]:
+    """
+    Combine the shard result files passed as `settings.files`, filtering and sorting the errors
+    the same way as `run_checks()`. Each shard has already filtered out its ignored errors, but
+    they are filtered again so that `--ignore`, `--enable`, `--disable`, and `amend` sections can
+    be passed to `refurb merge` as well. Normally the errors of disabled or ignored checks are never
+    emitted since their checks aren't loaded, so they are removed here. The shards have already
+    applied the `noqa` comments, so the source files aren't read, meaning that the merge can be ran
+    without a checkout of the code.
+    """
+
+    results = read_shard_results([Path(file) for file in settings.files])
+
+    suppressions = Suppressions(settings)
+
+    def is_ignored(error: Error) -> bool:
+        if not should_load_check(settings, type(error)):
+            return True
+
+        return bool(error.filename) and suppressions.is_ignored_via_amend(error)
+
+    # Messages (ie, Mypy errors) which aren't specific to a shard are recorded by every shard
+    messages = dict.fromkeys(error for error in results if isinstance(error, str))
+
+    errors: list[Error | str] = [*messages]
+    errors += [error for error in results if isinstance(error, Error) and not is_ignored(error)]
+
+    if settings.sort_by != "none":
+        errors.sort(key=partial(sort_errors, settings=settings))
+
+    return errors
+
+
+def merge_main(args: list[str]) -> int:
+    try:
+        settings = load_settings(args)
+
+        errors = merge_shards(settings)
+
+    except ValueError as e:
+        print(e)
+        return 1
+
+    return 1 if print_errors([errors], settings) else 0
+
+
 def main(args: list[str]) -> int:
+    if args[:1] == ["daemon"]:
+        return daemon_main(args[1:])
+
+    if args[:1] == ["merge"]:
+        return merge_main(args[1:])
+
     try:
         settings = load_settings(args)
 
@@ -390,14 +1008,16 @@ def main(args: list[str]) -> int:
 
         return 0
 
+    batches = stream_refurb(settings)
+
+    if settings.shard:
+        batches = record_shard_results(batches, settings)
+
     try:
-        errors = run_refurb(settings)
+        had_errors = print_errors(batches, settings)
 
     except TypeError as e:
         print(e)
         return 1
 
-    if formatted_errors := format_errors(errors, settings):
-        print(formatted_errors)
-
-    return 1 if errors else 0
+    return 1 if had_errors else 0
@@ -0,0 +1,147 @@
+"""
+A static manifest of the built-in checks. Reading the manifest allows for Refurb to only import
+the checks which are enabled, instead of importing and inspecting every check on every run.
+
+The manifest is generated ahead of time and shipped alongside the checks. Run
+`python3 -m refurb.manifest` to regenerate it after adding or changing a check.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from mypy.nodes import Node
+
+from .error import AnalysisTier
+from .visitor.mapping import METHOD_NODE_MAPPINGS
+
+MANIFEST_PATH = Path(__file__).parent / "checks" / "manifest.json"
+
+# Bump this whenever the format of the manifest changes.
+MANIFEST_VERSION = 2
+
+NODE_TYPES_BY_NAME = {ty.__name__: ty for ty in METHOD_NODE_MAPPINGS.values()}
+
+SerializedManifestEntry = dict[str, str | int | bool | list[str] | None]
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """
+    Everything needed to decide whether a check should be loaded, and how to run it, without
+    having to import it. The field names match the class variables on `Error` so that entries
+    can be passed to `should_load_check()`.
+    """
+
+    module: str
+    prefix: str
+    code: int
+    name: str | None
+    categories: tuple[str, ...]
+    enabled: bool
+    tier: AnalysisTier
+    node_types: tuple[type[Node], ...]
+    takes_settings: bool
+
+    def serialize(self) -> SerializedManifestEntry:
+        return {
+            "module": self.module,
+            "prefix": self.prefix,
+            "code": self.code,
+            "name": self.name,
+            "categories": list(self.categories),
+            "enabled": self.enabled,
+            "tier": self.tier.name.lower(),
+            "node_types": [ty.__name__ for ty in self.node_types],
+            "takes_settings": self.takes_settings,
+        }
+
+    @classmethod
+    def deserialize(cls, data: SerializedManifestEntry) -> "ManifestEntry":
+        name = data["name"]
+        categories = data["categories"]
+        node_types = data["node_types"]
+
+        if not isinstance(categories, list) or not isinstance(node_types, list):
+            raise TypeError("Expected a list")
+
+        return cls(
+            module=str(data["module"]),
+            prefix=str(data["prefix"]),
+            code=int(str(data["code"])),
+            name=None if name is None else str(name),
+            categories=tuple(categories),
+            enabled=bool(data["enabled"]),
+            tier=AnalysisTier[str(data["tier"]).upper()],
+            node_types=tuple(NODE_TYPES_BY_NAME[ty] for ty in node_types),
+            takes_settings=bool(data["takes_settings"]),
+        )
+
+
+def read_manifest(path: Path = MANIFEST_PATH) -> list[ManifestEntry] | None:
+    """
+    Read the manifest, returning `None` if it is missing or invalid, in which case the checks
+    should be discovered by importing them instead.
+    """
+
+    try:
+        data = json.loads(path.read_text("utf8"))
+
+        if data["version"] != MANIFEST_VERSION:
+            return None
+
+        return [ManifestEntry.deserialize(entry) for entry in data["checks"]]
+
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def write_manifest(entries: list[ManifestEntry], path: Path = MANIFEST_PATH) -> None:
+    data = {
+        "version": MANIFEST_VERSION,
+        "checks": [entry.serialize() for entry in entries],
+    }
+
+    path.write_text(json.dumps(data, indent=2) + "\n", "utf8")
+
+
+def build_manifest() -> list[ManifestEntry]:
+    # Imported here since the loader itself depends on the manifest.
+    from .loader import (  # noqa: PLC0415
+        extract_function_types,
+        get_error_class,
+        get_modules,
+        takes_settings,
+    )
+
+    entries: list[ManifestEntry] = []
+
+    for module in get_modules([]):
+        # Skip any checks which are loaded via plugins
+        if not module.__name__.startswith("refurb.checks."):
+            continue
+
+        if not (error := get_error_class(module)):
+            continue
+
+        func = getattr(module, "check", None)
+
+        entries.append(
+            ManifestEntry(
+                module=module.__name__,
+                prefix=error.prefix,
+                code=error.code,
+                name=error.name,
+                categories=error.categories,
+                enabled=error.enabled,
+                tier=error.tier,
+                node_types=tuple(extract_function_types(func)) if func else (),
+                takes_settings=takes_settings(func) if func else False,
+            )
+        )
+
+    return entries
+
+
+if __name__ == "__main__":  # pragma: no cover
+    write_manifest(build_manifest())
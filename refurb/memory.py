@@ -0,0 +1,286 @@
+"""
+Memory accounting for each phase of a Refurb run (reported via `--timing-stats`), and the soft
+memory limit set via `--max-memory`.
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+from collections.abc import Iterator, Sequence
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+
+from mypy.build import BuildResult, BuildSource
+from mypy.nodes import ClassDef, Decorator, FuncDef, IfStmt, OverloadedFuncDef, Statement
+
+from .analysis import AnalysisResult
+from .settings import Settings
+
+# When memory usage goes over this fraction of `--max-memory`, memory that isn't needed for
+# checking the remaining files is freed.
+SOFT_LIMIT_RATIO = 0.8
+
+# The number of allocation sites to report for each phase when using `--trace-memory`
+TOP_ALLOCATION_COUNT = 10
+
+MIB = 1024 * 1024
+
+
+class MemoryLimitError(Exception):
+    pass
+
+
+def get_peak_rss() -> int:
+    """
+    Get the peak resident set size (in bytes) of the current process, or 0 if it is unknown.
+    """
+
+    try:
+        import resource  # noqa: PLC0415
+
+    except ImportError:  # pragma: no cover
+        return 0
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports this in kilobytes, macOS in bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def get_rss() -> int:
+    """
+    Get the current resident set size (in bytes) of the current process. Only Linux makes this
+    cheap to get, so on other platforms the peak RSS is used instead, which is never lower.
+    """
+
+    try:
+        resident_pages = int(Path("/proc/self/statm").read_text(encoding="ascii").split()[1])
+
+    except OSError:  # pragma: no cover
+        return get_peak_rss()
+
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def format_size(size: int) -> str:
+    return f"{size / MIB:.1f}MiB"
+
+
+@dataclass
+class PhaseMemory:
+    rss: int
+    peak_rss: int
+
+    # Only set when using `--trace-memory`
+    traced: int | None = None
+    traced_peak: int | None = None
+    top_allocations: list[tuple[str, int]] | None = None
+
+
+class MemoryTracker:
+    """
+    Records the memory usage at the end of each phase. When `trace` is set, `tracemalloc` is used
+    to record how much memory was allocated by Python during each phase, and where. This is a lot
+    slower, so it is only done when asked for.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.max_memory = settings.max_memory
+        self.trace = settings.trace_memory
+        self.phases: dict[str, PhaseMemory] = {}
+        self.freed = False
+        self.snapshot: tracemalloc.Snapshot | None = None
+
+        if self.trace:
+            tracemalloc.start()
+
+            self.snapshot = tracemalloc.take_snapshot()
+
+    @classmethod
+    def create(cls, settings: Settings) -> "MemoryTracker | None":
+        if settings.timing_stats or settings.max_memory:
+            return cls(settings)
+
+        return None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if self.trace:
+            tracemalloc.reset_peak()
+
+        yield
+
+        self.phases[name] = self.measure()
+
+    def measure(self) -> PhaseMemory:
+        memory = PhaseMemory(get_rss(), get_peak_rss())
+
+        if self.snapshot is not None:
+            memory.traced, memory.traced_peak = tracemalloc.get_traced_memory()
+
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__)]
+            )
+
+            diff = snapshot.compare_to(self.snapshot, "filename")
+
+            # Mypy is compiled, so anything allocated by Mypy is attributed to the Refurb code
+            # which called into Mypy.
+            memory.top_allocations = [
+                (stat.traceback[0].filename, stat.size_diff)
+                for stat in diff[:TOP_ALLOCATION_COUNT]
+            ]
+
+            self.snapshot = snapshot
+
+        return memory
+
+    def stop(self) -> None:
+        if self.trace:
+            self.snapshot = None
+
+            tracemalloc.stop()
+
+    def check_limit(self, result: AnalysisResult, files: list[BuildSource], when: str) -> None:
+        """
+        Free up memory if the memory usage is close to `--max-memory`, raising a
+        `MemoryLimitError` if the memory usage is still over the limit. `when` describes what
+        was just done, and is used in the error message.
+        """
+
+        if not self.max_memory:
+            return
+
+        rss = get_rss()
+
+        if rss < self.max_memory * SOFT_LIMIT_RATIO:
+            return
+
+        if not self.freed:
+            self.freed = True
+
+            free_unused_memory(result, files)
+
+            rss = get_rss()
+
+        if rss > self.max_memory:
+            msg = (
+                f"refurb: memory usage ({format_size(rss)}) is over the limit set by "
+                f"--max-memory ({format_size(self.max_memory)}) after {when}. Try checking "
+                "fewer files at a time, or raise the limit"
+            )
+
+            raise MemoryLimitError(msg)
+
+    def to_json(self) -> dict[str, object]:
+        def to_mib(size: int | None) -> float | None:
+            return None if size is None else round(size / MIB, 3)
+
+        phases: dict[str, object] = {}
+
+        for name, memory in self.phases.items():
+            data: dict[str, object] = {
+                "rss_in_mb": to_mib(memory.rss),
+                "peak_rss_in_mb": to_mib(memory.peak_rss),
+            }
+
+            if memory.top_allocations is not None:
+                data["traced_in_mb"] = to_mib(memory.traced)
+                data["traced_peak_in_mb"] = to_mib(memory.traced_peak)
+                data["top_allocations_in_mb"] = {
+                    site: to_mib(size) for site, size in memory.top_allocations
+                }
+
+            phases[name] = data
+
+        return {"memory": phases, "memory_freed_early": self.freed}
+
+
+def memory_phase(memory: MemoryTracker | None, name: str) -> AbstractContextManager[None]:
+    """
+    Same as `MemoryTracker.phase()`, but does nothing if memory isn't being tracked.
+    """
+
+    return memory.phase(name) if memory else nullcontext()
+
+
+def free_function_bodies(defs: Sequence[Statement]) -> None:
+    """
+    Clear the bodies of the functions (and methods) in the given statements. Class bodies are
+    kept since some checks look up the methods of a class, as well as the bodies of `if`
+    statements, which are commonly used for defining things based on the Python version.
+    """
+
+    for stmt in defs:
+        match stmt:
+            case FuncDef():
+                stmt.body.body.clear()
+
+            case Decorator():
+                stmt.func.body.body.clear()
+
+            case OverloadedFuncDef():
+                free_function_bodies(stmt.items)
+
+                if stmt.impl:
+                    free_function_bodies([stmt.impl])
+
+            case ClassDef():
+                free_function_bodies(stmt.defs.body)
+
+            case IfStmt():
+                for block in stmt.body:
+                    free_function_bodies(block.body)
+
+                if stmt.else_body:
+                    free_function_bodies(stmt.else_body.body)
+
+
+def free_unused_memory(
+    result: AnalysisResult, files: list[BuildSource], *, release_trees: bool = False
+) -> None:
+    """
+    Free the parts of the Mypy build which aren't needed for checking the given files:
+
+    * The type checker state (ie, the type of every expression) of every module, since checks
+      only use the types stored on the nodes themselves.
+    * The function bodies of modules which aren't being checked. Everything else is kept, so
+      names and types that refer to these modules can still be looked up.
+    * The source of files which aren't being checked.
+
+    If `release_trees` is set (ie, when using `--low-memory`), the trees of the modules which
+    aren't being checked are released as well, except for `builtins`. The classes, functions,
+    and variables that checks look up are still reachable through the nodes and types which
+    refer to them, so only the statements which nothing refers to are freed.
+    """
+
+    if not isinstance(result, BuildResult):
+        # Only the files being checked were parsed, so there is nothing to free
+        return
+
+    needed_modules = {file.module for file in files}
+    needed_paths = {file.path for file in files}
+
+    for module, state in result.graph.items():
+        state.free_state()
+
+        if module in needed_modules or not (tree := state.tree):
+            continue
+
+        free_function_bodies(tree.defs)
+
+        if release_trees and module != "builtins":
+            tree.defs.clear()
+            tree.imports.clear()
+
+            state.tree = None
+
+    read_cache = result.manager.fscache.read_cache
+
+    for path in list(read_cache):
+        if path not in needed_paths:
+            del read_cache[path]
+
+    gc.collect()
@@ -0,0 +1,113 @@
+"""
+Support for the `--profile` flag, which profiles the Mypy build and the checking of each file
+using `cProfile`. The results are written as two `pstats` files, which can be opened with
+`python -m pstats` or tools like `snakeviz`.
+"""
+
+from collections.abc import Callable
+from cProfile import Profile
+from fnmatch import fnmatch
+from pathlib import Path
+from pstats import Stats
+from typing import ParamSpec, TypeVar
+
+from .settings import Settings
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+BUILD_PROFILE_NAME = "build.pstats"
+CHECKS_PROFILE_NAME = "checks.pstats"
+
+# The number of functions to show in the summary
+SUMMARY_SIZE = 20
+
+REFURB_DIR = Path(__file__).parent
+
+# Only functions in these folders are shown in the summary, since the rest are either part of
+# Mypy or the standard library, which check authors have no control over.
+SUMMARY_FOLDERS = (str(REFURB_DIR / "checks"), str(REFURB_DIR / "visitor"))
+
+
+class Profiler:
+    def __init__(self, folder: Path, files: str | None = None) -> None:
+        self.folder = folder
+        self.files = files
+        self.build = Profile()
+        self.checks = Profile()
+        self.profiled_files = 0
+
+    @classmethod
+    def create(cls, settings: Settings) -> "Profiler | None":
+        if not settings.profile:
+            return None
+
+        return cls(settings.profile, settings.profile_files)
+
+    def should_profile(self, path: str | None) -> bool:
+        return not self.files or (path is not None and fnmatch(path, self.files))
+
+    def run_check(
+        self, path: str | None, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
+    ) -> T:
+        """
+        Run `func` (which checks the file at `path`), profiling it if the file matches the
+        `--profile-files` glob.
+        """
+
+        if not self.should_profile(path):
+            return func(*args, **kwargs)
+
+        self.profiled_files += 1
+
+        return self.checks.runcall(func, *args, **kwargs)
+
+    def write(self) -> str:
+        """
+        Write the profiles to the output folder, returning a summary of the slowest functions in
+        the checks and visitor.
+        """
+
+        self.folder.mkdir(parents=True, exist_ok=True)
+
+        self.build.dump_stats(self.folder / BUILD_PROFILE_NAME)
+
+        lines = [f"Wrote build profile to {self.folder / BUILD_PROFILE_NAME}"]
+
+        if not self.profiled_files:
+            lines.append("No files were profiled, skipping checks profile")
+
+            return "\n".join(lines)
+
+        self.checks.dump_stats(self.folder / CHECKS_PROFILE_NAME)
+
+        lines.extend(
+            (
+                f"Wrote checks profile ({self.profiled_files} files) to "
+                f"{self.folder / CHECKS_PROFILE_NAME}",
+                "",
+                f"{'tottime':>10} {'cumtime':>10} {'calls':>10}  function",
+            )
+        )
+
+        stats = Stats(self.checks).stats  # type: ignore[attr-defined]
+
+        functions = [
+            (
+                tottime,
+                cumtime,
+                calls,
+                f"{Path(filename).relative_to(REFURB_DIR.parent)}:{line}({name})",
+            )
+            for (filename, line, name), (_, calls, tottime, cumtime, _) in stats.items()
+            if filename.startswith(SUMMARY_FOLDERS)
+        ]
+
+        functions.sort(reverse=True)
+
+        for tottime, cumtime, calls, name in functions[:SUMMARY_SIZE]:
+            lines.append(
+                f"{tottime * 1_000:>8.2f}ms {cumtime * 1_000:>8.2f}ms {calls:>10}  {name}"
+            )
+
+        return "\n".join(lines)
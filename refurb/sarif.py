@@ -0,0 +1,107 @@
+"""
+Output errors as a SARIF log (https://sarifweb.azurewebsites.net), which is supported by code
+scanning tools such as GitHub's. The log is written one result per line as the errors come in,
+so the whole log never has to be held in memory.
+"""
+
+import json
+from importlib import metadata
+from pathlib import Path
+
+from .error import Error
+
+SARIF_VERSION = "2.1.0"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+REFURB_URI = "https://github.com/dosisod/refurb"
+
+
+def to_json(data: object) -> str:
+    return json.dumps(data, separators=(",", ":"))
+
+
+class SarifWriter:
+    """
+    Build a SARIF log piece by piece: `start()` returns the beginning of the log, `format()`
+    returns each result, and `finish()` returns the rest of the log. The rules (and any messages
+    that aren't errors, such as Mypy failing to parse a file) are only known once every error has
+    been seen, so they are written after the results.
+    """
+
+    def __init__(self) -> None:
+        self.results = 0
+        self.rules: dict[str, type[Error]] = {}
+        self.notifications: list[str] = []
+
+    @staticmethod
+    def start() -> str:
+        log = to_json({"version": SARIF_VERSION, "$schema": SARIF_SCHEMA})
+
+        # Leave the log, the list of runs, the run, and the list of results open
+        return log[:-1] + ',"runs":[{"results":['
+
+    def format(self, error: Error | str) -> str | None:
+        if isinstance(error, str):
+            self.notifications.append(error)
+
+            return None
+
+        rule_id = f"{error.prefix}{error.code}"
+
+        self.rules.setdefault(rule_id, type(error))
+
+        region: dict[str, int] = {"startLine": error.line, "startColumn": error.column + 1}
+
+        if error.line_end is not None:
+            region["endLine"] = error.line_end
+
+        if error.column_end is not None:
+            region["endColumn"] = error.column_end + 1
+
+        result = {
+            "ruleId": rule_id,
+            "level": "error",
+            "message": {"text": error.msg},
+            "locations": [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": Path(error.filename or "").as_posix()},
+                        "region": region,
+                    }
+                }
+            ],
+            "properties": {"categories": list(error.categories)},
+        }
+
+        self.results += 1
+
+        return ("," if self.results > 1 else "") + to_json(result)
+
+    def finish(self) -> str:
+        rules = [
+            {
+                "id": rule_id,
+                "name": error.name or rule_id,
+                "properties": {"categories": list(error.categories)},
+            }
+            for rule_id, error in sorted(self.rules.items())
+        ]
+
+        driver = {
+            "name": "refurb",
+            "informationUri": REFURB_URI,
+            "version": metadata.version("refurb"),
+            "rules": rules,
+        }
+
+        invocation = {
+            "executionSuccessful": not self.notifications,
+            "toolExecutionNotifications": [
+                {"level": "error", "message": {"text": msg}} for msg in self.notifications
+            ],
+        }
+
+        run = to_json({"tool": {"driver": driver}, "invocations": [invocation]})
+
+        # Close the list of results, then add the rest of the run before closing everything else
+        return "]," + run[1:] + "]}"
@@ -0,0 +1,305 @@
+import json
+import socket
+from collections.abc import Sequence
+from contextlib import suppress
+from dataclasses import dataclass, field
+from itertools import chain
+from pathlib import Path
+
+from mypy.build import BuildResult, BuildSource, build
+from mypy.errors import CompileError
+from mypy.server.update import FineGrainedBuildManager
+
+from .cache import ResultCache, set_mypy_cache_dir
+from .changes import (
+    ChangedLines,
+    GitError,
+    filter_changed_files,
+    get_changed_lines,
+    is_in_changed_lines,
+)
+from .daemon import Request, Response, receive, send
+from .error import Error
+from .loader import load_checks
+from .main import (
+    format_compile_error,
+    format_errors,
+    get_mypy_options,
+    run_checks,
+    set_builtins_mypy_file,
+)
+from .settings import Settings, load_settings
+from .types import Checks
+
+FileStamp = tuple[int, int]
+
+# Settings which only make sense for a single run, and flags for them. `--low-memory` frees the
+# parts of the build that are needed for updating it, so it cannot be used either.
+UNSUPPORTED_SETTINGS = {
+    "timing_stats": "--timing-stats",
+    "trace_file": "--trace-file",
+    "profile": "--profile",
+    "max_memory": "--max-memory",
+    "low_memory": "--low-memory",
+    "shard": "--shard",
+}
+
+
+def get_unsupported_flags(settings: Settings) -> list[str]:
+    return [flag for name, flag in UNSUPPORTED_SETTINGS.items() if getattr(settings, name)]
+
+
+def get_file_stamps(files: list[BuildSource]) -> dict[str, FileStamp]:
+    stamps: dict[str, FileStamp] = {}
+
+    for file in files:
+        if file.path:
+            try:
+                stat = Path(file.path).stat()
+
+            except OSError:
+                continue
+
+            stamps[file.path] = (stat.st_mtime_ns, stat.st_size)
+
+    return stamps
+
+
+def get_build_modules(result: BuildResult) -> list[BuildSource]:
+    """
+    Get every module in the build which comes from a file, including the modules which were only
+    analyzed because they are imported by the files being checked.
+    """
+
+    return [BuildSource(state.path, state.id) for state in result.graph.values() if state.path]
+
+
+@dataclass
+class DaemonBuild:
+    key: str
+    result: BuildResult
+    manager: FineGrainedBuildManager
+
+    # The stamps of every module in the build (see `get_build_modules()`)
+    stamps: dict[str, FileStamp]
+
+    def get_changes(
+        self, files: list[BuildSource]
+    ) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+        """
+        Get the modules which were changed (or added) and the modules which were removed since the
+        last update, in the format expected by `FineGrainedBuildManager.update()`.
+        """
+
+        modules = get_build_modules(self.result)
+        stamps = get_file_stamps(modules)
+
+        changed: list[tuple[str, str]] = []
+        removed: list[tuple[str, str]] = []
+
+        for module in modules:
+            assert module.path
+
+            if module.path not in stamps:
+                removed.append((module.module, module.path))
+
+            elif stamps[module.path] != self.stamps.get(module.path):
+                changed.append((module.module, module.path))
+
+        for module, path in [(file.module, file.path) for file in files if file.path]:
+            state = self.result.graph.get(module)
+
+            if not state:
+                # Files which weren't in the build before are added to it
+                changed.append((module, path))
+
+            elif state.path != path:
+                # The module now comes from a different file (ie, a file with the same module name
+                # in another folder is being checked). It isn't marked as removed, since Mypy
+                # would drop the module from the build instead of updating it.
+                changed.append((module, path))
+
+        return changed, removed
+
+    def update_stamps(self) -> None:
+        self.stamps = get_file_stamps(get_build_modules(self.result))
+
+
+@dataclass
+class DaemonServer:
+    """
+    Keeps the Mypy build result and loaded checks in memory between checks. When the Mypy options
+    stay the same, Mypy's fine-grained incremental mode is used to only re-analyze the modules
+    which have changed since the last check (including imported modules which aren't checked),
+    and to add any files which weren't checked before to the build.
+    """
+
+    build: DaemonBuild | None = None
+    checks: dict[str, Checks] = field(default_factory=dict)
+
+    def get_checks(self, settings: Settings) -> Checks:
+        # Checks have the settings bound to them when they are loaded (see `load_checks()`), so a
+        # new set of checks is needed whenever the settings change. The files being checked are
+        # excluded since they change often (ie, when ran via pre-commit) and don't affect checks.
+        key = repr(
+            [
+                sorted(map(repr, value)) if isinstance(value, set) else value
+                for name, value in vars(settings).items()
+                if name not in {"files", "color"}
+            ]
+        )
+
+        if key not in self.checks:
+            self.checks[key] = load_checks(settings)
+
+        return self.checks[key]
+
+    def update_build(
+        self, settings: Settings
+    ) -> tuple[list[BuildSource], BuildResult] | list[str]:
+        mypy_options = get_mypy_options(settings)
+
+        if isinstance(mypy_options, list):
+            return mypy_options
+
+        files, opt = mypy_options
+
+        # The files being checked aren't part of the key, since they change often (ie, when ran
+        # via pre-commit). New files are added to the existing build instead.
+        key = repr((settings.mypy_args, opt.python_version))
+
+        if self.build and self.build.key == key:
+            self.build.manager.flush_cache()
+            self.build.manager.manager.fscache.flush()
+
+            changed, removed = self.build.get_changes(files)
+
+            if not changed and not removed:
+                return files, self.build.result
+
+            self.build.manager.update(changed, removed)
+            self.build.update_stamps()
+
+            # Files which couldn't be added are reported by doing a full build
+            if not self.build.manager.blocking_error and all(
+                file.module in self.build.result.graph for file in files
+            ):
+                return files, self.build.result
+
+        set_mypy_cache_dir(opt)
+
+        try:
+            result = build(files, options=opt)
+
+        except CompileError as e:
+            self.build = None
+
+            return format_compile_error(e)
+
+        self.build = DaemonBuild(key, result, FineGrainedBuildManager(result), {})
+        self.build.update_stamps()
+
+        return files, result
+
+    def check(self, settings: Settings) -> Sequence[Error | str]:
+        if unsupported := get_unsupported_flags(settings):
+            flags = ", ".join(f'"{flag}"' for flag in unsupported)
+
+            return [f"refurb: {flags} cannot be used with the daemon"]
+
+        changes: ChangedLines | None = None
+
+        if settings.changed_since or settings.staged:
+            try:
+                changes = get_changed_lines(settings)
+
+            except GitError as ex:
+                return [str(ex)]
+
+        build_result = self.update_build(settings)
+
+        if isinstance(build_result, list):
+            return build_result
+
+        files, result = build_result
+
+        set_builtins_mypy_file(result)
+
+        checks = self.get_checks(settings)
+
+        cache = (
+            ResultCache.create(checks, settings) if settings.cache and not settings.debug else None
+        )
+
+        if changes is not None:
+            # Every file is kept in the build so that it doesn't have to be rebuilt when a
+            # different set of files is changed, but only the changed files are checked.
+            files = filter_changed_files(files, changes)
+
+        errors = chain.from_iterable(run_checks(files, result, checks, settings, cache))
+
+        if changes is None:
+            return list(errors)
+
+        return [error for error in errors if is_in_changed_lines(error, changes)]
+
+    def handle(self, request: Request | None) -> Response:
+        match request:
+            case {"command": "check", "args": list(args), "color": bool(color)}:
+                try:
+                    settings = load_settings(args)
+                    settings.color = color
+
+                    errors = self.check(settings)
+
+                except (ValueError, TypeError) as e:
+                    return {"output": str(e), "status": 1}
+
+                except Exception as e:  # noqa: BLE001
+                    # The build might be in a half updated state, so start over on the next check
+                    self.build = None
+
+                    return {"output": f"refurb: daemon error: {e!r}", "status": 1}
+
+                return {"output": format_errors(errors, settings), "status": 1 if errors else 0}
+
+            case {"command": "stop"}:
+                return {"output": "", "status": 0}
+
+        return {"output": "refurb: invalid daemon request", "status": 1}
+
+    def serve(self, socket_path: Path, warmup_args: list[str] | None = None) -> None:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(str(socket_path))
+            server.listen()
+
+            try:
+                # The server starts listening before the initial build so that clients can connect
+                # (and wait) while the build is still running.
+                if warmup_args:
+                    self.handle({"command": "check", "args": warmup_args, "color": False})
+
+                while True:
+                    conn, _ = server.accept()
+
+                    with conn:
+                        if not (data := receive(conn)):
+                            continue
+
+                        try:
+                            request = json.loads(data)
+
+                        except ValueError:
+                            request = None
+
+                        response = json.dumps(self.handle(request))
+
+                        # The client might have gone away before the response was sent
+                        with suppress(OSError):
+                            send(conn, response)
+
+                    if isinstance(request, dict) and request.get("command") == "stop":
+                        break
+
+            finally:
+                socket_path.unlink(missing_ok=True)
@@ -40,11 +40,25 @@ class Settings:
     config_file: str | None = None
     python_version: tuple[int, int] | None = None
     mypy_args: list[str] = field(default_factory=list)
-    format: Literal["text", "github"] | None = None
-    sort_by: Literal["filename", "error"] | None = None
+    format: Literal["text", "github", "jsonl", "sarif"] | None = None
+    sort_by: Literal["filename", "error", "none"] | None = None
     verbose: bool = False
     timing_stats: Path | None = None
+    trace_file: Path | None = None
+    trace_checks: bool = False
+    profile: Path | None = None
+    profile_files: str | None = None
+    max_memory: int | None = None
+    trace_memory: bool = False
+    low_memory: bool = False
     color: bool = True
+    jobs: int | None = None
+    cache: bool = False
+    changed_since: str | None = None
+    staged: bool = False
+    report_unused_noqa: bool = False
+    shard: tuple[int, int] | None = None
+    shard_results: Path | None = None
 
     def __post_init__(self) -> None:
         if self.enable_all and self.disable_all:
@@ -90,7 +104,21 @@ class Settings:
             sort_by=new.sort_by or old.sort_by,
             verbose=old.verbose or new.verbose,
             timing_stats=old.timing_stats or new.timing_stats,
+            trace_file=old.trace_file or new.trace_file,
+            trace_checks=old.trace_checks or new.trace_checks,
+            profile=old.profile or new.profile,
+            profile_files=old.profile_files or new.profile_files,
+            max_memory=new.max_memory or old.max_memory,
+            trace_memory=old.trace_memory or new.trace_memory,
+            low_memory=old.low_memory or new.low_memory,
             color=old.color and new.color,
+            jobs=new.jobs or old.jobs,
+            cache=old.cache or new.cache,
+            changed_since=new.changed_since or old.changed_since,
+            staged=old.staged or new.staged,
+            report_unused_noqa=old.report_unused_noqa or new.report_unused_noqa,
+            shard=new.shard or old.shard,
+            shard_results=new.shard_results or old.shard_results,
         )
 
     def get_python_version(self) -> tuple[int, int]:
@@ -126,20 +154,49 @@ def parse_python_version(version: str) -> tuple[int, int]:
     raise ValueError("refurb: version must be in form `x.y`")
 
 
-def validate_format(format: str) -> Literal["github", "text"]:
-    if format in {"github", "text"}:
+def validate_format(format: str) -> Literal["text", "github", "jsonl", "sarif"]:
+    if format in {"text", "github", "jsonl", "sarif"}:
         return format  # type: ignore
 
     raise ValueError(f'refurb: "{format}" is not a valid format')
 
 
-def validate_sort_by(sort_by: str) -> Literal["filename", "error"]:
-    if sort_by in {"filename", "error"}:
+def validate_sort_by(sort_by: str) -> Literal["filename", "error", "none"]:
+    if sort_by in {"filename", "error", "none"}:
         return sort_by  # type: ignore
 
     raise ValueError(f'refurb: cannot sort by "{sort_by}"')
 
 
+def parse_jobs(jobs: str) -> int:
+    if jobs.isnumeric() and int(jobs) > 0:
+        return int(jobs)
+
+    raise ValueError("refurb: jobs must be a positive integer")
+
+
+MEMORY_SIZE = re.compile(r"(\d+(?:\.\d+)?)\s*([KMG]?)(?:i?B)?", re.IGNORECASE)
+
+MEMORY_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def parse_memory_size(size: str) -> int:
+    if (match := MEMORY_SIZE.fullmatch(size.strip())) and float(match[1]) > 0:
+        return int(float(match[1]) * MEMORY_UNITS[match[2].upper()])
+
+    raise ValueError('refurb: max memory must be a size, such as "512M" or "2G"')
+
+
+SHARD_REGEX = re.compile(r"(\d+)/(\d+)")
+
+
+def parse_shard(shard: str) -> tuple[int, int]:
+    if (match := SHARD_REGEX.fullmatch(shard)) and 1 <= int(match[1]) <= int(match[2]):
+        return int(match[1]), int(match[2])
+
+    raise ValueError('refurb: shard must be in the form "i/N", where i is between 1 and N')
+
+
 def parse_amend_error(err: str, path: Path) -> ErrorClassifier:
     classifier = parse_error_classifier(err)
 
@@ -175,6 +232,7 @@ def pop_type(ty: type[T], type_name: str = "") -> Callable[..., T]:  # type: ign
 pop_list = pop_type(list)
 pop_bool = pop_type(bool)
 pop_str = pop_type(str, "string")
+pop_int = pop_type(int, "integer")
 
 
 def parse_config_file(contents: str) -> Settings:
@@ -195,6 +253,9 @@ def parse_config_file(contents: str) -> Settings:
     settings.disable_all = pop_bool(config, "disable_all")
     settings.enable_all = pop_bool(config, "enable_all")
     settings.color = pop_bool(config, "color", default=True)
+    settings.cache = pop_bool(config, "cache")
+    settings.report_unused_noqa = pop_bool(config, "report_unused_noqa")
+    settings.low_memory = pop_bool(config, "low_memory")
 
     enable = pop_list(config, "enable")
     disable = pop_list(config, "disable")
@@ -219,6 +280,12 @@ def parse_config_file(contents: str) -> Settings:
     if "sort_by" in config:
         settings.sort_by = validate_sort_by(pop_str(config, "sort_by"))
 
+    if "jobs" in config:
+        settings.jobs = parse_jobs(str(pop_int(config, "jobs")))
+
+    if "max_memory" in config:
+        settings.max_memory = parse_memory_size(pop_str(config, "max_memory"))
+
     amendments: list[dict[str, Any]] = config.pop("amend", [])  # type: ignore
 
     if not isinstance(amendments, list):
@@ -320,9 +387,51 @@ def parse_command_line_args(args: list[str]) -> Settings:
         elif arg == "--timing-stats":
             settings.timing_stats = Path(get_next_arg(arg, iargs))
 
+        elif arg == "--trace-file":
+            settings.trace_file = Path(get_next_arg(arg, iargs))
+
+        elif arg == "--trace-checks":
+            settings.trace_checks = True
+
+        elif arg == "--profile":
+            settings.profile = Path(get_next_arg(arg, iargs))
+
+        elif arg == "--profile-files":
+            settings.profile_files = get_next_arg(arg, iargs)
+
+        elif arg == "--max-memory":
+            settings.max_memory = parse_memory_size(get_next_arg(arg, iargs))
+
+        elif arg == "--trace-memory":
+            settings.trace_memory = True
+
+        elif arg == "--low-memory":
+            settings.low_memory = True
+
         elif arg == "--no-color":
             settings.color = False
 
+        elif arg == "--cache":
+            settings.cache = True
+
+        elif arg == "--jobs":
+            settings.jobs = parse_jobs(get_next_arg(arg, iargs))
+
+        elif arg == "--changed-since":
+            settings.changed_since = get_next_arg(arg, iargs)
+
+        elif arg == "--staged":
+            settings.staged = True
+
+        elif arg == "--report-unused-noqa":
+            settings.report_unused_noqa = True
+
+        elif arg == "--shard":
+            settings.shard = parse_shard(get_next_arg(arg, iargs))
+
+        elif arg == "--shard-results":
+            settings.shard_results = Path(get_next_arg(arg, iargs))
+
         elif arg == "--":
             settings.mypy_args = list(iargs)
 
@@ -335,6 +444,18 @@ def parse_command_line_args(args: list[str]) -> Settings:
         else:
             raise ValueError("refurb: argument cannot be empty")
 
+    if settings.trace_checks and not settings.trace_file:
+        raise ValueError('refurb: "--trace-checks" can only be used with "--trace-file"')
+
+    if settings.profile_files and not settings.profile:
+        raise ValueError('refurb: "--profile-files" can only be used with "--profile"')
+
+    if settings.trace_memory and not settings.timing_stats:
+        raise ValueError('refurb: "--trace-memory" can only be used with "--timing-stats"')
+
+    if settings.shard_results and not settings.shard:
+        raise ValueError('refurb: "--shard-results" can only be used with "--shard"')
+
     if len(args) > 1 and (settings.help or settings.version):
         msg = f"refurb: unexpected value before/after `{args[0]}`"
 
@@ -0,0 +1,147 @@
+"""
+Support for splitting a Refurb run across multiple machines. Each shard (see `--shard i/N`)
+checks a subset of the files and writes the errors it found to a result file, and the results
+of every shard are combined with `refurb merge`.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from operator import attrgetter
+from pathlib import Path
+
+from mypy.build import BuildSource
+
+from .cache import SerializedError, deserialize_error, serialize_error
+from .error import Error
+from .settings import Settings
+
+# Bumped whenever the format of the result files changes
+SHARD_RESULTS_VERSION = 1
+
+
+def get_shard_index(module: str, shards: int) -> int:
+    """
+    Get the (zero-based) shard that a module belongs to. A hash of the module name is used
+    instead of `hash()` since it must be the same on every machine and Python process.
+    """
+
+    digest = hashlib.sha256(module.encode()).digest()
+
+    return int.from_bytes(digest[:8], "big") % shards
+
+
+def get_shard_files(files: list[BuildSource], shard: tuple[int, int]) -> list[BuildSource]:
+    index, shards = shard
+
+    return [file for file in files if get_shard_index(file.module, shards) == index - 1]
+
+
+def get_default_shard_results_path(shard: tuple[int, int]) -> Path:
+    return Path(f"refurb-shard-{shard[0]}-of-{shard[1]}.json")
+
+
+def serialize_shard_error(error: Error | str) -> SerializedError | str:
+    if isinstance(error, str):
+        return error
+
+    return serialize_error(error) | {"filename": error.filename}
+
+
+def deserialize_shard_error(error: SerializedError | str) -> Error | str:
+    if isinstance(error, str):
+        return error
+
+    filename = error["filename"]
+
+    return deserialize_error(error, None if filename is None else str(filename))
+
+
+def record_shard_results(
+    batches: Iterable[Iterable[Error | str]], settings: Settings
+) -> Iterator[list[Error | str]]:
+    """
+    Pass each batch of errors through as-is, writing all of them to the shard result file once
+    every batch has been consumed. The errors are serialized before being passed on, since
+    formatting an error (ie, adding color) modifies it.
+    """
+
+    assert settings.shard
+
+    errors: list[SerializedError | str] = []
+
+    for batch in batches:
+        batch_errors = list(batch)
+
+        errors.extend(serialize_shard_error(error) for error in batch_errors)
+
+        yield batch_errors
+
+    index, shards = settings.shard
+
+    data = {"version": SHARD_RESULTS_VERSION, "shard": index, "shards": shards, "errors": errors}
+
+    path = settings.shard_results or get_default_shard_results_path(settings.shard)
+
+    path.write_text(json.dumps(data, separators=(",", ":")), "utf8")
+
+
+@dataclass
+class ShardResults:
+    shard: int
+    shards: int
+    errors: list[Error | str]
+
+    @classmethod
+    def read(cls, path: Path) -> "ShardResults":
+        invalid = f'refurb: "{path}" is not a valid shard result file'
+
+        try:
+            data = json.loads(path.read_text("utf8"))
+
+        except OSError as ex:
+            raise ValueError(f'refurb: could not read "{path}"') from ex
+
+        except ValueError as ex:
+            raise ValueError(invalid) from ex
+
+        if not isinstance(data, dict) or data.get("version") != SHARD_RESULTS_VERSION:
+            raise ValueError(invalid)
+
+        try:
+            errors = [deserialize_shard_error(error) for error in data["errors"]]
+
+            return cls(int(data["shard"]), int(data["shards"]), errors)
+
+        except (ValueError, TypeError, KeyError, AttributeError, ImportError) as ex:
+            raise ValueError(invalid) from ex
+
+
+def read_shard_results(paths: list[Path]) -> list[Error | str]:
+    """
+    Read the shard result files at the given paths, returning the errors of every shard (in
+    shard order). Every shard of the run must be passed exactly once.
+    """
+
+    results = sorted((ShardResults.read(path) for path in paths), key=attrgetter("shard"))
+
+    if not results:
+        raise ValueError("refurb: no shard result files were passed")
+
+    shards = results[0].shards
+
+    if any(result.shards != shards for result in results):
+        raise ValueError("refurb: shard result files are from runs with a different shard count")
+
+    found = [result.shard for result in results]
+
+    if len(set(found)) != len(found):
+        raise ValueError("refurb: the same shard was passed more than once")
+
+    if missing := sorted(set(range(1, shards + 1)) - set(found)):
+        missing_shards = ", ".join(f"{shard}/{shards}" for shard in missing)
+
+        raise ValueError(f"refurb: missing results for shard(s) {missing_shards}")
+
+    return [error for result in results for error in result.errors]
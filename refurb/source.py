@@ -0,0 +1,154 @@
+"""
+A shared store for the source code of the files being checked. Mypy has already read every file
+it analyzed into its file system cache, so the source is taken from there instead of re-reading
+the file from disk. Mypy drops the decoded text of a module (`State.source`) once it is parsed, so
+only the source of files passed as text (see `get_build_source_file()`) can be used as-is.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from mypy.build import BuildResult, BuildSource
+from mypy.fscache import FileSystemCache
+from mypy.util import decode_python_encoding
+
+if TYPE_CHECKING:
+    from .analysis import AnalysisResult
+
+# Once the decoded sources take up more than this many bytes the least recently used files are
+# evicted. Evicted files are decoded again if they are needed later.
+MAX_SOURCE_STORE_SIZE_IN_BYTES = 32 * 1024 * 1024
+
+
+@dataclass
+class SourceFile:
+    text: str
+
+    # The offset of the start of each line (after the first one), built the first time a line is
+    # looked up. An array of ints is a lot smaller than a list of strings for each line.
+    line_offsets: array[int] | None = None
+
+    size: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.size = sys.getsizeof(self.text)
+
+    def get_line_offsets(self) -> array[int]:
+        if self.line_offsets is None:
+            offsets = array("I")
+
+            text = self.text
+            index = text.find("\n")
+
+            while index != -1:
+                offsets.append(index + 1)
+                index = text.find("\n", index + 1)
+
+            self.line_offsets = offsets
+            self.size += offsets.itemsize * len(offsets)
+
+        return self.line_offsets
+
+    def get_line(self, line: int) -> str:
+        """
+        Get the given line (starting at 1), without the trailing newline. An empty string is
+        returned for lines past the end of the file.
+        """
+
+        offsets = self.get_line_offsets()
+
+        if line < 1 or line > len(offsets) + 1:
+            return ""
+
+        start = offsets[line - 2] if line > 1 else 0
+        end = offsets[line - 1] - 1 if line <= len(offsets) else len(self.text)
+
+        return self.text[start:end].rstrip("\r")
+
+
+class SourceStore:
+    """
+    A bounded cache of decoded source files. Use `get_source()` to get the full text of a file,
+    and `get_line()` to get a single line (without the trailing newline).
+    """
+
+    def __init__(
+        self,
+        fscache: FileSystemCache | None = None,
+        max_size: int = MAX_SOURCE_STORE_SIZE_IN_BYTES,
+    ) -> None:
+        self.fscache = fscache or FileSystemCache()
+        self.max_size = max_size
+        self.size = 0
+        self.files: OrderedDict[str, SourceFile] = OrderedDict()
+
+    @classmethod
+    def from_result(cls, result: AnalysisResult) -> SourceStore:
+        if isinstance(result, BuildResult):
+            return cls(result.manager.fscache)
+
+        return cls(result.fscache)
+
+    def get_file(self, path: str) -> SourceFile:
+        if file := self.files.get(path):
+            self.files.move_to_end(path)
+
+            return file
+
+        file = self.files[path] = SourceFile(decode_python_encoding(self.fscache.read(path)))
+
+        self.size += file.size
+        self.evict()
+
+        return file
+
+    def evict(self) -> None:
+        # The most recently used file is never evicted, even if it is bigger than the max size
+        while self.size > self.max_size and len(self.files) > 1:
+            _, file = self.files.popitem(last=False)
+
+            self.size -= file.size
+
+    def get_source(self, path: str) -> str:
+        return self.get_file(path).text
+
+    def get_line(self, path: str, line: int) -> str:
+        """
+        Get the given line (starting at 1) of a file. An empty string is returned for lines past
+        the end of the file.
+        """
+
+        file = self.get_file(path)
+
+        size = file.size
+        text = file.get_line(line)
+
+        # Looking up a line for the first time builds the line offsets, which take up space
+        if file.size != size:
+            self.size += file.size - size
+            self.evict()
+
+        return text
+
+    def get_build_source_file(self, file: BuildSource) -> SourceFile | None:
+        """
+        Get the source of a file passed to Mypy, or `None` if it cannot be read. Files which were
+        passed as text (ie, when testing) aren't stored.
+        """
+
+        if file.text is not None:
+            return SourceFile(file.text)
+
+        if file.path is None:
+            return None
+
+        try:
+            return self.get_file(file.path)
+
+        except OSError:
+            return None
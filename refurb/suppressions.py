@@ -0,0 +1,180 @@
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .error import Error, ErrorCode
+from .settings import Settings
+from .source import SourceStore
+
+# Matches a `noqa` comment at the end of a line, ignoring any trailing whitespace
+NOQA_COMMENT = re.compile(r"""# noqa(: [^'"\n]*?)?[^\S\n]*$""", re.MULTILINE)
+
+
+@dataclass
+class NoqaComment:
+    column: int
+
+    # The error codes listed in the comment, or `None` if all errors are ignored (ie, `# noqa`)
+    codes: frozenset[str] | None
+
+    # The error codes which ignored at least one error
+    used: set[str] = field(default_factory=set)
+
+
+@dataclass
+class UnusedNoqa(Error):
+    """
+    A `noqa` comment which lists an error code that is enabled, but wasn't emitted on that line.
+    These comments can be removed, since they don't ignore anything.
+    """
+
+    name = "unused-noqa"
+    prefix = "NOQA"
+    code = 100
+
+
+def parse_noqa_comments(source: str) -> dict[int, NoqaComment]:
+    """
+    Build a map of line numbers to the `noqa` comment at the end of that line, if any. The whole
+    file is searched at once, so files without any `noqa` comments are cheap to index.
+    """
+
+    comments: dict[int, NoqaComment] = {}
+
+    lineno = 1
+    line_start = 0
+
+    for comment in NOQA_COMMENT.finditer(source):
+        start = comment.start()
+
+        lineno += source.count("\n", line_start, start)
+        line_start = source.rfind("\n", 0, start) + 1
+
+        codes = comment.group(1)
+
+        comments[lineno] = NoqaComment(
+            column=start - line_start,
+            codes=frozenset(codes[2:].replace(",", " ").split(" ")) if codes else None,
+        )
+
+    return comments
+
+
+class Suppressions:
+    """
+    An index of the errors ignored via `noqa` comments, `--ignore`, or `amend` sections in the
+    config file. The index for a file is built the first time an error is checked against that
+    file, so that checking whether an error is ignored doesn't have to re-read the file or
+    re-resolve the ignore paths for each error.
+    """
+
+    def __init__(self, settings: Settings, sources: SourceStore | None = None) -> None:
+        self.sources = sources or SourceStore()
+
+        config_root = Path(settings.config_file).parent if settings.config_file else Path()
+
+        # Ignores without a path apply to every file. The checks for these errors aren't loaded,
+        # but errors which don't come from a check (ie, `NOQA100`) still need to be ignored.
+        self.amend_rules: dict[Path | None, tuple[set[str], set[str]]] = {}
+        self.noqa_comments: dict[str, dict[int, NoqaComment]] = {}
+        self.amended: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
+
+        for ignore in settings.ignore:
+            path = (config_root / ignore.path).resolve() if ignore.path else None
+
+            codes, categories = self.amend_rules.setdefault(path, (set(), set()))
+
+            if isinstance(ignore, ErrorCode):
+                codes.add(str(ignore))
+            else:
+                categories.add(ignore.value)
+
+    def get_noqa_comments(self, filename: str) -> dict[int, NoqaComment]:
+        if (comments := self.noqa_comments.get(filename)) is None:
+            source = self.sources.get_source(filename)
+
+            comments = self.noqa_comments[filename] = parse_noqa_comments(source)
+
+        return comments
+
+    def get_amended(self, filename: str) -> tuple[frozenset[str], frozenset[str]]:
+        """
+        Get the error codes and categories which are ignored for the given file.
+        """
+
+        if amended := self.amended.get(filename):
+            return amended
+
+        path = Path(filename).resolve()
+
+        ignored_codes: set[str] = set()
+        ignored_categories: set[str] = set()
+
+        for rule_path, (codes, categories) in self.amend_rules.items():
+            if not rule_path or path.is_relative_to(rule_path):
+                ignored_codes |= codes
+                ignored_categories |= categories
+
+        amended = self.amended[filename] = (
+            frozenset(ignored_codes),
+            frozenset(ignored_categories),
+        )
+
+        return amended
+
+    def is_ignored_via_comment(self, error: Error) -> bool:
+        assert error.filename
+
+        comment = self.get_noqa_comments(error.filename).get(error.line)
+
+        if not comment:
+            return False
+
+        code = f"{error.prefix}{error.code}"
+
+        if comment.codes is None or code in comment.codes:
+            comment.used.add(code)
+
+            return True
+
+        return False
+
+    def is_ignored_via_amend(self, error: Error) -> bool:
+        assert error.filename
+
+        codes, categories = self.get_amended(error.filename)
+
+        return f"{error.prefix}{error.code}" in codes or not categories.isdisjoint(
+            error.categories
+        )
+
+    def should_ignore_error(self, error: Error | str) -> bool:
+        if isinstance(error, str):
+            return False
+
+        return (
+            not error.filename
+            or self.is_ignored_via_comment(error)
+            or self.is_ignored_via_amend(error)
+        )
+
+    def get_unused_noqa_errors(self, filename: str, enabled: set[str]) -> list[Error]:
+        """
+        Get an error for each `noqa` comment in the given file which lists enabled error codes
+        that weren't ignored. This must be called after all the errors for the file have been
+        checked with `should_ignore_error()`. Plain `noqa` comments are never reported since they
+        are shared with other linters.
+        """
+
+        errors: list[Error] = []
+
+        for line, comment in self.get_noqa_comments(filename).items():
+            if comment.codes is None:
+                continue
+
+            if unused := sorted((comment.codes & enabled) - comment.used):
+                msg = f"Unused `noqa` code(s): {', '.join(unused)}"
+
+                errors.append(UnusedNoqa(line, comment.column, msg, filename))
+
+        return errors
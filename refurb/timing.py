@@ -0,0 +1,91 @@
+"""
+Stats which are collected while checking files when `--timing-stats` is used. Collecting these
+stats requires a slower visitor (see `build_visitor_class()`), so they are only collected when
+asked for.
+"""
+
+from dataclasses import dataclass, field
+from operator import itemgetter
+
+
+@dataclass
+class CheckStats:
+    time_in_ns: int = 0
+    calls: int = 0
+
+    # The number of errors emitted, before any of them are ignored via `noqa` comments and such
+    errors: int = 0
+
+    node_types: set[str] = field(default_factory=set)
+
+    def merge(self, other: "CheckStats") -> None:
+        self.time_in_ns += other.time_in_ns
+        self.calls += other.calls
+        self.errors += other.errors
+        self.node_types |= other.node_types
+
+
+@dataclass
+class VisitorStats:
+    """
+    The stats for a single file, keyed by the name of each check (ie, `FURB123`).
+    """
+
+    nodes_visited: int = 0
+    checks: dict[str, CheckStats] = field(default_factory=dict)
+
+    # The name, node type, and start and end time (see `time.perf_counter_ns()`) of each time a
+    # check was ran. Only recorded when `--trace-checks` is used.
+    spans: list[tuple[str, str, int, int]] | None = None
+
+
+@dataclass
+class TimingStats:
+    """
+    The stats for all of the files which were checked. Files which were loaded from the cache
+    only have their (zero) checking time recorded.
+    """
+
+    time_spent_checking_file_in_ms: dict[str, int] = field(default_factory=dict)
+    nodes_visited: dict[str, int] = field(default_factory=dict)
+    checks: dict[str, CheckStats] = field(default_factory=dict)
+
+    def add_file(self, module: str, elapsed: int, stats: VisitorStats | None) -> None:
+        self.time_spent_checking_file_in_ms[module] = elapsed
+
+        if not stats:
+            return
+
+        self.nodes_visited[module] = stats.nodes_visited
+
+        for name, check_stats in stats.checks.items():
+            if existing := self.checks.get(name):
+                existing.merge(check_stats)
+
+            else:
+                self.checks[name] = check_stats
+
+    def to_json(self) -> dict[str, object]:
+        checks = sorted(self.checks.items(), key=lambda item: item[1].time_in_ns, reverse=True)
+
+        return {
+            "refurb_time_spent_checking_file_in_ms": dict(
+                sorted(
+                    self.time_spent_checking_file_in_ms.items(),
+                    key=itemgetter(1),
+                    reverse=True,
+                )
+            ),
+            "refurb_nodes_visited_per_file": dict(
+                sorted(self.nodes_visited.items(), key=itemgetter(1), reverse=True)
+            ),
+            "refurb_checks": {
+                name: {
+                    "time_in_ms": round(stats.time_in_ns / 1_000_000, 3),
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "node_types": sorted(stats.node_types),
+                }
+                for name, stats in checks
+            },
+        }
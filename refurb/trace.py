@@ -0,0 +1,139 @@
+"""
+Export a timeline of a Refurb run using the Chrome trace event format, which can be opened in
+https://ui.perfetto.dev or `chrome://tracing`. The format is documented here:
+https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU
+"""
+
+import json
+import os
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from operator import itemgetter
+from pathlib import Path
+
+from mypy.build import BuildResult
+
+from .analysis import AnalysisResult
+from .error import AnalysisTier
+
+
+class Tracer:
+    """
+    Collects spans (complete events) for the trace file. All times are taken from
+    `time.perf_counter_ns()`, which uses a system-wide clock, meaning spans from the worker
+    processes (see `--jobs`) line up with the spans from the main process.
+    """
+
+    def __init__(self) -> None:
+        self.pid = os.getpid()
+        self.start_ns = time.perf_counter_ns()
+        self.events: list[dict[str, object]] = []
+        self.threads: set[int] = {self.pid}
+
+    def add_span(  # noqa: PLR0913
+        self,
+        name: str,
+        category: str,
+        start_ns: int,
+        end_ns: int,
+        *,
+        tid: int | None = None,
+        args: dict[str, object] | None = None,
+    ) -> None:
+        tid = tid or self.pid
+
+        self.threads.add(tid)
+
+        event: dict[str, object] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_ns - self.start_ns) / 1_000,
+            "dur": (end_ns - start_ns) / 1_000,
+            "pid": self.pid,
+            "tid": tid,
+        }
+
+        if args:
+            event["args"] = args
+
+        self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, category: str) -> Iterator[None]:
+        start = time.perf_counter_ns()
+
+        try:
+            yield
+
+        finally:
+            self.add_span(name, category, start, time.perf_counter_ns())
+
+    def add_mypy_spans(  # noqa: PLR0913, PLR0917
+        self,
+        result: AnalysisResult,
+        tier: AnalysisTier,
+        start_ns: int,
+        end_ns: int,
+        module_times_in_us: dict[str, int],
+    ) -> None:
+        """
+        Add a span for the Mypy build, split into the time spent loading (and parsing) the module
+        graph and the time spent processing it. Mypy only records the total time spent on each
+        module, not when it was processed, so the per-module times are added as args instead.
+        """
+
+        args: dict[str, object] = {"tier": tier.name.lower(), "modules": len(result.graph)}
+
+        if module_times_in_us:
+            args["time_spent_per_module_in_ms"] = {
+                module: us / 1_000
+                for module, us in sorted(
+                    module_times_in_us.items(), key=itemgetter(1), reverse=True
+                )
+            }
+
+        self.add_span("mypy", "mypy", start_ns, end_ns, args=args)
+
+        if not isinstance(result, BuildResult):
+            self.add_span("parse", "mypy", start_ns, end_ns)
+
+            return
+
+        graph_load_time_ns = int(result.manager.stats.get("graph_load_time", 0) * 1_000_000_000)
+        graph_loaded_ns = min(start_ns + graph_load_time_ns, end_ns)
+
+        self.add_span("load graph (parse)", "mypy", start_ns, graph_loaded_ns)
+
+        name = (
+            "semantic analysis"
+            if tier == AnalysisTier.SEMANTIC
+            else "semantic analysis and type checking"
+        )
+
+        self.add_span(name, "mypy", graph_loaded_ns, end_ns)
+
+    def write(self, path: Path) -> None:
+        metadata: list[dict[str, object]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": self.pid,
+                "tid": tid,
+                "args": {"name": "refurb" if tid == self.pid else f"worker {tid}"},
+            }
+            for tid in sorted(self.threads)
+        ]
+
+        data = {"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}
+
+        path.write_text(json.dumps(data, separators=(",", ":")))
+
+
+def trace_span(tracer: Tracer | None, name: str, category: str) -> AbstractContextManager[None]:
+    """
+    Same as `Tracer.span()`, but does nothing if tracing is disabled.
+    """
+
+    return tracer.span(name, category) if tracer else nullcontext()
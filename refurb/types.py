@@ -1,13 +1,52 @@
 from collections import defaultdict
 from collections.abc import Callable
 
-from mypy.nodes import MypyFile, Node
+from mypy.nodes import Context, MypyFile, Node, SymbolNode, TypeInfo
+from mypy.types import Type
 
 from refurb.error import Error
 from refurb.settings import Settings
+from refurb.source import SourceFile
 
 Check = Callable[[Node, list[Error]], None] | Callable[[Node, list[Error], Settings], None]
 
-Checks = defaultdict[type[Node], list[Check]]
+# Checks are normalized into this form when they are loaded (see `load_checks()`), meaning any
+# optional services such as `settings` are already bound.
+NormalizedCheck = Callable[[Node, list[Error]], None]
+
+Checks = defaultdict[type[Node], list[NormalizedCheck]]
 
 BUILTINS_MYPY_FILE: MypyFile
+
+# Caches for the helpers in `refurb/checks/common.py`, which are called for the same nodes by many
+# different checks. Mypy nodes can't be weakly referenced, so these are keyed by `id()`, and
+# the node (or `TypeInfo`) is stored alongside the result so that its ID can't be reused while it
+# is cached. The visitor clears these before each file is checked.
+MYPY_TYPE_CACHE: dict[int, tuple[Node, Type | SymbolNode | None]] = {}
+SUBCLASS_CACHE: dict[tuple[int, tuple[object, ...]], tuple[TypeInfo, bool]] = {}
+
+# The structural ID of each node (see `get_structural_id()`), and the IDs given out so far
+STRUCTURAL_ID_CACHE: dict[int, tuple[Node, int]] = {}
+STRUCTURAL_IDS: dict[tuple[object, ...], int] = {}
+
+# The nodes which have had their names indexed (see `get_name_read_count()`), along with the
+# positions of each name in the tree they were indexed as part of, and the range of positions
+# that the node covers in that tree.
+NAME_INDEX_CACHE: dict[int, tuple[Context, dict[str | None, list[int]], int, int]] = {}
+
+# The result of `stringify()` for each node
+STRINGIFY_CACHE: dict[int, tuple[Node, str]] = {}
+
+
+def clear_helper_caches() -> None:
+    MYPY_TYPE_CACHE.clear()
+    SUBCLASS_CACHE.clear()
+    STRUCTURAL_ID_CACHE.clear()
+    STRUCTURAL_IDS.clear()
+    NAME_INDEX_CACHE.clear()
+    STRINGIFY_CACHE.clear()
+
+
+# The source of the file being checked, which `stringify()` uses to take the source of a node
+# straight from the file. Set by `check_file()` while the file is being checked.
+CURRENT_FILE: SourceFile | None = None
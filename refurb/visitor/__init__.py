@@ -1,5 +1,5 @@
 from .mapping import METHOD_NODE_MAPPINGS
 from .traverser import TraverserVisitor
-from .visitor import RefurbVisitor
+from .visitor import RefurbVisitor, build_visitor_class
 
-__all__ = ("METHOD_NODE_MAPPINGS", "RefurbVisitor", "TraverserVisitor")
+__all__ = ("METHOD_NODE_MAPPINGS", "RefurbVisitor", "TraverserVisitor", "build_visitor_class")
@@ -0,0 +1,150 @@
+"""
+Dispatch tables, which allow the visitor to look up which checks to run for a node based on the
+dispatch keys the checks declare (see the `dispatch_*` fields on `Error`), instead of calling
+every check for that node type. Since the keys are only used to skip checks, a check must still
+match the node itself.
+"""
+
+from collections.abc import Callable, Sequence
+from typing import Generic, TypeVar
+
+from mypy.nodes import CallExpr, ComparisonExpr, MemberExpr, Node, OpExpr, RefExpr
+
+from refurb.error import AnalysisTier, Error
+from refurb.types import NormalizedCheck
+
+T = TypeVar("T")
+
+# Prepended to method names so that they don't clash with the full names of functions
+METHOD_KEY_PREFIX = "."
+
+
+def get_call_expr_keys(node: CallExpr) -> tuple[str, ...]:
+    callee = node.callee
+
+    if isinstance(callee, MemberExpr):
+        method = METHOD_KEY_PREFIX + callee.name
+
+        # Module attributes (ie, `os.getcwd`) also have a full name
+        return (callee.fullname, method) if callee.fullname else (method,)
+
+    if isinstance(callee, RefExpr) and callee.fullname:
+        return (callee.fullname,)
+
+    return ()
+
+
+def get_op_expr_keys(node: OpExpr) -> tuple[str, ...]:
+    return (node.op,)
+
+
+def get_comparison_expr_keys(node: ComparisonExpr) -> tuple[str, ...]:
+    return tuple(node.operators)
+
+
+NodeKeyGetter = Callable[[Node], tuple[str, ...]]
+
+NODE_KEY_GETTERS: dict[type[Node], NodeKeyGetter] = {
+    CallExpr: get_call_expr_keys,  # type: ignore[dict-item]
+    OpExpr: get_op_expr_keys,  # type: ignore[dict-item]
+    ComparisonExpr: get_comparison_expr_keys,  # type: ignore[dict-item]
+}
+
+
+def get_dispatch_keys(error: type[Error] | None, ty: type[Node]) -> frozenset[str] | None:
+    """
+    Get the dispatch keys the given error class declares for a node type, or `None` if the check
+    should be called for every node of that type.
+    """
+
+    if not error:
+        return None
+
+    if ty is CallExpr:
+        if error.dispatch_callees is not None and error.tier == AnalysisTier.SYNTAX:
+            raise TypeError(
+                f'"{error.prefix}{error.code}" uses `dispatch_callees`, which needs at least '
+                "`AnalysisTier.SEMANTIC`"
+            )
+
+        if error.dispatch_callees is error.dispatch_methods is None:
+            return None
+
+        methods = (METHOD_KEY_PREFIX + name for name in error.dispatch_methods or ())
+
+        return frozenset((*(error.dispatch_callees or ()), *methods))
+
+    if ty is OpExpr:
+        keys = error.dispatch_ops
+
+    elif ty is ComparisonExpr:
+        keys = error.dispatch_comparisons
+
+    else:
+        return None
+
+    return None if keys is None else frozenset(keys)
+
+
+class DispatchTable(Generic[T]):
+    """
+    A lookup table from dispatch keys to the items (ie, checks) that should run for nodes with
+    that key. The items are kept in the order they were passed in, and items without any keys
+    run for every node.
+    """
+
+    def __init__(
+        self, items: Sequence[tuple[T, frozenset[str] | None]], get_keys: NodeKeyGetter
+    ) -> None:
+        self.items = items
+        self.get_keys = get_keys
+        self.always = tuple(item for item, keys in items if keys is None)
+
+        all_keys = {key for _, keys in items if keys for key in keys}
+
+        self.by_key = {
+            key: tuple(item for item, keys in items if keys is None or key in keys)
+            for key in all_keys
+        }
+
+    def get(self, node: Node) -> tuple[T, ...]:
+        keys = self.get_keys(node)
+
+        if len(keys) == 1:
+            return self.by_key.get(keys[0], self.always)
+
+        matched = [key for key in keys if key in self.by_key]
+
+        if not matched:
+            return self.always
+
+        if len(matched) == 1:
+            return self.by_key[matched[0]]
+
+        return tuple(
+            item
+            for item, item_keys in self.items
+            if item_keys is None or not item_keys.isdisjoint(matched)
+        )
+
+
+def build_dispatch_table(
+    ty: type[Node], checks: Sequence[NormalizedCheck], items: Sequence[T]
+) -> DispatchTable[T] | None:
+    """
+    Build a dispatch table for the given checks (where `items[i]` is what is returned for
+    `checks[i]`), or `None` if none of the checks declare dispatch keys for the node type.
+    """
+
+    if not (get_keys := NODE_KEY_GETTERS.get(ty)):
+        return None
+
+    # Imported here since the loader imports the visitor
+    from refurb.loader import get_check_error_class  # noqa: PLC0415
+
+    keys = [get_dispatch_keys(get_check_error_class(check), ty) for check in checks]
+
+    if all(key is None for key in keys):
+        return None
+
+    return DispatchTable(list(zip(items, keys, strict=True)), get_keys)
@@ -122,6 +122,14 @@ from mypy.patterns import StarredPattern as StarredPattern
 from mypy.patterns import ValuePattern as ValuePattern
 from mypy.types import RequiredType as RequiredType
 
+from .mapping import METHOD_NODE_MAPPINGS
+
+# Used to skip `functools.singledispatch` for the common case of a node type that has a dedicated
+# visitor method. `visit_func` is excluded since `FuncItem` nodes are visited via their subclasses.
+VISITOR_METHOD_NAMES: dict[type[Context], str] = {
+    ty: name for name, ty in METHOD_NODE_MAPPINGS.items() if name != "visit_func"
+}
+
 
 class TraverserVisitor:
     """A parse tree visitor that traverses the parse tree during visiting.
@@ -132,6 +140,10 @@ class TraverserVisitor:
     traversal implementation.
     """
 
+    # When set, `accept()` queues nodes here instead of visiting them right away. This is used by
+    # `IterativeTraverserVisitor` to visit nodes without recursing.
+    pending: list[Context] | None = None
+
     def __init__(self) -> None:
         pass
 
@@ -145,7 +157,7 @@ class TraverserVisitor:
                 if init is not None:
                     accept(init, self)
             for arg in o.arguments:
-                self.visit_var(arg.variable)
+                accept(arg.variable, self)
         accept(o.body, self)
 
     def visit_mypy_file(self, o: MypyFile) -> None:
@@ -521,426 +533,484 @@ class TraverserVisitor:
             accept(v, self)
 
 
-@functools.singledispatch
+class IterativeTraverserVisitor(TraverserVisitor):
+    """A traverser which uses an explicit stack instead of recursing into child nodes.
+
+    Nodes are visited in the same order as `TraverserVisitor`, though this is only true for
+    visitor methods which do all of their work before visiting the child nodes (ie, they don't
+    do anything after calling `accept()` or the superclass method), since child nodes are queued
+    and visited after the visitor method returns. Deeply nested code can be visited without
+    hitting the recursion limit, and there is less function call overhead per node.
+    """
+
+    def accept(self, o: Context) -> None:
+        if (pending := self.pending) is not None:
+            pending.append(o)
+            return
+
+        self.pending = pending = []
+        stack = [o]
+
+        names = VISITOR_METHOD_NAMES
+
+        try:
+            while stack:
+                node = stack.pop()
+
+                # Same as `visit()`, but inlined since this is the hot path
+                if name := names.get(type(node)):
+                    getattr(self, name)(node)
+
+                else:
+                    dispatch(node, self)
+
+                if pending:
+                    # Children are pushed in reverse so that they are popped in the order they
+                    # were queued in.
+                    pending.reverse()
+                    stack += pending
+                    pending.clear()
+
+        finally:
+            self.pending = None
+
+
 def accept(node: Context, visitor: TraverserVisitor) -> None:
+    if (pending := visitor.pending) is not None:
+        pending.append(node)
+
+    else:
+        visit(node, visitor)
+
+
+def visit(node: Context, visitor: TraverserVisitor) -> None:
+    if name := VISITOR_METHOD_NAMES.get(type(node)):
+        getattr(visitor, name)(node)
+
+    else:
+        dispatch(node, visitor)
+
+
+@functools.singledispatch
+def dispatch(node: Context, visitor: TraverserVisitor) -> None:
     raise NotImplementedError(f"No `visit_*` overload available for `{type(node).__qualname__}`")
 
 
-@accept.register
+@dispatch.register
 def _(node: MypyFile, visitor: TraverserVisitor) -> None:
     return visitor.visit_mypy_file(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: Import, visitor: TraverserVisitor) -> None:
     return visitor.visit_import(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ImportFrom, visitor: TraverserVisitor) -> None:
     return visitor.visit_import_from(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ImportAll, visitor: TraverserVisitor) -> None:
     return visitor.visit_import_all(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: OverloadedFuncDef, visitor: TraverserVisitor) -> None:
     return visitor.visit_overloaded_func_def(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: FuncDef, visitor: TraverserVisitor) -> None:
     return visitor.visit_func_def(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: Decorator, visitor: TraverserVisitor) -> None:
     return visitor.visit_decorator(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: Var, visitor: TraverserVisitor) -> None:
     return visitor.visit_var(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ClassDef, visitor: TraverserVisitor) -> None:
     return visitor.visit_class_def(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: GlobalDecl, visitor: TraverserVisitor) -> None:
     return visitor.visit_global_decl(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: NonlocalDecl, visitor: TraverserVisitor) -> None:
     return visitor.visit_nonlocal_decl(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: Block, visitor: TraverserVisitor) -> None:
     return visitor.visit_block(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ExpressionStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_expression_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: AssignmentStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_assignment_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: OperatorAssignmentStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_operator_assignment_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: WhileStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_while_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ForStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_for_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ReturnStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_return_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: AssertStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_assert_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: DelStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_del_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: BreakStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_break_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ContinueStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_continue_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: PassStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_pass_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: IfStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_if_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: RaiseStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_raise_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: TryStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_try_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: WithStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_with_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: MatchStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_match_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: IntExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_int_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: StrExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_str_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: BytesExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_bytes_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: FloatExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_float_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ComplexExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_complex_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: EllipsisExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_ellipsis(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: StarExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_star_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: NameExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_name_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: MemberExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_member_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: CallExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_call_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: YieldFromExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_yield_from_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: YieldExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_yield_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: IndexExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_index_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: UnaryExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_unary_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: AssignmentExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_assignment_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: OpExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_op_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ComparisonExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_comparison_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: SliceExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_slice_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: CastExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_cast_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: AssertTypeExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_assert_type_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: RevealExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_reveal_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: SuperExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_super_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: LambdaExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_lambda_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ListExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_list_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: DictExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_dict_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: TupleExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_tuple_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: SetExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_set_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: GeneratorExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_generator_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ListComprehension, visitor: TraverserVisitor) -> None:
     return visitor.visit_list_comprehension(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: SetComprehension, visitor: TraverserVisitor) -> None:
     return visitor.visit_set_comprehension(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: DictionaryComprehension, visitor: TraverserVisitor) -> None:
     return visitor.visit_dictionary_comprehension(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ConditionalExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_conditional_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: TypeApplication, visitor: TraverserVisitor) -> None:
     return visitor.visit_type_application(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: TypeVarExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_type_var_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ParamSpecExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_paramspec_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: TypeVarTupleExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_type_var_tuple_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: TypeAliasExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_type_alias_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: TypeAliasStmt, visitor: TraverserVisitor) -> None:
     return visitor.visit_type_alias_stmt(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: NamedTupleExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_namedtuple_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: TypedDictExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_typeddict_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: EnumCallExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_enum_call_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: PromoteExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit__promote_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: NewTypeExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_newtype_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: AwaitExpr, visitor: TraverserVisitor) -> None:
     return visitor.visit_await_expr(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: TempNode, visitor: TraverserVisitor) -> None:
     return visitor.visit_temp_node(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: TypeAlias, visitor: TraverserVisitor) -> None:
     return visitor.visit_type_alias(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: PlaceholderNode, visitor: TraverserVisitor) -> None:
     return visitor.visit_placeholder_node(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: AsPattern, visitor: TraverserVisitor) -> None:
     return visitor.visit_as_pattern(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: OrPattern, visitor: TraverserVisitor) -> None:
     return visitor.visit_or_pattern(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ValuePattern, visitor: TraverserVisitor) -> None:
     return visitor.visit_value_pattern(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: SingletonPattern, visitor: TraverserVisitor) -> None:
     return visitor.visit_singleton_pattern(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: SequencePattern, visitor: TraverserVisitor) -> None:
     return visitor.visit_sequence_pattern(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: StarredPattern, visitor: TraverserVisitor) -> None:
     return visitor.visit_starred_pattern(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: MappingPattern, visitor: TraverserVisitor) -> None:
     return visitor.visit_mapping_pattern(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: ClassPattern, visitor: TraverserVisitor) -> None:
     return visitor.visit_class_pattern(node)
 
 
-@accept.register
+@dispatch.register
 def _(node: RequiredType, visitor: TraverserVisitor) -> None:
     return accept(node.item, visitor)
@@ -1,65 +1,196 @@
-from collections import defaultdict
+import time
 from collections.abc import Callable
 
 from mypy.nodes import CallExpr, Node
 
 from refurb.error import Error
 from refurb.settings import Settings
-from refurb.types import Check, Checks
+from refurb.timing import CheckStats, VisitorStats
+from refurb.types import Checks, NormalizedCheck, clear_helper_caches
 from refurb.visitor import TraverserVisitor
 
+from .dispatch import build_dispatch_table
 from .mapping import METHOD_NODE_MAPPINGS
+from .traverser import IterativeTraverserVisitor
 
 VisitorMethod = Callable[["RefurbVisitor", Node], None]
 
 
-def build_visitor(name: str, ty: type[Node], checks: Checks) -> VisitorMethod:
+def build_visitor(name: str, ty: type[Node], checks: tuple[NormalizedCheck, ...]) -> VisitorMethod:
+    traverse = getattr(TraverserVisitor, name)
+    table = build_dispatch_table(ty, checks, checks)
+
     def inner(self: RefurbVisitor, o: Node) -> None:
-        for check in checks[ty]:
-            self.run_check(o, check)
+        errors = self.errors
+
+        for check in checks if table is None else table.get(o):
+            # Checks which recurse into deeply nested code (ie, long chains of binary operators)
+            # can still hit the recursion limit. When this happens only the failing check is
+            # skipped for this node instead of throwing away the results for the whole file, and
+            # the check is reported once the file is done (see `check_file()`).
+            # See: https://github.com/dosisod/refurb/issues/302
+            try:
+                check(o, errors)
 
-        getattr(TraverserVisitor, name)(self, o)
+            except RecursionError:  # noqa: PERF203
+                self.skipped_checks.add(check)
+
+        traverse(self, o)
 
     inner.__name__ = name
     inner.__annotations__["o"] = ty
     return inner
 
 
-class RefurbVisitor(TraverserVisitor):
+def build_call_expr_visitor(checks: tuple[NormalizedCheck, ...]) -> VisitorMethod:
+    table = build_dispatch_table(CallExpr, checks, checks)
+
+    def visit_call_expr(self: RefurbVisitor, o: CallExpr) -> None:
+        errors = self.errors
+
+        for check in checks if table is None else table.get(o):
+            try:
+                check(o, errors)
+
+            except RecursionError:  # noqa: PERF203
+                self.skipped_checks.add(check)
+
+        for arg in o.args:
+            self.accept(arg)
+
+        self.accept(o.callee)
+
+    return visit_call_expr  # type: ignore[return-value]
+
+
+def build_timed_visitor(
+    name: str, ty: type[Node], checks: tuple[NormalizedCheck, ...], *, count: bool = True
+) -> VisitorMethod:
+    """
+    Same as `build_visitor()`, but records how long each check takes, how many errors it emits,
+    and how many nodes are visited. Set `count` to `False` for visitor methods which are called
+    from other visitor methods so that a node isn't counted twice.
+    """
+
+    from refurb.loader import get_check_name  # noqa: PLC0415
+
+    traverse = getattr(RefurbVisitor, name)
+    node_type = ty.__name__
+    named_checks = tuple((get_check_name(check), check) for check in checks)
+    table = build_dispatch_table(ty, checks, named_checks)
+
+    def inner(self: RefurbVisitor, o: Node) -> None:
+        errors = self.errors
+        stats = self.stats
+
+        assert stats
+
+        spans = stats.spans
+
+        if count:
+            stats.nodes_visited += 1
+
+        for check_name, check in named_checks if table is None else table.get(o):
+            check_stats = stats.checks.get(check_name)
+
+            if not check_stats:
+                check_stats = stats.checks[check_name] = CheckStats()
+
+            error_count = len(errors)
+            start = time.perf_counter_ns()
+
+            try:
+                check(o, errors)
+
+            except RecursionError:  # noqa: PERF203
+                self.skipped_checks.add(check)
+
+            end = time.perf_counter_ns()
+
+            if spans is not None:
+                spans.append((check_name, node_type, start, end))
+
+            check_stats.time_in_ns += end - start
+            check_stats.calls += 1
+            check_stats.errors += len(errors) - error_count
+            check_stats.node_types.add(node_type)
+
+        traverse(self, o)
+
+    inner.__name__ = name
+    inner.__annotations__["o"] = ty
+    return inner
+
+
+class RefurbVisitor(IterativeTraverserVisitor):
+    """
+    The base visitor class. Use `build_visitor_class()` to create a visitor class which runs a
+    given set of checks.
+    """
+
     errors: list[Error]
     settings: Settings
+    checks: Checks
+
+    # The checks which hit the recursion limit on at least one node, see `build_visitor()`
+    skipped_checks: set[NormalizedCheck]
+
+    # Only set for visitor classes built with `timed=True`
+    timed: bool = False
+    stats: VisitorStats | None
 
-    _dont_build = ("visit_call_expr",)
+    def __init__(self, checks: Checks, settings: Settings) -> None:
+        # A new visitor is created for every file, so anything cached for the last file is dropped
+        clear_helper_caches()
 
-    def __init__(self, checks: defaultdict[type[Node], list[Check]], settings: Settings) -> None:
         self.errors = []
+        self.skipped_checks = set()
         self.checks = checks
         self.settings = settings
-
-        types = set(self.checks.keys())
-
-        for name, type in METHOD_NODE_MAPPINGS.items():
-            if type in types and name not in self._dont_build:
-                func = build_visitor(name, type, self.checks)
-
-                setattr(self, name, func.__get__(self))
+        self.stats = (
+            VisitorStats(spans=[] if settings.trace_checks else None) if self.timed else None
+        )
 
     def visit_call_expr(self, o: CallExpr) -> None:
-        for check in self.checks[CallExpr]:
-            self.run_check(o, check)
-
         for arg in o.args:
             self.accept(arg)
 
         self.accept(o.callee)
 
-    def run_check(self, node: Node, check: Check) -> None:
-        # Hack: use the type annotations to check if the function takes 2 or
-        # 3 arguments. There is an extra field for return types, hence why we
-        # use 4.
 
-        if len(check.__annotations__) == 4:
-            check(node, self.errors, self.settings)  # type: ignore
+def build_visitor_class(checks: Checks, *, timed: bool = False) -> type[RefurbVisitor]:
+    """
+    Create a `RefurbVisitor` subclass with a visitor method for each node type that has checks.
+    This is done once per set of checks (as opposed to once per file) so that creating a visitor
+    is cheap, and the checks are expected to already be normalized (see `load_checks()`) so that
+    no reflection is needed when running a check.
+
+    Checks which declare dispatch keys (see `Error.dispatch_callees` and friends) are only ran on
+    nodes which match one of their keys, which is decided with a dict lookup per node.
+
+    When `timed` is set every node type gets a visitor method which records stats about the
+    checks and nodes it visits (see `VisitorStats`). This has a noticeable overhead, so the
+    default visitor class doesn't do any of this.
+    """
+
+    methods: dict[str, VisitorMethod] = {}
+
+    if timed:
+        for name, ty in METHOD_NODE_MAPPINGS.items():
+            # `FuncItem` is not a concrete node type, it is visited via `visit_func_def()` and
+            # `visit_lambda_expr()`, which are already counted.
+            count = name != "visit_func"
+
+            methods[name] = build_timed_visitor(name, ty, tuple(checks.get(ty, ())), count=count)
+
+        return type("RefurbVisitor", (RefurbVisitor,), methods | {"timed": True})
+
+    for name, ty in METHOD_NODE_MAPPINGS.items():
+        if node_checks := tuple(checks.get(ty, ())):
+            if ty is CallExpr:
+                methods[name] = build_call_expr_visitor(node_checks)
+
+            else:
+                methods[name] = build_visitor(name, ty, node_checks)
 
-        else:
-            check(node, self.errors)  # type: ignore
+    return type("RefurbVisitor", (RefurbVisitor,), methods)
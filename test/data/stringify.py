@@ -30,3 +30,11 @@ _ = str(f"{123}\n")
 # wont trigger fstring stringify code
 _ = str("".join([""]))
 _ = str("".join(["", 1]))  # type: ignore
+
+# use the formatting from the source when possible
+_ = str('single quotes')
+_ = str(  "extra spaces"  )
+_ = str("ünïcödé")
+_ = str(
+    "multiple lines"
+)
@@ -0,0 +1,6 @@
+from datetime import datetime
+
+# these should not match, since `fromisoformat()` only supports the "Z" suffix in 3.11+
+
+datetime.fromisoformat("2024-02-15T00:00:00.000000Z".replace("Z", "+00:00"))
+datetime.fromisoformat("2024-02-15T00:00:00.000000Z"[:-1] + "+00:00")
@@ -0,0 +1,22 @@
+import pytest
+from mypy.build import BuildSource
+from mypy.errors import CompileError
+from mypy.nodes import ExpressionStmt
+from mypy.options import Options
+
+from refurb.analysis import parse_files
+
+
+def test_files_are_parsed_without_being_analyzed() -> None:
+    result = parse_files([BuildSource(None, "mod", text="x = 1\nprint(x)\n")], Options())
+
+    module = result.graph["mod"]
+
+    assert not module.dependencies
+    assert len(module.tree.defs) == 2
+    assert isinstance(module.tree.defs[1], ExpressionStmt)
+
+
+def test_syntax_errors_are_raised_when_parsing() -> None:
+    with pytest.raises(CompileError, match="was never closed"):
+        parse_files([BuildSource(None, "mod", text="print(\n")], Options())
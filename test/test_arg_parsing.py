@@ -605,6 +605,8 @@ def test_parse_empty_config_file() -> None:
 
 def test_parse_format_flag() -> None:
     assert parse_args(["--format", "github"]) == Settings(format="github")
+    assert parse_args(["--format", "jsonl"]) == Settings(format="jsonl")
+    assert parse_args(["--format", "sarif"]) == Settings(format="sarif")
 
 
 def test_check_format_must_be_valid() -> None:
@@ -673,6 +675,36 @@ def test_parse_timing_stats_flag_without_arg_is_an_error() -> None:
         parse_args(["--timing-stats"])
 
 
+def test_parse_trace_file_flags() -> None:
+    assert parse_args(["--trace-file", "file"]) == Settings(trace_file=Path("file"))
+
+    assert parse_args(["--trace-file", "file", "--trace-checks"]) == Settings(
+        trace_file=Path("file"), trace_checks=True
+    )
+
+
+def test_trace_checks_flag_without_trace_file_is_an_error() -> None:
+    msg = 'refurb: "--trace-checks" can only be used with "--trace-file"'
+
+    with pytest.raises(ValueError, match=msg):
+        parse_args(["--trace-checks"])
+
+
+def test_parse_profile_flags() -> None:
+    assert parse_args(["--profile", "folder"]) == Settings(profile=Path("folder"))
+
+    assert parse_args(["--profile", "folder", "--profile-files", "src/*.py"]) == Settings(
+        profile=Path("folder"), profile_files="src/*.py"
+    )
+
+
+def test_profile_files_flag_without_profile_is_an_error() -> None:
+    msg = 'refurb: "--profile-files" can only be used with "--profile"'
+
+    with pytest.raises(ValueError, match=msg):
+        parse_args(["--profile-files", "*.py"])
+
+
 def test_parse_no_color_flag() -> None:
     assert parse_args(["--no-color"]) == Settings(color=False)
 
@@ -682,3 +714,145 @@ def test_no_color_env_var_disables_color() -> None:
         settings = Settings()
 
         assert not settings.color
+
+
+def test_parse_jobs_flag() -> None:
+    assert parse_args(["--jobs", "4"]) == Settings(jobs=4)
+
+
+def test_parse_invalid_jobs_flag_will_fail() -> None:
+    for jobs in ("0", "-1", "x", "1.5"):
+        with pytest.raises(ValueError, match="refurb: jobs must be a positive integer"):
+            parse_args(["--jobs", jobs])
+
+
+def test_parse_jobs_in_config_file() -> None:
+    contents = """\
+[tool.refurb]
+jobs = 8
+"""
+
+    assert parse_config_file(contents) == Settings(jobs=8)
+
+
+def test_cli_jobs_flag_overrides_config_file() -> None:
+    config = Settings(jobs=8)
+    cli = parse_args(["--jobs", "2"])
+
+    assert Settings.merge(config, cli).jobs == 2
+    assert Settings.merge(config, Settings()).jobs == 8
+
+
+def test_parse_max_memory_flag() -> None:
+    sizes = {
+        "100": 100,
+        "512K": 512 * 1024,
+        "512M": 512 * 1024**2,
+        "2g": 2 * 1024**3,
+        "1.5GiB": int(1.5 * 1024**3),
+        "64 MB": 64 * 1024**2,
+    }
+
+    for size, expected in sizes.items():
+        assert parse_args(["--max-memory", size]) == Settings(max_memory=expected)
+
+
+def test_parse_invalid_max_memory_flag_will_fail() -> None:
+    for size in ("0", "-1G", "x", "2T", ""):
+        with pytest.raises(ValueError, match="refurb: max memory must be a size"):
+            parse_args(["--max-memory", size])
+
+
+def test_parse_max_memory_in_config_file() -> None:
+    contents = """\
+[tool.refurb]
+max_memory = "1G"
+"""
+
+    assert parse_config_file(contents) == Settings(max_memory=1024**3)
+
+
+def test_parse_trace_memory_flag() -> None:
+    assert parse_args(["--timing-stats", "file", "--trace-memory"]) == Settings(
+        timing_stats=Path("file"), trace_memory=True
+    )
+
+
+def test_trace_memory_flag_without_timing_stats_is_an_error() -> None:
+    msg = 'refurb: "--trace-memory" can only be used with "--timing-stats"'
+
+    with pytest.raises(ValueError, match=msg):
+        parse_args(["--trace-memory"])
+
+
+def test_parse_cache_flag() -> None:
+    assert parse_args(["--cache"]) == Settings(cache=True)
+
+
+def test_parse_cache_in_config_file() -> None:
+    contents = """\
+[tool.refurb]
+cache = true
+"""
+
+    assert parse_config_file(contents) == Settings(cache=True)
+
+
+def test_parse_changed_since_flag() -> None:
+    assert parse_args(["--changed-since", "main"]) == Settings(changed_since="main")
+
+
+def test_parse_staged_flag() -> None:
+    assert parse_args(["--staged"]) == Settings(staged=True)
+
+
+def test_changed_since_flag_requires_ref() -> None:
+    with pytest.raises(ValueError, match='refurb: missing argument after "--changed-since"'):
+        parse_args(["--changed-since"])
+
+
+def test_parse_low_memory_flag() -> None:
+    assert parse_args(["--low-memory"]) == Settings(low_memory=True)
+
+
+def test_parse_low_memory_in_config_file() -> None:
+    contents = """\
+[tool.refurb]
+low_memory = true
+"""
+
+    assert parse_config_file(contents) == Settings(low_memory=True)
+
+
+def test_parse_report_unused_noqa_flag() -> None:
+    assert parse_args(["--report-unused-noqa"]) == Settings(report_unused_noqa=True)
+
+
+def test_parse_report_unused_noqa_in_config_file() -> None:
+    contents = """\
+[tool.refurb]
+report_unused_noqa = true
+"""
+
+    assert parse_config_file(contents) == Settings(report_unused_noqa=True)
+
+
+def test_parse_shard_flags() -> None:
+    assert parse_args(["--shard", "2/8"]) == Settings(shard=(2, 8))
+
+    assert parse_args(["--shard", "1/1", "--shard-results", "file"]) == Settings(
+        shard=(1, 1), shard_results=Path("file")
+    )
+
+
+def test_parse_invalid_shard_flag_will_fail() -> None:
+    for shard in ("0/8", "9/8", "1/0", "1", "a/b", "-1/2", ""):
+        with pytest.raises(ValueError, match='refurb: shard must be in the form "i/N"'):
+            parse_args(["--shard", shard])
+
+
+def test_shard_results_flag_without_shard_is_an_error() -> None:
+    msg = 'refurb: "--shard-results" can only be used with "--shard"'
+
+    with pytest.raises(ValueError, match=msg):
+        parse_args(["--shard-results", "file"])
@@ -0,0 +1,269 @@
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from mypy.build import BuildSource
+from mypy.nodes import CallExpr, IntExpr, Node
+
+from refurb.cache import (
+    ResultCache,
+    deserialize_error,
+    get_check_fingerprint,
+    serialize_error,
+    set_mypy_cache_dir,
+)
+from refurb.checks.builtin.no_del import ErrorInfo
+from refurb.error import Error
+from refurb.loader import get_check_name
+from refurb.main import get_mypy_options, main, run_refurb
+from refurb.settings import Settings
+from refurb.types import Checks
+from refurb.visitor import RefurbVisitor
+
+FILES = ["test/data/err_123.py", "test/data/err_131.py"]
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Iterator[Path]:
+    cache_dir = tmp_path / ".refurb_cache"
+
+    with patch("refurb.cache.CACHE_DIR", cache_dir):
+        yield cache_dir
+
+
+@pytest.fixture
+def mypy_cache_dir(tmp_path: Path) -> Iterator[Path]:
+    mypy_cache_dir = tmp_path / ".refurb_cache" / "mypy"
+
+    with patch("refurb.cache.MYPY_CACHE_DIR", mypy_cache_dir):
+        yield mypy_cache_dir
+
+
+def test_cached_results_are_identical_to_uncached_results(cache_dir: Path) -> None:
+    expected = run_refurb(Settings(files=FILES))
+
+    first = run_refurb(Settings(files=FILES, cache=True))
+
+    with patch.object(RefurbVisitor, "accept") as accept:
+        second = run_refurb(Settings(files=FILES, cache=True))
+
+    assert expected
+    assert first == second == expected
+    assert accept.call_count == 0
+    assert (cache_dir / ".gitignore").exists()
+    assert len(list(cache_dir.glob("*.json"))) == len(FILES)
+
+
+def test_cache_is_invalidated_when_settings_change(cache_dir: Path) -> None:
+    run_refurb(Settings(files=FILES, cache=True))
+
+    with patch.object(RefurbVisitor, "accept") as accept:
+        run_refurb(Settings(files=FILES, cache=True, python_version=(3, 8)))
+
+    assert accept.call_count == len(FILES)
+
+
+def test_cache_is_not_used_in_debug_mode(cache_dir: Path) -> None:
+    run_refurb(Settings(files=FILES, cache=True, debug=True))
+
+    assert not cache_dir.exists()
+
+
+def test_cache_hits_and_misses_are_added_to_timing_stats(cache_dir: Path, tmp_path: Path) -> None:
+    stats = tmp_path / "stats.json"
+
+    args = [*FILES, "--cache", "--timing-stats", str(stats)]
+
+    main(args)
+    assert json.loads(stats.read_text())["refurb_cache"] == {"hits": 0, "misses": 2}
+
+    main(args)
+    assert json.loads(stats.read_text())["refurb_cache"] == {"hits": 2, "misses": 0}
+
+
+def test_cached_files_are_not_added_to_trace_file(cache_dir: Path, tmp_path: Path) -> None:
+    trace_file = tmp_path / "trace.json"
+
+    args = [*FILES, "--cache", "--trace-file", str(trace_file)]
+
+    def get_file_spans() -> list[str]:
+        events = json.loads(trace_file.read_text())["traceEvents"]
+
+        return [event["name"] for event in events if event.get("cat") == "file"]
+
+    with patch("builtins.print"):
+        main(args)
+        assert get_file_spans() == FILES
+
+        main(args)
+        assert not get_file_spans()
+
+
+def test_corrupted_cache_entries_are_treated_as_misses(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path, "fingerprint")
+
+    (tmp_path / "bad.json").write_text("not json")
+    (tmp_path / "unknown.json").write_text('[{"type": "refurb.error:Oops"}]')
+
+    assert cache.get("bad", "file.py") is None
+    assert cache.get("unknown", "file.py") is None
+    assert cache.get("missing", "file.py") is None
+    assert cache.misses == 3
+
+
+def test_least_recently_used_entries_are_pruned(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path, "fingerprint")
+
+    error = ErrorInfo(line=1, column=2, msg="msg")
+
+    for i, key in enumerate(("a", "b", "c")):
+        cache.put(key, [error])
+        os.utime(cache.get_entry_path(key), (i, i))
+
+    assert cache.get("a", "file.py") == [
+        ErrorInfo(line=1, column=2, msg="msg", filename="file.py")
+    ]
+
+    entry_size = cache.get_entry_path("a").stat().st_size
+    cache.max_size = entry_size * 2
+
+    cache.prune()
+
+    assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["a", "c"]
+
+
+def test_serialize_error_round_trip() -> None:
+    error = ErrorInfo(line=1, column=2, msg="msg", line_end=3, column_end=4)
+
+    data = serialize_error(error)
+
+    assert data["type"] == "refurb.checks.builtin.no_del:ErrorInfo"
+    assert deserialize_error(data, "file.py") == ErrorInfo(
+        line=1, column=2, msg="msg", filename="file.py", line_end=3, column_end=4
+    )
+
+
+def test_only_error_types_can_be_deserialized() -> None:
+    data = serialize_error(ErrorInfo(line=1, column=2, msg="msg"))
+    data["type"] = "refurb.cache:ResultCache"
+
+    with pytest.raises(TypeError, match="is not an Error type"):
+        deserialize_error(data)
+
+
+def test_files_without_a_cache_key_are_always_checked(tmp_path: Path) -> None:
+    cache = ResultCache(tmp_path, "fingerprint")
+
+    @dataclass
+    class FakeBuildResult:
+        graph: dict[str, object]
+
+    result = FakeBuildResult(graph={"missing_file": object()})
+
+    assert not cache.get_key(BuildSource(None, "no_path"), result)  # type: ignore[arg-type]
+    assert not cache.get_key(BuildSource("x.py", "not_in_graph"), result)  # type: ignore[arg-type]
+    assert not cache.get_key(BuildSource("x.py", "missing_file"), result)  # type: ignore[arg-type]
+
+
+def test_check_fingerprint_includes_check_source() -> None:
+    def check(node: Node, errors: list[Error]) -> None:
+        pass
+
+    checks = Checks(list, {CallExpr: [check]})
+
+    fingerprint = get_check_fingerprint(checks)
+
+    with patch.object(check, "__module__", "not_a_real_module"):
+        assert get_check_fingerprint(checks) != fingerprint
+
+
+def test_mypy_cache_dir_depends_on_options(mypy_cache_dir: Path) -> None:
+    def get_cache_dir(settings: Settings, *, semantic_analysis_only: bool = False) -> Path:
+        mypy_options = get_mypy_options(settings)
+        assert isinstance(mypy_options, tuple)
+
+        opt = mypy_options[1]
+        opt.semantic_analysis_only = semantic_analysis_only
+        set_mypy_cache_dir(opt)
+
+        return Path(opt.cache_dir)
+
+    cache_dir = get_cache_dir(Settings(files=FILES))
+
+    assert cache_dir.parent == mypy_cache_dir
+    assert get_cache_dir(Settings(files=FILES)) == cache_dir
+    assert get_cache_dir(Settings(files=FILES, mypy_args=["--platform", "win32"])) != cache_dir
+    assert get_cache_dir(Settings(files=FILES), semantic_analysis_only=True) != cache_dir
+
+    user_cache_dir = mypy_cache_dir.parent / "user_cache"
+
+    mypy_args = ["--cache-dir", str(user_cache_dir)]
+
+    assert get_cache_dir(Settings(files=FILES, mypy_args=mypy_args)) == user_cache_dir
+
+
+def test_mypy_writes_to_refurb_cache_folder(mypy_cache_dir: Path) -> None:
+    run_refurb(Settings(files=FILES))
+
+    # Mypy only writes its own bookkeeping files since fine-grained mode disables the cache
+    [cache] = mypy_cache_dir.iterdir()
+
+    assert list(cache.glob("*/@plugins_snapshot.json"))
+
+
+def test_cache_is_invalidated_when_indirect_dependency_changes(
+    cache_dir: Path, tmp_path: Path
+) -> None:
+    a = tmp_path / "a.py"
+    b = tmp_path / "b.py"
+    c = tmp_path / "c.py"
+
+    a.write_text("from b import f\n\nx = f()\n\nif len(x) == 0:\n    pass\n")
+    b.write_text("from c import X\n\ndef f() -> X:\n    return X()\n")
+    c.write_text("X = list[int]\n")
+
+    settings = Settings(files=[str(a)], cache=True)
+
+    def get_codes() -> list[int]:
+        return [error.code for error in run_refurb(settings) if isinstance(error, Error)]
+
+    assert get_codes() == [115]
+    assert get_codes() == [115]
+
+    c.write_text("X = int\n")
+
+    assert not get_codes()
+
+
+def test_files_with_skipped_checks_are_not_cached(cache_dir: Path) -> None:
+    @dataclass
+    class ErrorInt(Error):
+        code = 999
+
+    def check(node: Node, errors: list[Error]) -> None:
+        assert isinstance(node, IntExpr)
+
+        if node.value == 1:
+            raise RecursionError
+
+        errors.append(ErrorInt(node.line, node.column, "int"))
+
+    checks = Checks(list, {IntExpr: [check]})
+
+    file = cache_dir.parent / "file.py"
+    file.write_text("x = 1\ny = 2\nz = 1\n", "utf8")
+
+    name = get_check_name(check)
+    msg = f'refurb: {name} hit the recursion limit in "{file}", some errors might be missing'
+
+    for _ in range(2):
+        with patch("refurb.main.load_checks", return_value=checks):
+            errors = run_refurb(Settings(files=[str(file)], cache=True))
+
+        assert [str(error) for error in errors] == [msg, f"{file}:2:5 [FURB999]: int"]
+
+    assert not list(cache_dir.glob("*.json"))
@@ -0,0 +1,189 @@
+import os
+import subprocess
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from mypy.build import BuildSource
+
+from refurb.changes import GitError, filter_changed_files, is_in_changed_lines, parse_diff, run_git
+from refurb.checks.readability.no_unnecessary_cast import ErrorInfo
+from refurb.main import run_mypy, run_refurb
+from refurb.server import DaemonServer
+from refurb.settings import Settings
+
+CODE = """\
+a = bool(True)
+b = bool(True)
+c = bool(True)
+"""
+
+
+GIT_USER = ["-c", "user.name=refurb", "-c", "user.email=refurb@localhost"]
+
+
+def git(*args: str) -> None:
+    subprocess.run(["git", *GIT_USER, *args], capture_output=True, check=True)  # noqa: S603, S607
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Iterator[Path]:
+    cwd = Path.cwd()
+    os.chdir(tmp_path)
+
+    try:
+        git("init", "-q")
+
+        (tmp_path / "changed.py").write_text(CODE)
+        (tmp_path / "unchanged.py").write_text(CODE)
+
+        git("add", ".")
+        git("commit", "-q", "-m", "initial commit")
+
+        yield tmp_path
+
+    finally:
+        os.chdir(cwd)
+
+
+def test_diff_is_parsed_into_changed_line_ranges(tmp_path: Path) -> None:
+    diff = """\
+diff --git a/x.py b/x.py
+--- a/x.py
++++ b/x.py
+@@ -1 +1 @@
+-a
++b
+@@ -5,2 +4,3 @@ def f():
+@@ -10,3 +11,0 @@
+diff --git a/removed.py b/removed.py
+--- a/removed.py
++++ /dev/null
+@@ -1,2 +0,0 @@
+"""
+
+    assert parse_diff(diff, tmp_path) == {tmp_path / "x.py": [(1, 1), (4, 6)]}
+
+
+def test_only_errors_in_changed_lines_are_reported(repo: Path) -> None:
+    (repo / "changed.py").write_text(CODE.replace("b = bool(True)", "b = bool(False)"))
+    (repo / "new.py").write_text("x = bool(True)\n")
+
+    git("add", "new.py")
+
+    with patch("refurb.main.run_mypy", wraps=run_mypy) as mypy:
+        errors = run_refurb(Settings(files=["."], changed_since="HEAD"))
+
+    assert [file.path for file in mypy.call_args.args[0]] == ["./changed.py", "./new.py"]
+
+    assert [str(error) for error in errors] == [
+        "./changed.py:2:5 [FURB123]: Replace `bool(False)` with `False`",
+        "./new.py:1:5 [FURB123]: Replace `bool(True)` with `True`",
+    ]
+
+
+@pytest.mark.parametrize("config", ["diff.noprefix=true", "diff.mnemonicPrefix=true"])
+def test_diff_prefix_config_is_ignored(repo: Path, config: str) -> None:
+    key, value = config.split("=")
+    git("config", key, value)
+
+    (repo / "changed.py").write_text(CODE.replace("b = bool(True)", "b = bool(False)"))
+
+    errors = run_refurb(Settings(files=["."], changed_since="HEAD"))
+
+    assert [str(error) for error in errors] == [
+        "./changed.py:2:5 [FURB123]: Replace `bool(False)` with `False`",
+    ]
+
+
+def test_file_names_with_spaces_are_supported(repo: Path) -> None:
+    (repo / "with space.py").write_text("x = bool(True)\n")
+
+    git("add", "with space.py")
+
+    errors = run_refurb(Settings(files=["."], changed_since="HEAD"))
+
+    assert [str(error) for error in errors] == [
+        "./with space.py:1:5 [FURB123]: Replace `bool(True)` with `True`",
+    ]
+
+
+def test_only_staged_lines_are_reported(repo: Path) -> None:
+    (repo / "changed.py").write_text(CODE.replace("a = bool(True)", "a = bool(False)"))
+    git("add", "changed.py")
+
+    (repo / "changed.py").write_text(
+        CODE.replace("a = bool(True)", "a = bool(False)").replace("c = bool(True)", "c = bool(1)")
+    )
+
+    errors = run_refurb(Settings(files=["."], staged=True))
+
+    assert [str(error) for error in errors] == [
+        "./changed.py:1:5 [FURB123]: Replace `bool(False)` with `False`",
+    ]
+
+
+def test_daemon_only_reports_changed_lines(repo: Path) -> None:
+    server = DaemonServer()
+
+    assert len(server.check(Settings(files=["."]))) == 6
+
+    (repo / "changed.py").write_text(CODE.replace("a = bool(True)", "a = bool(False)"))
+    git("add", "changed.py")
+
+    errors = server.check(Settings(files=["."], staged=True))
+
+    assert [str(error) for error in errors] == [
+        "./changed.py:1:5 [FURB123]: Replace `bool(False)` with `False`",
+    ]
+
+    errors = server.check(Settings(files=["."], changed_since="not-a-ref"))
+
+    assert len(errors) == 1
+    assert str(errors[0]).startswith("refurb: git diff failed: ")
+
+
+def test_nothing_is_checked_if_nothing_changed(repo: Path) -> None:
+    with patch("refurb.main.run_mypy") as mypy:
+        assert not run_refurb(Settings(files=["."], changed_since="HEAD"))
+
+    mypy.assert_not_called()
+
+
+def test_git_errors_are_reported(repo: Path) -> None:
+    errors = run_refurb(Settings(files=["."], changed_since="not-a-ref"))
+
+    assert len(errors) == 1
+    assert str(errors[0]).startswith("refurb: git diff failed: ")
+
+    with patch("subprocess.run", side_effect=FileNotFoundError(2, "No such file or directory")):
+        errors = run_refurb(Settings(files=["."], staged=True))
+
+    assert errors == ["refurb: could not run git: No such file or directory"]
+
+
+def test_git_error_without_output_reports_exit_code() -> None:
+    proc = subprocess.CompletedProcess([], returncode=128, stdout="", stderr="")
+
+    with patch("subprocess.run", return_value=proc), pytest.raises(GitError, match="failed: 128"):
+        run_git(["diff"])
+
+
+def test_errors_spanning_multiple_lines_overlap_changes(tmp_path: Path) -> None:
+    changes = {(tmp_path / "x.py").resolve(): [(5, 6)]}
+
+    def error(line: int, line_end: int | None = None) -> ErrorInfo:
+        return ErrorInfo(line, 0, "", str(tmp_path / "x.py"), line_end)
+
+    assert is_in_changed_lines(error(5), changes)
+    assert is_in_changed_lines(error(3, 5), changes)
+    assert is_in_changed_lines(error(6, 8), changes)
+    assert not is_in_changed_lines(error(4), changes)
+    assert not is_in_changed_lines(error(7, 9), changes)
+    assert not is_in_changed_lines(ErrorInfo(1, 0, "", str(tmp_path / "y.py")), changes)
+    assert is_in_changed_lines("some message", changes)
+
+
+def test_files_without_path_are_not_checked() -> None:
+    assert not filter_changed_files([BuildSource(None, "mod", text="")], {})
@@ -1,8 +1,13 @@
+import re
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
-from refurb.error import Error, ErrorCategory, ErrorCode
-from refurb.main import run_refurb
+import pytest
+
+from refurb.error import AnalysisTier, Error, ErrorCategory, ErrorClassifier, ErrorCode
+from refurb.main import run_mypy, run_refurb
+from refurb.manifest import ManifestEntry, read_manifest
 from refurb.settings import Settings, parse_command_line_args
 
 
@@ -22,12 +27,155 @@ def test_checks() -> None:
     run_checks_in_folder(TEST_DATA_PATH)
 
 
+@pytest.mark.parametrize("tier", [AnalysisTier.SYNTAX, AnalysisTier.SEMANTIC])
+def test_checks_give_same_results_at_their_analysis_tier(tier: AnalysisTier) -> None:
+    manifest = read_manifest()
+    assert manifest
+
+    enabled: set[ErrorClassifier] = {
+        ErrorCode(entry.code, entry.prefix) for entry in manifest if entry.tier <= tier
+    }
+    settings = Settings(files=[str(TEST_DATA_PATH)], disable_all=True, enable=enabled)
+
+    with patch("refurb.main.run_mypy", wraps=run_mypy) as mypy:
+        errors = run_refurb(settings)
+
+    assert mypy.call_args.args[2] == tier
+
+    codes = {str(code) for code in enabled}
+
+    files = sorted(TEST_DATA_PATH.glob("*.txt"), key=lambda p: p.name)
+    expected = [
+        line
+        for file in files
+        for line in file.read_text().splitlines()
+        if (code := re.search(r" \[(\w+)\]: ", line)) and code.group(1) in codes
+    ]
+
+    assert expected
+    assert [str(error) for error in errors] == expected
+
+
+# Only the return types of the functions are annotated, so the type of every variable (and every
+# expression using them) has to be inferred by Mypy.
+INFERRED_TYPES_CODE = """\
+import math
+import os
+import re
+from pathlib import Path
+
+
+def get_path() -> Path: ...
+def get_str() -> str: ...
+def get_int() -> int: ...
+def get_list() -> list[int]: ...
+def get_bool() -> bool: ...
+
+
+p = get_path()
+s = get_str()
+n = get_int()
+nums = get_list()
+b = get_bool()
+
+p.name.endswith(".txt")
+s.endswith(".txt")
+_ = n in [1, 2]
+_ = s in (s,)
+_ = not not b
+_ = math.log(n, 2)
+_ = re.search("x", s, re.I)
+_ = os.path.join(s, s)
+_ = "{}".format(n)
+_ = s.lstrip("\\n")
+_ = sorted(nums)[0]
+_ = print(s, sep="")
+_ = [x for x in nums]
+_ = bin(n).count("1")
+_ = int(s, 0)
+_ = isinstance(b, bool) or isinstance(b, int)
+_ = b is True
+_ = n == 1 or n == 2
+_ = type(s) == type(None)
+_ = str(n) if n else ""
+_ = s.startswith("x") or s.startswith("y")
+_ = s.expandtabs(8)
+_ = f"{n:d}"
+_ = [*map(lambda x: x, nums)]
+_ = Path(s).cwd()
+"""
+
+
+@pytest.fixture(scope="module")
+def inferred_types_file(tmp_path_factory: pytest.TempPathFactory) -> str:
+    file = tmp_path_factory.mktemp("tiers") / "inferred_types.py"
+    file.write_text(INFERRED_TYPES_CODE)
+
+    return str(file)
+
+
+@pytest.fixture(scope="module")
+def inferred_types_errors(inferred_types_file: str) -> list[str]:
+    manifest = read_manifest()
+    assert manifest
+
+    enabled: set[ErrorClassifier] = {
+        ErrorCode(entry.code, entry.prefix)
+        for entry in manifest
+        if entry.tier < AnalysisTier.TYPES
+    }
+    settings = Settings(files=[inferred_types_file], disable_all=True, enable=enabled)
+
+    with patch("refurb.main.get_analysis_tier", return_value=AnalysisTier.TYPES):
+        errors = run_refurb(settings)
+
+    assert errors
+    assert all(isinstance(error, Error) for error in errors)
+
+    return [str(error) for error in errors]
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [entry for entry in read_manifest() or [] if entry.tier < AnalysisTier.TYPES],
+    ids=lambda entry: f"{entry.prefix}{entry.code}",
+)
+def test_checks_below_types_tier_do_not_need_inferred_types(
+    entry: ManifestEntry, inferred_types_file: str, inferred_types_errors: list[str]
+) -> None:
+    # Each check is ran by itself so that the analysis tier isn't raised by other checks
+    code = f"{entry.prefix}{entry.code}"
+    settings = Settings(
+        files=[inferred_types_file], disable_all=True, enable={ErrorCode(entry.code, entry.prefix)}
+    )
+
+    errors = [str(error) for error in run_refurb(settings)]
+
+    assert errors == [error for error in inferred_types_errors if f" [{code}]: " in error]
+
+
+def test_use_suffix_check_finds_inferred_path_types(inferred_types_file: str) -> None:
+    settings = Settings(files=[inferred_types_file], disable_all=True, enable={ErrorCode(172)})
+
+    errors = [str(error) for error in run_refurb(settings)]
+
+    assert errors == [
+        f'{inferred_types_file}:20:1 [FURB172]: Replace `x.name.endswith(".txt")` with `x.suffix == ".txt"`',  # noqa: E501
+    ]
+
+
 def test_fatal_mypy_error_is_bubbled_up() -> None:
     errors = run_refurb(Settings(files=["something"]))
 
     assert errors == ["refurb: can't read file 'something': No such file or directory"]
 
 
+def test_fatal_error_is_bubbled_up_when_only_parsing() -> None:
+    errors = run_refurb(Settings(files=["something"], disable_all=True))
+
+    assert errors == ["refurb: can't read file 'something': No such file or directory"]
+
+
 def test_mypy_error_is_bubbled_up() -> None:
     errors = run_refurb(Settings(files=["some_file.py"]))
 
@@ -209,6 +357,17 @@ def test_explicitly_enabled_category_still_runs() -> None:
     assert errors
 
 
+def test_ignored_category_is_not_ran() -> None:
+    errors = run_refurb(
+        Settings(
+            files=["test/data/err_123.py"],
+            ignore={ErrorCategory("readability")},
+        )
+    )
+
+    assert not errors
+
+
 def test_error_not_ignored_if_path_doesnt_apply() -> None:
     errors = run_refurb(
         Settings(
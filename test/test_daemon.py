@@ -0,0 +1,371 @@
+import json
+import socket
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from mypy.build import BuildSource
+
+from refurb.daemon import daemon_main, is_daemon_running, receive, send, send_request, start_daemon
+from refurb.main import main
+from refurb.server import DaemonServer, get_file_stamps
+from refurb.settings import Settings
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Iterator[Path]:
+    path = tmp_path / "refurb.sock"
+
+    server = DaemonServer()
+    thread = threading.Thread(target=server.serve, args=(path,))
+    thread.start()
+
+    while not path.exists():
+        pass
+
+    yield path
+
+    assert daemon_main(["stop"], path) == 0
+    thread.join()
+
+    assert not path.exists()
+
+
+def run_check(args: list[str], socket_path: Path) -> tuple[int, str]:
+    with patch("builtins.print") as p:
+        status = daemon_main(["check", *args], socket_path)
+
+    return status, "\n".join(str(args[0][0]) for args in p.call_args_list)
+
+
+def test_daemon_output_matches_normal_output(socket_path: Path) -> None:
+    args = ["test/data/err_123.py", "test/data/err_131.py", "--quiet", "--no-color"]
+
+    with patch("builtins.print") as p:
+        expected_status = main(args)
+
+    expected = "\n".join(call.args[0] for call in p.call_args_list)
+
+    assert run_check(args, socket_path) == (expected_status, expected)
+
+    # Running a second time re-uses the existing build
+    assert run_check(args, socket_path) == (expected_status, expected)
+
+
+def test_only_changed_files_are_reanalyzed(socket_path: Path, tmp_path: Path) -> None:
+    file = tmp_path / "file.py"
+    file.write_text("x = 1\n")
+
+    args = [str(file), "--quiet", "--no-color"]
+
+    assert run_check(args, socket_path) == (0, "")
+
+    file.write_text("x = str('x')\n")
+
+    with patch("refurb.server.build") as build:
+        status, output = run_check(args, socket_path)
+
+    build.assert_not_called()
+
+    assert status == 1
+    assert output == f"{file}:1:5 [FURB123]: Replace `str('x')` with `'x'`"
+
+    file.write_text("x = (\n")
+
+    status, output = run_check(args, socket_path)
+
+    assert status == 1
+    assert "error: " in output
+
+    file.write_text("x = 1\n")
+
+    assert run_check(args, socket_path) == (0, "")
+
+
+def test_changes_to_imported_modules_are_reanalyzed(socket_path: Path, tmp_path: Path) -> None:
+    main_file = tmp_path / "main.py"
+    main_file.write_text("from util import get\n\nx = str(get())\n")
+
+    util = tmp_path / "util.py"
+    util.write_text("def get() -> str:\n    return ''\n")
+
+    args = [str(main_file), "--quiet", "--no-color"]
+
+    assert run_check(args, socket_path) == (
+        1,
+        f"{main_file}:3:5 [FURB123]: Replace `str(get())` with `get()`",
+    )
+
+    util.write_text("def get() -> int:\n    return 0\n")
+
+    with patch("refurb.server.build") as build:
+        assert run_check(args, socket_path) == (0, "")
+
+    build.assert_not_called()
+
+    # Removed modules are removed from the build as well
+    util.unlink()
+
+    with patch("refurb.server.build") as build:
+        assert run_check(args, socket_path) == (0, "")
+
+    build.assert_not_called()
+
+
+def test_checking_different_files_reuses_build(socket_path: Path, tmp_path: Path) -> None:
+    first = tmp_path / "first" / "file.py"
+    second = tmp_path / "second" / "file.py"
+    other = tmp_path / "second" / "other.py"
+
+    for file in (first, second, other):
+        file.parent.mkdir(exist_ok=True)
+        file.write_text("x = str('x')\n")
+
+    # Both files are the `file` module, so make sure the right one is checked
+    second.write_text("\nx = str('x')\n")
+
+    def get_errors(*files: Path) -> str:
+        return run_check([*map(str, files), "--quiet", "--no-color"], socket_path)[1]
+
+    assert get_errors(first) == f"{first}:1:5 [FURB123]: Replace `str('x')` with `'x'`"
+
+    with patch("refurb.server.build") as build:
+        assert get_errors(second, other) == (
+            f"{second}:2:5 [FURB123]: Replace `str('x')` with `'x'`\n"
+            f"{other}:1:5 [FURB123]: Replace `str('x')` with `'x'`"
+        )
+
+        assert get_errors(first) == f"{first}:1:5 [FURB123]: Replace `str('x')` with `'x'`"
+
+    build.assert_not_called()
+
+
+def test_color_is_decided_by_the_client(socket_path: Path) -> None:
+    _, output = run_check(["test/data/err_123.py", "--quiet"], socket_path)
+
+    assert "\x1b" in output
+
+    _, output = run_check(["test/data/err_123.py", "--quiet", "--no-color"], socket_path)
+
+    assert "\x1b" not in output
+
+
+def test_daemon_reports_errors(socket_path: Path) -> None:
+    args = ["test/e2e/dummy.py", "--load", "test.invalid_checks.invalid_check"]
+
+    status, output = run_check(args, socket_path)
+
+    assert status == 1
+    assert '"int" is not a valid Mypy node type' in output
+
+    status, output = run_check(["--", "--version"], socket_path)
+
+    assert status == 1
+    assert output.startswith("mypy ")
+
+    status, output = run_check(["file_not_found.py"], socket_path)
+
+    assert status == 1
+    assert "can't read file" in output
+
+    assert send_request({"command": "oops"}, socket_path) == {
+        "output": "refurb: invalid daemon request",
+        "status": 1,
+    }
+
+
+def test_daemon_rejects_flags_for_single_runs(socket_path: Path, tmp_path: Path) -> None:
+    args = ["test/e2e/dummy.py", "--timing-stats", str(tmp_path / "stats.json"), "--low-memory"]
+
+    assert run_check(args, socket_path) == (
+        1,
+        'refurb: "--timing-stats", "--low-memory" cannot be used with the daemon',
+    )
+
+
+def test_daemon_uses_result_cache(socket_path: Path, tmp_path: Path) -> None:
+    cache_dir = tmp_path / ".refurb_cache"
+
+    args = ["test/data/err_123.py", "--quiet", "--no-color", "--cache"]
+
+    with patch("refurb.cache.CACHE_DIR", cache_dir):
+        status, output = run_check(args, socket_path)
+
+    assert status == 1
+    assert output
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+
+def test_unexpected_errors_are_sent_to_client(socket_path: Path) -> None:
+    with patch.object(DaemonServer, "check", side_effect=RuntimeError("oops")):
+        status, output = run_check(["test/e2e/dummy.py"], socket_path)
+
+    assert status == 1
+    assert output == "refurb: daemon error: RuntimeError('oops')"
+
+    # The daemon keeps running after an error
+    assert run_check(["test/e2e/dummy.py"], socket_path) == (0, "")
+
+
+def test_malformed_requests_and_responses_are_reported(socket_path: Path) -> None:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.connect(str(socket_path))
+
+        send(conn, "not json")
+
+        assert json.loads(receive(conn)) == {
+            "output": "refurb: invalid daemon request",
+            "status": 1,
+        }
+
+    for response in ("", "not json", '{"output": 1}'):
+        with patch("refurb.daemon.receive", return_value=response):
+            status, output = run_check(["test/e2e/dummy.py"], socket_path)
+
+        assert status == 1
+        assert output.startswith("refurb: invalid response from daemon")
+
+
+def test_daemon_ignores_empty_connections(socket_path: Path) -> None:
+    assert is_daemon_running(socket_path)
+
+    assert run_check(["test/e2e/dummy.py"], socket_path) == (0, "")
+
+
+def test_checks_are_only_loaded_once_per_config() -> None:
+    server = DaemonServer()
+
+    with patch("refurb.server.load_checks", side_effect=lambda _: object()) as load_checks:
+        first = server.get_checks(Settings(enable_all=True))
+        second = server.get_checks(Settings(enable_all=True))
+        third = server.get_checks(Settings(disable_all=True))
+
+    assert first is second
+    assert first is not third
+    assert load_checks.call_count == 2
+
+
+def test_server_can_be_warmed_up(tmp_path: Path) -> None:
+    server = DaemonServer()
+    path = tmp_path / "refurb.sock"
+
+    def connect() -> None:
+        while not path.exists():
+            pass
+
+        send_request({"command": "stop"}, path)
+
+    thread = threading.Thread(target=connect)
+    thread.start()
+
+    with patch("sys.argv", ["refurb"]):
+        server.serve(path, ["test/e2e/dummy.py"])
+
+    thread.join()
+
+    assert server.build
+
+
+def test_client_errors_when_daemon_is_not_running(tmp_path: Path) -> None:
+    path = tmp_path / "refurb.sock"
+
+    assert not is_daemon_running(path)
+
+    assert run_check(["test/e2e/dummy.py"], path) == (
+        1,
+        "refurb: daemon is not running, use `refurb daemon start` to start it",
+    )
+
+    with patch("builtins.print") as p:
+        assert daemon_main(["stop"], path) == 1
+
+    assert p.call_args[0][0] == "refurb: daemon is not running"
+
+
+def test_client_validates_args_before_sending_them(tmp_path: Path) -> None:
+    assert run_check(["--jobs", "0"], tmp_path / "refurb.sock") == (
+        1,
+        "refurb: jobs must be a positive integer",
+    )
+
+
+def test_start_daemon(tmp_path: Path) -> None:
+    path = tmp_path / "refurb.sock"
+    path.touch()
+
+    def fake_popen(args: list[str], **kwargs: object) -> None:
+        assert args[-3:] == ["daemon", "serve", "file.py"]
+
+        # The stale socket file should be removed before starting the server
+        assert not path.exists()
+
+        threading.Timer(0.1, path.touch).start()
+
+    with patch("refurb.daemon.Popen", side_effect=fake_popen) as popen:
+        assert daemon_main(["start", "file.py"], path) == 0
+
+    popen.assert_called_once()
+
+
+def test_start_daemon_fails_if_server_never_starts(tmp_path: Path) -> None:
+    path = tmp_path / "refurb.sock"
+
+    with (
+        patch("refurb.daemon.Popen"),
+        patch("refurb.daemon.STARTUP_TIMEOUT_IN_SECONDS", 0),
+        patch("builtins.print") as p,
+    ):
+        assert start_daemon([], path) == 1
+
+    assert p.call_args[0][0] == "refurb: daemon failed to start"
+
+
+def test_start_daemon_fails_if_already_running(socket_path: Path) -> None:
+    with patch("refurb.daemon.Popen") as popen, patch("builtins.print") as p:
+        assert start_daemon([], socket_path) == 1
+
+    popen.assert_not_called()
+    assert p.call_args[0][0] == "refurb: daemon is already running"
+
+
+def test_serve_subcommand_starts_server(tmp_path: Path) -> None:
+    path = tmp_path / "refurb.sock"
+
+    with patch("refurb.server.DaemonServer.serve") as serve:
+        assert daemon_main(["serve", "file.py"], path) == 0
+
+    serve.assert_called_once_with(path, ["file.py"])
+
+
+def test_daemon_usage() -> None:
+    for args, status in ((["daemon"], 1), (["daemon", "--help"], 0), (["daemon", "oops"], 1)):
+        with patch("builtins.print") as p:
+            assert main(args) == status
+
+        assert "usage: refurb daemon" in p.call_args[0][0]
+
+
+def test_file_stamps_skip_missing_files(tmp_path: Path) -> None:
+    file = tmp_path / "file.py"
+    file.touch()
+
+    sources = [
+        BuildSource(str(file), "file"),
+        BuildSource(None, "no_path"),
+        BuildSource(str(tmp_path / "missing.py"), "missing"),
+    ]
+
+    assert list(get_file_stamps(sources)) == [str(file)]
+
+
+def test_checks_are_reloaded_when_settings_change() -> None:
+    server = DaemonServer()
+
+    with patch("refurb.server.load_checks", side_effect=lambda _: object()) as load_checks:
+        server.get_checks(Settings(files=["a.py"]))
+        server.get_checks(Settings(files=["b.py"]))
+        server.get_checks(Settings(files=["b.py"], python_version=(3, 9)))
+
+    assert load_checks.call_count == 2
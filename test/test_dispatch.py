@@ -0,0 +1,148 @@
+from dataclasses import dataclass
+
+import pytest
+from mypy.nodes import (
+    ArgKind,
+    CallExpr,
+    ComparisonExpr,
+    IntExpr,
+    MemberExpr,
+    NameExpr,
+    Node,
+    OpExpr,
+    StrExpr,
+)
+
+from refurb.checks.builtin import print as print_check
+from refurb.checks.string import simplify_strip
+from refurb.error import AnalysisTier, Error
+from refurb.settings import Settings
+from refurb.types import Checks
+from refurb.visitor import build_visitor_class
+from refurb.visitor.dispatch import (
+    DispatchTable,
+    get_call_expr_keys,
+    get_comparison_expr_keys,
+    get_dispatch_keys,
+    get_op_expr_keys,
+)
+
+
+def make_call(callee: NameExpr | MemberExpr, *args: StrExpr) -> CallExpr:
+    return CallExpr(callee, list(args), [ArgKind.ARG_POS] * len(args), [None] * len(args))
+
+
+def make_name(name: str, fullname: str = "") -> NameExpr:
+    expr = NameExpr(name)
+    expr.fullname = fullname
+
+    return expr
+
+
+def test_call_expr_keys() -> None:
+    method = MemberExpr(StrExpr("x"), "join")
+    module_attr = MemberExpr(make_name("os", "os"), "getcwd")
+    module_attr.fullname = "os.getcwd"
+
+    assert get_call_expr_keys(make_call(make_name("print", "builtins.print"))) == (
+        "builtins.print",
+    )
+    assert not get_call_expr_keys(make_call(make_name("f")))
+    assert get_call_expr_keys(make_call(method)) == (".join",)
+    assert get_call_expr_keys(make_call(module_attr)) == ("os.getcwd", ".getcwd")
+
+
+def test_op_and_comparison_expr_keys() -> None:
+    comparison = ComparisonExpr(["<", "in"], [IntExpr(1), IntExpr(2), IntExpr(3)])
+
+    assert get_op_expr_keys(OpExpr("or", IntExpr(1), IntExpr(2))) == ("or",)
+    assert get_comparison_expr_keys(comparison) == ("<", "in")
+
+
+@dataclass
+class CallError(Error):
+    code = 9000
+    tier = AnalysisTier.SEMANTIC
+    dispatch_callees = ("builtins.print",)
+    dispatch_methods = ("join",)
+    dispatch_ops = ("+",)
+
+
+@dataclass
+class SyntaxCallError(Error):
+    code = 9001
+    tier = AnalysisTier.SYNTAX
+    dispatch_callees = ("builtins.print",)
+
+
+def test_get_dispatch_keys() -> None:
+    assert get_dispatch_keys(CallError, CallExpr) == frozenset(("builtins.print", ".join"))
+    assert get_dispatch_keys(CallError, OpExpr) == frozenset(("+",))
+    assert get_dispatch_keys(CallError, ComparisonExpr) is None
+    assert get_dispatch_keys(CallError, IntExpr) is None
+    assert get_dispatch_keys(Error, CallExpr) is None
+    assert get_dispatch_keys(None, CallExpr) is None
+
+
+def test_dispatch_callees_cannot_be_used_with_syntax_tier() -> None:
+    with pytest.raises(TypeError, match=r"FURB9001.*AnalysisTier\.SEMANTIC"):
+        get_dispatch_keys(SyntaxCallError, CallExpr)
+
+
+def test_dispatch_table_lookups() -> None:
+    def get_keys(node: Node) -> tuple[str, ...]:
+        assert isinstance(node, ComparisonExpr)
+
+        return tuple(node.operators)
+
+    def compare(*operators: str) -> ComparisonExpr:
+        return ComparisonExpr(list(operators), [IntExpr(1)] * (len(operators) + 1))
+
+    table = DispatchTable(
+        [
+            ("in", frozenset(("in", "not in"))),
+            ("always", None),
+            ("is", frozenset(("is",))),
+            ("eq", frozenset(("==",))),
+        ],
+        get_keys,
+    )
+
+    assert table.get(compare("in")) == ("in", "always")
+    assert table.get(compare("<")) == ("always",)
+    assert table.get(compare("<", ">")) == ("always",)
+    assert table.get(compare("<", "is")) == ("always", "is")
+    assert table.get(compare("==", "in", "==")) == ("in", "always", "eq")
+
+
+def test_checks_with_dispatch_keys_are_only_ran_on_matching_nodes() -> None:
+    checks = Checks(
+        list,
+        {CallExpr: [print_check.check, simplify_strip.check]},  # type: ignore[list-item]
+    )
+
+    nodes = [
+        make_call(make_name("print", "builtins.print"), StrExpr("")),
+        make_call(make_name("f", "mod.f"), StrExpr("")),
+        make_call(make_name("g")),
+        make_call(MemberExpr(StrExpr("x"), "strip")),
+        make_call(MemberExpr(StrExpr("x"), "join")),
+    ]
+
+    visitor = build_visitor_class(checks, timed=True)(checks, Settings())
+
+    for node in nodes:
+        visitor.accept(node)
+
+    assert [error.code for error in visitor.errors] == [105]
+
+    assert visitor.stats
+    assert visitor.stats.checks["FURB105"].calls == 1
+    assert visitor.stats.checks["FURB159"].calls == 1
+
+    untimed_visitor = build_visitor_class(checks)(checks, Settings())
+
+    for node in nodes:
+        untimed_visitor.accept(node)
+
+    assert [error.code for error in untimed_visitor.errors] == [105]
@@ -0,0 +1,303 @@
+from mypy.build import BuildSource
+from mypy.nodes import (
+    AssignmentStmt,
+    CallExpr,
+    Expression,
+    ExpressionStmt,
+    ForStmt,
+    FuncDef,
+    MypyFile,
+    NameExpr,
+    Statement,
+    TupleExpr,
+)
+
+from refurb import types
+from refurb.checks.common import (
+    get_common_expr_positions,
+    get_mypy_type,
+    get_name_read_count,
+    get_structural_id,
+    is_equivalent,
+    is_mapping,
+    is_same_type,
+    is_sized,
+    is_subclass,
+    stringify,
+)
+from refurb.error import AnalysisTier
+from refurb.main import get_mypy_options, run_mypy
+from refurb.settings import Settings
+from refurb.source import SourceFile
+from refurb.types import Checks, clear_helper_caches
+from refurb.visitor import build_visitor_class
+
+SOURCE = """\
+x: dict[str, int] = {}
+y = 1
+"""
+
+EXPRESSIONS = """\
+x: list[int] = []
+y = {"k": 1}
+x[0] + len(x, *x) == y["k"]
+x[0] + len(x, *x) == y["k"]
+x[0] + len(x, *x) != y["k"]
+{**y, "k": -x[1:2]}
+{**y, "k": -x[1:2]}
+lambda: 1
+lambda: 1
+(lambda: 1), (lambda: 1)
+"""
+
+
+def get_tree(source: str) -> MypyFile:
+    mypy_options = get_mypy_options(Settings(files=["test/e2e/dummy.py"]))
+    assert isinstance(mypy_options, tuple)
+
+    result = run_mypy([BuildSource(None, "mod", text=source)], mypy_options[1], AnalysisTier.TYPES)
+
+    tree = result.graph["mod"].tree
+    assert tree
+
+    return tree
+
+
+def get_statements(source: str) -> list[Statement]:
+    return get_tree(source).defs
+
+
+LOOPS = """\
+nums = [1, 2, 3]
+for num in nums:
+    for other in nums:
+        print(num, num + other)
+"""
+
+
+def get_expressions() -> list[Expression]:
+    exprs: list[Expression] = []
+
+    for stmt in get_statements(EXPRESSIONS)[2:]:
+        assert isinstance(stmt, ExpressionStmt)
+
+        exprs.append(stmt.expr)
+
+    return exprs
+
+
+def get_names() -> list[NameExpr]:
+    names: list[NameExpr] = []
+
+    for stmt in get_statements(SOURCE):
+        assert isinstance(stmt, AssignmentStmt)
+        assert isinstance(stmt.lvalues[0], NameExpr)
+
+        names.append(stmt.lvalues[0])
+
+    return names
+
+
+def test_mypy_types_are_cached() -> None:
+    clear_helper_caches()
+
+    x, _ = get_names()
+
+    ty = get_mypy_type(x)
+
+    assert is_same_type(ty, dict)
+    assert types.MYPY_TYPE_CACHE[id(x)] == (x, ty)
+    assert get_mypy_type(x) is ty
+
+
+def test_subclass_checks_are_cached() -> None:
+    clear_helper_caches()
+
+    x, y = get_names()
+
+    assert is_mapping(x)
+    assert is_sized(x)
+    assert not is_mapping(y)
+    assert len(types.SUBCLASS_CACHE) == 3
+
+    # Cached results (both positive and negative) are returned as-is
+    assert is_mapping(x)
+    assert not is_subclass(get_mypy_type(y), "typing.Mapping")
+    assert len(types.SUBCLASS_CACHE) == 3
+
+
+def test_equivalent_expressions_have_the_same_structural_id() -> None:
+    compare, same_compare, other_compare, merge, same_merge, *lambdas, lambda_tuple = (
+        get_expressions()
+    )
+
+    assert is_equivalent(compare, same_compare)
+    assert get_structural_id(compare) == get_structural_id(same_compare)
+    assert not is_equivalent(compare, other_compare)
+    assert is_equivalent(merge, same_merge)
+    assert not is_equivalent(merge, None)
+    assert is_equivalent(None, None)
+
+    # Nodes which aren't compared structurally are only equivalent when on the same line
+    assert not is_equivalent(*lambdas)
+    assert isinstance(lambda_tuple, TupleExpr)
+    assert is_equivalent(*lambda_tuple.items)
+
+
+def test_get_common_expr_positions() -> None:
+    x, y = get_names()
+    other_x, other_y = get_names()
+
+    assert get_common_expr_positions(x, y, other_y, other_x) == (0, 3)
+    assert get_common_expr_positions(x, y, other_y) == (1, 2)
+    assert get_common_expr_positions(x, y) is None
+
+
+def test_name_read_counts() -> None:
+    clear_helper_caches()
+
+    assign, loop = get_statements(LOOPS)
+    assert isinstance(loop, ForStmt)
+
+    inner_loop = loop.body.body[0]
+    assert isinstance(inner_loop, ForStmt)
+
+    assert get_name_read_count("mod.nums", loop) == 2
+    assert get_name_read_count("mod.num", loop) == 3
+    assert get_name_read_count("mod.other", loop) == 2
+    assert get_name_read_count("builtins.print", loop) == 1
+    assert get_name_read_count("mod.unknown", loop) == 0
+
+    # Nodes inside of an indexed node are looked up without walking them again
+    indexed = len(types.NAME_INDEX_CACHE)
+
+    assert get_name_read_count("mod.num", inner_loop) == 2
+    assert get_name_read_count("mod.num", inner_loop.body) == 2
+    assert get_name_read_count("mod.other", inner_loop.expr) == 0
+    assert get_name_read_count("mod.nums", inner_loop.expr) == 1
+    assert len(types.NAME_INDEX_CACHE) == indexed
+
+    assert get_name_read_count("mod.nums", assign) == 1
+    assert len(types.NAME_INDEX_CACHE) > indexed
+
+
+def test_caches_are_cleared_for_each_file() -> None:
+    x, y = get_names()
+
+    assert is_mapping(x)
+    assert not is_equivalent(x, y)
+    assert types.MYPY_TYPE_CACHE
+    assert types.SUBCLASS_CACHE
+    assert types.STRUCTURAL_ID_CACHE
+    assert types.STRUCTURAL_IDS
+
+    assert not get_name_read_count(x.fullname, y)
+    assert types.NAME_INDEX_CACHE
+
+    assert stringify(x) == "x"
+    assert types.STRINGIFY_CACHE
+
+    build_visitor_class(Checks(list))(Checks(list), Settings())
+
+    assert not types.MYPY_TYPE_CACHE
+    assert not types.SUBCLASS_CACHE
+    assert not types.STRUCTURAL_ID_CACHE
+    assert not types.STRUCTURAL_IDS
+    assert not types.NAME_INDEX_CACHE
+    assert not types.STRINGIFY_CACHE
+
+
+FORMATTED = """\
+x = {'a': 0x10}
+print(x [ 'a' ], "ünï", x['a'])
+print(
+    x,
+)
+print(f"{x['a']}")
+"""
+
+
+def test_stringify_uses_source_of_file_being_checked() -> None:
+    clear_helper_caches()
+
+    tree = get_tree(FORMATTED)
+    assign, call, multi_line_call, fstring_call = tree.defs
+
+    assert isinstance(assign, AssignmentStmt)
+    assert isinstance(call, ExpressionStmt)
+    assert isinstance(call.expr, CallExpr)
+    assert isinstance(multi_line_call, ExpressionStmt)
+    assert isinstance(fstring_call, ExpressionStmt)
+
+    index, string, other_index = call.expr.args
+
+    # Nodes are rebuilt from the AST when it isn't known which file is being checked
+    assert stringify(assign.rvalue) == '{"a": 16}'
+
+    clear_helper_caches()
+    types.CURRENT_FILE = SourceFile(FORMATTED)
+
+    try:
+        assert stringify(assign.rvalue) == "{'a': 0x10}"
+        assert stringify(index) == "x [ 'a' ]"
+        assert stringify(string) == '"ünï"'
+        assert stringify(call) == """print(x [ 'a' ], "ünï", x['a'])"""
+
+        # Results are cached for each node
+        assert id(other_index) not in types.STRINGIFY_CACHE
+        assert stringify(other_index) == "x['a']"
+        assert types.STRINGIFY_CACHE[id(other_index)] == (other_index, "x['a']")
+
+        assert stringify(multi_line_call) == "print(x)"
+
+        # Nodes from other files which aren't inside of the file being checked are rebuilt
+        other_assign = get_statements("x = 1\n" * 10 + "y = {'a': 0x10}")[-1]
+        assert isinstance(other_assign, AssignmentStmt)
+
+        assert stringify(other_assign.rvalue) == '{"a": 16}'
+
+        other_assign = get_statements("xyz = {'a': 0x10}")[0]
+        assert isinstance(other_assign, AssignmentStmt)
+
+        assert stringify(other_assign.rvalue) == '{"a": 16}'
+
+        # Mypy gives nodes inside of f-strings the position of the f-string before Python 3.12
+        assert stringify(fstring_call) == """print(f"{x['a']}")"""
+
+    finally:
+        types.CURRENT_FILE = None
+
+
+REBUILT = """\
+x = [1, 2]
+f"a{x}b{x:>4}"
+f"{x:>4}"
+x[0] if x else x[1]
+del x[0]
+"".join([""])
+"".join(["", x])
+print(*x, sep='')
+{**{}, 'k': 1}
+async def f() -> None:
+    await f()
+"""
+
+
+def test_stringify_rebuilds_nodes_from_ast() -> None:
+    clear_helper_caches()
+
+    *stmts, func = get_statements(REBUILT)
+    assert isinstance(func, FuncDef)
+
+    assert [stringify(stmt) for stmt in (*stmts, *func.body.body)] == [
+        "x = [1, 2]",
+        'f"a{x}b{x:>4}"',
+        'f"{x:>4}"',
+        "x[0] if x else x[1]",
+        "del x[0]",
+        '"".join([""])',
+        '"".join(["", x])',
+        'print(*x, sep="")',
+        '{**{}, "k": 1}',
+        "await f()",
+    ]
@@ -1,8 +1,16 @@
 import pytest
-from mypy.nodes import CallExpr
+from mypy.nodes import CallExpr, NameExpr, Node
 
-from refurb.error import Error
-from refurb.loader import extract_function_types, is_valid_error_class
+from refurb.error import AnalysisTier, Error, ErrorClassifier, ErrorCode
+from refurb.loader import (
+    extract_function_types,
+    get_analysis_tier,
+    is_valid_error_class,
+    load_checks,
+    normalize_check,
+)
+from refurb.settings import Settings
+from refurb.types import Checks
 
 
 def test_check_must_be_callable() -> None:
@@ -55,3 +63,42 @@ def test_error_info_class_must_be_valid() -> None:
         pass
 
     assert not is_valid_error_class(ErrorInfo)
+
+
+def test_checks_with_settings_param_have_settings_bound() -> None:
+    settings = Settings(python_version=(3, 9))
+    calls: list[tuple[Node, list[Error], Settings]] = []
+
+    def check(node: Node, errors: list[Error], settings: Settings) -> None:
+        calls.append((node, errors, settings))
+
+    def check_without_settings(node: Node, errors: list[Error]) -> None:
+        pass
+
+    normalized = normalize_check(check, settings)
+
+    node = CallExpr(NameExpr("f"), [], [], [])
+    errors: list[Error] = []
+
+    normalized(node, errors)
+
+    assert calls == [(node, errors, settings)]
+    assert normalize_check(check_without_settings, settings) is check_without_settings
+
+
+def test_analysis_tier_is_highest_tier_of_loaded_checks() -> None:
+    def check(node: Node, errors: list[Error]) -> None:
+        pass
+
+    def load(*codes: int) -> AnalysisTier:
+        enable: set[ErrorClassifier] = {ErrorCode(code) for code in codes}
+
+        return get_analysis_tier(load_checks(Settings(disable_all=True, enable=enable)))
+
+    assert load() == AnalysisTier.SYNTAX
+    assert load(107) == AnalysisTier.SYNTAX
+    assert load(107, 105) == AnalysisTier.SEMANTIC
+    assert load(107, 105, 100) == AnalysisTier.TYPES
+
+    # Checks without an error class might need anything, so assume the worst
+    assert get_analysis_tier(Checks(list, {CallExpr: [check]})) == AnalysisTier.TYPES
@@ -9,10 +9,12 @@ from tempfile import NamedTemporaryFile
 from unittest.mock import patch
 
 import pytest
+from mypy.build import BuildSource
 
-from refurb.error import Error, ErrorCategory, ErrorClassifier, ErrorCode
-from refurb.main import is_ignored_via_amend, main, run_refurb, sort_errors
+from refurb.error import AnalysisTier, Error, ErrorCategory, ErrorClassifier, ErrorCode
+from refurb.main import can_run_in_parallel, format_errors, main, run_mypy, run_refurb, sort_errors
 from refurb.settings import Settings, load_settings, parse_command_line_args
+from refurb.suppressions import Suppressions
 
 
 def test_invalid_args_returns_error_code():
@@ -111,6 +113,36 @@ MypyFile:1(
     ]
 
 
+def test_debug_output_is_before_errors() -> None:
+    files = ["test/data/err_123.py", "test/data/err_131.py"]
+
+    for sort_by in (None, "error", "none"):
+        output = run_refurb(Settings(files=files, debug=True, sort_by=sort_by))
+
+        debug = [error for error in output if isinstance(error, str)]
+
+        assert len(debug) == len(files)
+        assert output[: len(files)] == debug
+
+
+def test_debug_flag_always_runs_full_analysis() -> None:
+    settings = Settings(files=["test/e2e/dummy.py"], debug=True, disable_all=True)
+
+    with patch("refurb.main.run_mypy", wraps=run_mypy) as mypy:
+        run_refurb(settings)
+
+    assert mypy.call_args.args[2] == AnalysisTier.TYPES
+
+
+def test_syntax_errors_are_the_same_for_each_analysis_tier(tmp_path: Path) -> None:
+    file = tmp_path / "bad.py"
+    file.write_text("print(\n")
+
+    settings = Settings(files=[str(file)])
+
+    assert run_refurb(settings) == run_refurb(Settings(files=[str(file)], disable_all=True))
+
+
 def test_generate_subcommand():
     with patch("refurb.main.generate") as p:
         main(["gen"])
@@ -138,7 +170,7 @@ def test_explain_flag_mentioned_if_error_exists():
     with patch("builtins.print") as p:
         main(["test/data/err_100.py"])
 
-        p.assert_called_once()
+        assert p.call_count == 2
         assert "Run `refurb --explain ERR`" in p.call_args[0][0]
 
 
@@ -150,6 +182,47 @@ def test_explain_flag_not_mentioned_when_quiet_flag_is_enabled():
         assert "Run `refurb --explain ERR`" not in p.call_args[0][0]
 
 
+def test_output_is_same_as_formatting_all_errors_at_once() -> None:
+    args = ["test/data/err_100.py", "test/data/err_123.py", "--no-color"]
+
+    with patch("builtins.print") as p:
+        main(args)
+
+    printed = "\n".join(call.args[0] for call in p.call_args_list)
+
+    assert printed == format_errors(run_refurb(Settings(files=args[:2])), Settings(color=False))
+
+
+def test_errors_are_printed_as_soon_as_each_file_is_checked() -> None:
+    files = ["test/data/err_100.py", "test/data/err_123.py", "test/e2e/dummy.py"]
+
+    with patch("builtins.print") as p:
+        main([*files, "--quiet", "--no-color"])
+
+    outputs = [call.args[0] for call in p.call_args_list]
+
+    assert len(outputs) == 2
+    assert all(line.startswith("test/data/err_100.py") for line in outputs[0].splitlines())
+    assert all(line.startswith("test/data/err_123.py") for line in outputs[1].splitlines())
+    assert all(call.kwargs == {"flush": True} for call in p.call_args_list)
+
+
+@pytest.mark.parametrize("sort_by", ["error", "none"])
+def test_streamed_errors_are_the_same_for_each_sort_mode(sort_by: str) -> None:
+    files = ["test/data/err_100.py", "test/data/err_123.py", "test/data/err_145.py"]
+
+    by_filename = [str(error) for error in run_refurb(Settings(files=files))]
+
+    errors = run_refurb(parse_command_line_args([*files, "--sort", sort_by]))
+
+    assert sorted(map(str, errors)) == sorted(by_filename)
+
+    if sort_by == "error":
+        assert errors == sorted(
+            errors, key=partial(sort_errors, settings=Settings(sort_by="error"))
+        )
+
+
 def test_no_blank_line_printed_if_there_are_no_errors():
     with patch("builtins.print") as p:
         main(["test/e2e/dummy.py"])
@@ -274,9 +347,12 @@ def test_verbose_flag_prints_message_when_all_checks_disabled() -> None:
     assert "No checks enabled" in stdout
 
 
-def test_timing_stats_outputs_stats_file() -> None:
-    with NamedTemporaryFile(mode="r", encoding="utf8") as tmp:
-        main(["test/e2e/dummy.py", "--timing-stats", tmp.name])
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_timing_stats_outputs_stats_file(jobs: str) -> None:
+    files = ["test/data/err_123.py", "test/data/err_145.py"]
+
+    with NamedTemporaryFile(mode="r", encoding="utf8") as tmp, patch("builtins.print"):
+        main([*files, "--timing-stats", tmp.name, "--jobs", jobs])
 
         stats_file = Path(tmp.name)
 
@@ -289,6 +365,8 @@ def test_timing_stats_outputs_stats_file() -> None:
                 "mypy_total_time_spent_in_ms": int(_),
                 "mypy_time_spent_parsing_modules_in_ms": dict(mypy_timing),
                 "refurb_time_spent_checking_file_in_ms": dict(refurb_timing),
+                "refurb_nodes_visited_per_file": dict(nodes_visited),
+                "refurb_checks": {"FURB123": dict(furb123), **checks},
             }:
                 msg = "All values must be ints"
 
@@ -296,6 +374,16 @@ def test_timing_stats_outputs_stats_file() -> None:
 
                 assert all(isinstance(v, int) for v in refurb_timing.values()), msg
 
+                assert nodes_visited.keys() == {"test.data.err_123", "test.data.err_145"}
+                assert all(v > 0 for v in nodes_visited.values())
+
+                assert furb123["calls"] > 0
+                assert furb123["errors"] > 0
+                assert furb123["node_types"] == ["CallExpr"]
+                assert isinstance(furb123["time_in_ms"], float)
+
+                assert "FURB145" in checks
+
                 return
 
         pytest.fail("Data is not in proper format")
@@ -303,7 +391,7 @@ def test_timing_stats_outputs_stats_file() -> None:
 
 def test_color_is_enabled_by_default():
     with patch("builtins.print") as p:
-        main(["test/data/err_123.py"])
+        main(["test/data/err_123.py", "--quiet"])
 
         p.assert_called_once()
         assert "\x1b" in p.call_args[0][0]
@@ -311,7 +399,7 @@ def test_color_is_enabled_by_default():
 
 def test_no_color_printed_when_disabled():
     with patch("builtins.print") as p:
-        main(["test/data/err_123.py", "--no-color"])
+        main(["test/data/err_123.py", "--quiet", "--no-color"])
 
         p.assert_called_once()
         assert "\x1b" not in p.call_args[0][0]
@@ -319,7 +407,7 @@ def test_no_color_printed_when_disabled():
 
 def test_error_github_actions_formatting():
     with patch("builtins.print") as p:
-        main(["test/data/err_123.py", "--format", "github"])
+        main(["test/data/err_123.py", "--quiet", "--format", "github"])
 
         p.assert_called_once()
         assert "::error" in p.call_args[0][0]
@@ -345,4 +433,32 @@ def test_is_ignored_via_amend(ignore_set: set[ErrorClassifier], expected: bool)
 
     settings = Settings(ignore=ignore_set)
     error = Error123(line=1, column=1, msg="Error msg.", filename="test/error.py")
-    assert is_ignored_via_amend(error, settings) is expected
+    assert Suppressions(settings).is_ignored_via_amend(error) is expected
+
+
+def test_parallel_output_is_identical_to_serial_output() -> None:
+    files = [
+        "test/data/err_100.py",
+        "test/data/err_123.py",
+        "test/data/err_131.py",
+        "test/data/err_145.py",
+        "test/e2e/dummy.py",
+    ]
+
+    serial = run_refurb(Settings(files=files, debug=True))
+    parallel = run_refurb(Settings(files=files, debug=True, jobs=3))
+
+    assert serial
+    assert [str(error) for error in parallel] == [str(error) for error in serial]
+
+
+def test_parallel_mode_is_skipped_when_not_needed() -> None:
+    files = [BuildSource("a.py", "a"), BuildSource("b.py", "b")]
+
+    assert can_run_in_parallel(files, Settings(jobs=2))
+    assert not can_run_in_parallel(files, Settings())
+    assert not can_run_in_parallel(files, Settings(jobs=1))
+    assert not can_run_in_parallel(files[:1], Settings(jobs=2))
+
+    with patch("refurb.main.get_all_start_methods", return_value=["spawn"]):
+        assert not can_run_in_parallel(files, Settings(jobs=2))
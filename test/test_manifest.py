@@ -0,0 +1,167 @@
+import json
+import subprocess
+import sys
+from functools import partial
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from mypy.nodes import CallExpr
+
+from refurb.error import AnalysisTier, ErrorCode
+from refurb.explain import explain
+from refurb.loader import load_checks
+from refurb.manifest import (
+    MANIFEST_VERSION,
+    ManifestEntry,
+    build_manifest,
+    read_manifest,
+    write_manifest,
+)
+from refurb.settings import Settings
+from refurb.types import Checks
+
+
+def unwrap_checks(checks: Checks) -> dict[str, list[str]]:
+    return {
+        ty.__name__: [
+            (check.func if isinstance(check, partial) else check).__module__ for check in funcs
+        ]
+        for ty, funcs in checks.items()
+    }
+
+
+def test_manifest_is_up_to_date() -> None:
+    assert read_manifest() == build_manifest(), "Run `make manifest` to update the manifest"
+
+
+def test_manifest_round_trip(tmp_path: Path) -> None:
+    entry = ManifestEntry(
+        module="some.module",
+        prefix="XYZ",
+        code=123,
+        name="some-check",
+        categories=("a", "b"),
+        enabled=False,
+        tier=AnalysisTier.SEMANTIC,
+        node_types=(CallExpr,),
+        takes_settings=True,
+    )
+
+    manifest = tmp_path / "manifest.json"
+
+    write_manifest([entry], manifest)
+
+    assert read_manifest(manifest) == [entry]
+
+
+def test_invalid_manifest_is_ignored(tmp_path: Path) -> None:
+    manifest = tmp_path / "manifest.json"
+
+    assert read_manifest(manifest) is None
+
+    manifest.write_text("not json")
+    assert read_manifest(manifest) is None
+
+    manifest.write_text(json.dumps({"version": MANIFEST_VERSION + 1, "checks": []}))
+    assert read_manifest(manifest) is None
+
+    entry = build_manifest()[0].serialize()
+
+    entry["node_types"] = ["NotANodeType"]
+    manifest.write_text(json.dumps({"version": MANIFEST_VERSION, "checks": [entry]}))
+    assert read_manifest(manifest) is None
+
+    entry["node_types"] = "CallExpr"
+    manifest.write_text(json.dumps({"version": MANIFEST_VERSION, "checks": [entry]}))
+    assert read_manifest(manifest) is None
+
+
+def test_loading_checks_without_manifest_gives_same_checks() -> None:
+    settings = Settings(enable_all=True, load=["test.custom_checks"])
+
+    with_manifest = load_checks(settings)
+
+    with patch("refurb.loader.read_manifest", return_value=None):
+        without_manifest = load_checks(settings)
+
+    assert unwrap_checks(with_manifest) == unwrap_checks(without_manifest)
+
+
+def test_builtin_checks_passed_via_load_flag_are_not_loaded_twice() -> None:
+    settings = Settings(
+        disable_all=True,
+        enable={ErrorCode(100)},
+        load=["refurb.checks.pathlib.with_suffix"],
+    )
+
+    checks = load_checks(settings)
+
+    assert sum(len(funcs) for funcs in checks.values()) == 1
+
+
+def get_imported_checks(settings: str, *, use_manifest: bool = True) -> set[str]:
+    # Ran in a subprocess so that checks imported by other tests aren't counted
+    code = f"""\
+import sys
+
+from refurb import loader
+from refurb.error import ErrorCode
+from refurb.settings import Settings
+
+if not {use_manifest}:
+    loader.read_manifest = lambda: None
+
+loader.load_checks({settings})
+
+print("\\n".join(name for name in sys.modules if name.startswith("refurb.checks.")))
+"""
+
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+    return set(output.splitlines())
+
+
+def test_only_enabled_checks_are_imported() -> None:
+    modules = get_imported_checks("Settings(disable_all=True, enable={ErrorCode(145)})")
+
+    assert "refurb.checks.builtin.no_slice_copy" in modules
+    assert "refurb.checks.pathlib.with_suffix" not in modules
+
+
+def test_manifest_imports_fewer_checks_than_full_walk() -> None:
+    # Importing the check modules is what makes up most of the time spent in `load_checks()`
+    manifest = read_manifest()
+    assert manifest
+
+    builtin_checks = {entry.module for entry in manifest}
+
+    for settings in ("Settings()", "Settings(disable_all=True, enable={ErrorCode(145)})"):
+        with_manifest = get_imported_checks(settings) & builtin_checks
+        without_manifest = get_imported_checks(settings, use_manifest=False) & builtin_checks
+
+        assert without_manifest == builtin_checks
+        assert len(with_manifest) < len(without_manifest)
+
+    assert with_manifest == {"refurb.checks.builtin.no_slice_copy"}
+
+
+def test_explain_works_without_manifest() -> None:
+    with patch("refurb.explain.read_manifest", return_value=None):
+        assert "FURB100" in explain(Settings(explain=ErrorCode(100)))
+
+        msg = explain(Settings(explain=ErrorCode(999)))
+
+    assert msg == 'refurb: Error code "FURB999" not found'
+
+
+def test_plugins_are_not_included_in_manifest() -> None:
+    plugin = SimpleNamespace(value="test.custom_checks")
+
+    with patch("refurb.loader.entry_points", return_value=[plugin]):
+        manifest = build_manifest()
+
+    assert manifest
+    assert all(entry.module.startswith("refurb.checks.") for entry in manifest)
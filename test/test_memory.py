@@ -0,0 +1,245 @@
+import json
+from itertools import chain, repeat
+from pathlib import Path
+from unittest.mock import patch
+
+from mypy.build import BuildResult, BuildSource
+from mypy.nodes import FuncDef, Statement, TypeInfo
+
+from refurb import memory
+from refurb.error import AnalysisTier, ErrorCode
+from refurb.main import get_mypy_options, main, run_mypy, run_refurb
+from refurb.memory import free_function_bodies, free_unused_memory, get_peak_rss, get_rss
+from refurb.settings import Settings
+from refurb.visitor import TraverserVisitor
+
+FILES = sorted(str(file) for file in Path("test/data").glob("err_10*.py"))
+
+
+def test_rss_is_measured() -> None:
+    assert get_rss() > 0
+    assert get_peak_rss() > 0
+
+
+def test_memory_stats_are_added_to_timing_stats(tmp_path: Path) -> None:
+    stats = tmp_path / "stats.json"
+
+    main(["test/e2e/dummy.py", "--timing-stats", str(stats)])
+
+    data = json.loads(stats.read_text())
+
+    assert list(data["memory"]) == ["load_checks", "build", "check"]
+    assert data["memory"]["build"].keys() == {"rss_in_mb", "peak_rss_in_mb"}
+    assert data["memory_freed_early"] is False
+
+
+def test_trace_memory_flag_adds_allocations_to_timing_stats(tmp_path: Path) -> None:
+    stats = tmp_path / "stats.json"
+
+    # Tracing a full Mypy build is slow, so only enable a check which just needs to parse the file
+    args = ["--disable-all", "--enable", "FURB171", "--trace-memory"]
+
+    main(["test/e2e/dummy.py", "--timing-stats", str(stats), *args])
+
+    build = json.loads(stats.read_text())["memory"]["build"]
+
+    assert build["traced_peak_in_mb"] >= build["traced_in_mb"] > 0
+    assert str(Path("refurb/analysis.py").resolve()) in build["top_allocations_in_mb"]
+
+
+def test_unused_modules_are_freed() -> None:
+    mypy_options = get_mypy_options(Settings(files=["test/data/err_101.py"]))
+    assert isinstance(mypy_options, tuple)
+
+    files, opt = mypy_options
+
+    result = run_mypy(files, opt, AnalysisTier.TYPES)
+    assert isinstance(result, BuildResult)
+
+    free_unused_memory(result, files)
+
+    tree = result.graph["test.data.err_101"].tree
+    assert tree
+    assert tree.defs
+
+    pathlib = result.graph["pathlib"].tree
+    assert pathlib
+
+    path = pathlib.names["PurePath"].node
+    assert isinstance(path, TypeInfo)
+
+    methods = [stmt for stmt in path.defn.defs.body if isinstance(stmt, FuncDef)]
+
+    assert methods
+    assert all(not method.body.body for method in methods)
+
+    assert list(result.manager.fscache.read_cache) == ["test/data/err_101.py"]
+
+
+def test_unused_trees_are_released_in_low_memory_mode() -> None:
+    mypy_options = get_mypy_options(Settings(files=["test/data/err_101.py"]))
+    assert isinstance(mypy_options, tuple)
+
+    files, opt = mypy_options
+
+    result = run_mypy(files, opt, AnalysisTier.TYPES)
+    assert isinstance(result, BuildResult)
+
+    tree = result.graph["test.data.err_101"].tree
+    assert tree
+
+    pathlib = result.graph["pathlib"].tree
+    assert pathlib
+
+    path = pathlib.names["PurePath"].node
+    assert isinstance(path, TypeInfo)
+
+    free_unused_memory(result, files, release_trees=True)
+
+    assert result.graph["test.data.err_101"].tree is tree
+    assert tree.defs
+
+    builtins = result.graph["builtins"].tree
+    assert builtins
+    assert builtins.defs
+
+    assert not result.graph["pathlib"].tree
+    assert not pathlib.defs
+
+    # Classes which are referred to are still usable, minus the function bodies
+    methods = [stmt for stmt in path.defn.defs.body if isinstance(stmt, FuncDef)]
+
+    assert methods
+    assert all(not method.body.body for method in methods)
+
+
+def test_low_memory_mode_gives_same_results(tmp_path: Path) -> None:
+    stats = tmp_path / "stats.json"
+
+    expected = run_refurb(Settings(files=FILES))
+
+    errors = run_refurb(Settings(files=FILES, low_memory=True, timing_stats=stats))
+
+    assert expected
+    assert errors == expected
+
+    phases = json.loads(stats.read_text())["memory"]
+
+    assert list(phases) == ["load_checks", "build", "free_unused_memory", "check"]
+
+    # Only the files being checked are parsed when the checks only need the syntax tree
+    syntax_only = Settings(files=FILES, disable_all=True, enable={ErrorCode(171)})
+
+    assert run_refurb(Settings.merge(syntax_only, Settings(low_memory=True))) == run_refurb(
+        syntax_only
+    )
+
+
+FUNCTIONS = """\
+import sys
+from typing import overload
+
+def f() -> None:
+    print("f")
+
+class C:
+    @staticmethod
+    def g() -> None:
+        print("g")
+
+    @overload
+    def h(self, x: int) -> int: ...
+    @overload
+    def h(self, x: str) -> str: ...
+    def h(self, x):
+        return x
+
+if sys.version_info >= (3, 10):
+    def i() -> None:
+        print("i")
+else:
+    def i() -> None:
+        print("i")
+"""
+
+
+def test_function_bodies_are_freed() -> None:
+    mypy_options = get_mypy_options(Settings(files=["test/e2e/dummy.py"]))
+    assert isinstance(mypy_options, tuple)
+
+    # Overloads are only merged during semantic analysis
+    result = run_mypy(
+        [BuildSource(None, "mod", text=FUNCTIONS)], mypy_options[1], AnalysisTier.SEMANTIC
+    )
+
+    tree = result.graph["mod"].tree
+    assert tree
+
+    free_function_bodies(tree.defs)
+
+    bodies: list[list[Statement]] = []
+
+    class Visitor(TraverserVisitor):
+        def visit_func_def(self, o: FuncDef) -> None:
+            bodies.append(o.body.body)
+
+            super().visit_func_def(o)
+
+    Visitor().accept(tree)
+
+    assert len(bodies) == 7
+    assert not any(bodies)
+
+
+def test_memory_is_freed_when_nearing_max_memory() -> None:
+    freed: list[bool] = []
+
+    def free(*args: object) -> None:
+        freed.append(True)
+
+        free_unused_memory(*args)  # type: ignore[arg-type]
+
+    def fake_get_rss() -> int:
+        return 500 if freed else 900
+
+    expected = run_refurb(Settings(files=FILES))
+
+    # Only the files being checked are parsed when the checks only need the syntax tree
+    syntax_only = Settings(
+        files=FILES, max_memory=1_000, disable_all=True, enable={ErrorCode(171)}
+    )
+    full_build = Settings(files=FILES, max_memory=1_000)
+
+    for settings in (syntax_only, full_build):
+        freed.clear()
+
+        with (
+            patch.object(memory, "get_rss", fake_get_rss),
+            patch.object(memory, "free_unused_memory", free),
+        ):
+            errors = run_refurb(settings)
+
+        assert freed == [True]
+
+    assert expected
+    assert errors == expected
+
+
+def test_going_over_max_memory_stops_refurb() -> None:
+    errors = run_refurb(Settings(files=FILES, max_memory=1024))
+
+    assert len(errors) == 1
+    assert str(errors[0]).startswith("refurb: memory usage (")
+    assert str(errors[0]).endswith(
+        "is over the limit set by --max-memory (0.0MiB) after building the Mypy graph. "
+        "Try checking fewer files at a time, or raise the limit"
+    )
+
+    # Memory is measured after loading the checks, after the build, and once per file
+    rss = chain([0, 0, 0], repeat(2_000))
+
+    with patch.object(memory, "get_rss", lambda: next(rss)):
+        errors = run_refurb(Settings(files=FILES, max_memory=1_000))
+
+    assert len(errors) == 1
+    assert f'after checking "{FILES[0]}"' in str(errors[0])
@@ -0,0 +1,142 @@
+import json
+from dataclasses import dataclass
+from unittest.mock import patch
+
+import pytest
+
+from refurb.error import Error
+from refurb.main import format_as_json_line, format_errors, main, run_refurb
+from refurb.sarif import SarifWriter
+from refurb.settings import Settings
+
+
+@dataclass
+class CustomError(Error):
+    name = "custom-error"
+    prefix = "ABC"
+    code = 123
+    categories = ("abc", "xyz")
+    msg: str = "This is a test"
+
+
+ERROR = CustomError(line=1, column=2, filename="file.py", line_end=3, column_end=4)
+
+
+def test_error_is_converted_to_json_line() -> None:
+    assert json.loads(format_as_json_line(ERROR)) == {
+        "code": "ABC123",
+        "name": "custom-error",
+        "categories": ["abc", "xyz"],
+        "filename": "file.py",
+        "line": 1,
+        "column": 3,
+        "line_end": 3,
+        "column_end": 5,
+        "msg": "This is a test",
+    }
+
+
+def test_string_error_messages_are_converted_to_json_line() -> None:
+    data = json.loads(format_as_json_line("testing"))
+
+    assert data.pop("msg") == "testing"
+    assert set(data.values()) == {None}
+
+
+def test_jsonl_format_outputs_one_error_per_line(capsys: pytest.CaptureFixture[str]) -> None:
+    args = ["test/data/err_100.py", "test/data/err_123.py"]
+
+    assert main([*args, "--format", "jsonl"]) == 1
+
+    lines = capsys.readouterr().out.splitlines()
+    errors = run_refurb(Settings(files=args))
+
+    assert [json.loads(line)["msg"] for line in lines] == [str(error.msg) for error in errors]  # type: ignore[union-attr]
+
+
+def test_sarif_log_has_results_rules_and_notifications() -> None:
+    sarif = SarifWriter()
+
+    lines = [sarif.start(), sarif.format(ERROR), sarif.format("testing"), sarif.format(ERROR)]
+
+    log = json.loads("".join(line for line in (*lines, sarif.finish()) if line))
+
+    assert log["version"] == "2.1.0"
+
+    [run] = log["runs"]
+
+    assert run["results"][0] == run["results"][1]
+    assert run["results"][0] == {
+        "ruleId": "ABC123",
+        "level": "error",
+        "message": {"text": "This is a test"},
+        "locations": [
+            {
+                "physicalLocation": {
+                    "artifactLocation": {"uri": "file.py"},
+                    "region": {"startLine": 1, "startColumn": 3, "endLine": 3, "endColumn": 5},
+                }
+            }
+        ],
+        "properties": {"categories": ["abc", "xyz"]},
+    }
+
+    assert run["tool"]["driver"]["name"] == "refurb"
+    assert run["tool"]["driver"]["rules"] == [
+        {"id": "ABC123", "name": "custom-error", "properties": {"categories": ["abc", "xyz"]}}
+    ]
+
+    assert run["invocations"] == [
+        {
+            "executionSuccessful": False,
+            "toolExecutionNotifications": [{"level": "error", "message": {"text": "testing"}}],
+        }
+    ]
+
+
+def test_sarif_region_without_end_position() -> None:
+    sarif = SarifWriter()
+    sarif.start()
+
+    line = sarif.format(CustomError(line=1, column=2, filename="file.py"))
+    assert line
+
+    region = json.loads(line)["locations"][0]["physicalLocation"]["region"]
+
+    assert region == {"startLine": 1, "startColumn": 3}
+
+
+def test_sarif_format_is_a_valid_log(capsys: pytest.CaptureFixture[str]) -> None:
+    args = ["test/data/err_100.py", "test/data/err_123.py"]
+
+    assert main([*args, "--format", "sarif"]) == 1
+
+    output = capsys.readouterr().out
+
+    # Printed one result per line, without an explain message
+    log = json.loads(output)
+
+    errors = run_refurb(Settings(files=args))
+
+    assert len(log["runs"][0]["results"]) == len(errors)
+    assert log["runs"][0]["invocations"][0]["executionSuccessful"]
+    assert len(output.splitlines()) == len(errors) + 2
+
+    assert output.rstrip("\n") == format_errors(errors, Settings(format="sarif"))
+
+
+def test_sarif_format_without_errors_is_a_valid_log(capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["test/e2e/dummy.py", "--format", "sarif"]) == 0
+
+    assert json.loads(capsys.readouterr().out)["runs"][0]["results"] == []
+
+
+def test_structured_formats_dont_print_explain_message() -> None:
+    for format in ("jsonl", "sarif"):
+        with patch("builtins.print") as p:
+            main(["test/data/err_100.py", "--format", format])
+
+        printed = "\n".join(str(call.args[0]) for call in p.call_args_list)
+
+        assert "refurb --explain" not in printed
+        assert "refurb --explain" not in format_errors([ERROR], Settings(format=format))
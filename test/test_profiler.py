@@ -0,0 +1,47 @@
+import pstats
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from refurb.main import main
+
+FILES = ["test/data/err_123.py", "test/data/err_145.py"]
+
+
+def test_build_and_checks_are_profiled(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    folder = tmp_path / "profile"
+
+    with patch("refurb.cache.CACHE_DIR", tmp_path / "cache"):
+        main([*FILES, "--quiet", "--profile", str(folder), "--jobs", "2", "--cache"])
+
+    build = pstats.Stats(str(folder / "build.pstats"))
+    checks = pstats.Stats(str(folder / "checks.pstats"))
+
+    def get_function_names(stats: pstats.Stats) -> set[str]:
+        return {name for _, _, name in stats.stats}  # type: ignore[attr-defined]
+
+    assert "run_mypy" in get_function_names(build)
+    assert "check_file" not in get_function_names(build)
+
+    assert "check_file" in get_function_names(checks)
+    assert "run_mypy" not in get_function_names(checks)
+
+    summary = capsys.readouterr().err.splitlines()
+
+    assert f"Wrote checks profile (2 files) to {folder / 'checks.pstats'}" in summary
+    assert any("refurb/checks/readability/no_unnecessary_cast.py" in line for line in summary)
+
+
+def test_only_files_matching_glob_are_profiled(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    folder = tmp_path / "profile"
+
+    main([*FILES, "--quiet", "--profile", str(folder), "--profile-files", "*/err_145.py"])
+
+    assert "Wrote checks profile (1 files)" in capsys.readouterr().err
+
+    main([*FILES, "--quiet", "--profile", str(folder), "--profile-files", "*/missing.py"])
+
+    assert "No files were profiled" in capsys.readouterr().err
@@ -0,0 +1,212 @@
+import json
+from pathlib import Path
+
+import pytest
+from mypy.build import BuildSource
+
+from refurb.main import main
+from refurb.shard import get_shard_files, get_shard_index
+
+FILES = sorted(str(file) for file in Path("test/data").glob("err_1[01]*.py"))
+
+
+def test_every_module_is_in_exactly_one_shard() -> None:
+    files = [BuildSource(None, f"module_{i}") for i in range(100)]
+
+    shards = [get_shard_files(files, (i, 8)) for i in range(1, 9)]
+
+    assert sorted(file.module for shard in shards for file in shard) == sorted(
+        file.module for file in files
+    )
+    assert all(shards)
+
+
+def test_shard_index_is_stable() -> None:
+    # The same module must always be put in the same shard, regardless of the process
+    assert get_shard_index("refurb.main", 8) == 3
+
+
+def run_shards(tmp_path: Path, args: list[str], shards: int) -> list[str]:
+    results = [str(tmp_path / f"shard_{i}.json") for i in range(1, shards + 1)]
+
+    for i, result in enumerate(results, start=1):
+        main([*FILES, *args, "--shard", f"{i}/{shards}", "--shard-results", result])
+
+    return results
+
+
+def test_merged_output_matches_single_run(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    for args in ([], ["--sort", "error"], ["--format", "github"]):
+        assert main([*FILES, *args]) == 1
+
+        expected = capsys.readouterr().out
+
+        results = run_shards(tmp_path, args, 3)
+        capsys.readouterr()
+
+        assert main(["merge", *args, *results]) == 1
+
+        assert capsys.readouterr().out == expected
+
+
+def test_merge_applies_ignore_rules(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    results = run_shards(tmp_path, [], 2)
+    capsys.readouterr()
+
+    assert main(["merge", "--ignore", "FURB100,FURB101", *results]) == 1
+
+    output = capsys.readouterr().out
+
+    assert "FURB100" not in output
+    assert "FURB101" not in output
+    assert "FURB102" in output
+
+
+def test_merge_applies_category_rules(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    results = run_shards(tmp_path, [], 2)
+    capsys.readouterr()
+
+    for args in (["--ignore", "#readability"], ["--disable", "#readability"]):
+        assert main([*FILES, *args]) == 1
+
+        expected = capsys.readouterr().out
+
+        assert main(["merge", *args, *results]) == 1
+
+        output = capsys.readouterr().out
+
+        assert output == expected
+        assert "FURB102" in output
+        assert "FURB107" not in output
+
+
+def test_merged_messages_are_not_duplicated(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    # Every shard imports the broken module, so they all record the same Mypy error
+    (tmp_path / "broken.py").write_text("x = (\n")
+
+    files = [f"file_{i}.py" for i in range(6)]
+
+    for file in files:
+        (tmp_path / file).write_text("import broken\n")
+
+    args = [*files, "--config-file", "/dev/null"]
+
+    assert main(args) == 1
+
+    expected = capsys.readouterr().out
+
+    for i in (1, 2):
+        main([*args, "--shard", f"{i}/2", "--shard-results", f"shard_{i}.json"])
+
+    capsys.readouterr()
+
+    assert main(["merge", "shard_1.json", "shard_2.json"]) == 1
+
+    assert capsys.readouterr().out == expected
+    assert expected.count("\n") == 1
+
+
+def test_shard_without_files_writes_empty_results(tmp_path: Path) -> None:
+    result = tmp_path / "shard.json"
+
+    # There is only one file, so one of the shards will always be empty
+    for i in (1, 2):
+        assert (
+            main(["test/e2e/dummy.py", "--shard", f"{i}/2", "--shard-results", str(result)]) == 0
+        )
+
+        assert json.loads(result.read_text())["errors"] == []
+
+
+def test_default_shard_results_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    dummy = Path("test/e2e/dummy.py").resolve()
+
+    monkeypatch.chdir(tmp_path)
+
+    assert main([str(dummy), "--shard", "1/1", "--config-file", "/dev/null"]) == 0
+
+    assert (tmp_path / "refurb-shard-1-of-1.json").exists()
+
+
+def test_merge_errors(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    first, second = run_shards(tmp_path, ["--disable-all", "--enable", "FURB101"], 2)
+    third = run_shards(tmp_path / "..", ["--disable-all", "--enable", "FURB101"], 3)[0]
+
+    invalid = tmp_path / "invalid.json"
+    invalid.write_text("not json")
+
+    invalid_error = tmp_path / "invalid_error.json"
+    invalid_error.write_text(
+        json.dumps({"version": 1, "shard": 1, "shards": 1, "errors": [{"type": "x:Y"}]})
+    )
+
+    old_version = tmp_path / "old_version.json"
+    old_version.write_text(json.dumps({"version": 0, "shard": 1, "shards": 1, "errors": []}))
+
+    tests = {
+        (): "refurb: no shard result files were passed",
+        (first,): "refurb: missing results for shard(s) 2/2",
+        (first, first, second): "refurb: the same shard was passed more than once",
+        (first, third): "refurb: shard result files are from runs with a different shard count",
+        (str(invalid),): f'refurb: "{invalid}" is not a valid shard result file',
+        (str(invalid_error),): f'refurb: "{invalid_error}" is not a valid shard result file',
+        (str(old_version),): f'refurb: "{old_version}" is not a valid shard result file',
+        (str(tmp_path / "missing.json"),): f'refurb: could not read "{tmp_path / "missing.json"}"',
+    }
+
+    capsys.readouterr()
+
+    for files, error in tests.items():
+        assert main(["merge", *files]) == 1
+
+        assert capsys.readouterr().out == f"{error}\n"
+
+
+def test_messages_are_merged(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    result = str(tmp_path / "shard.json")
+
+    assert main(["non_existent_file.py", "--shard", "1/1", "--shard-results", result]) == 1
+
+    expected = capsys.readouterr().out
+
+    assert main(["merge", result]) == 1
+
+    assert capsys.readouterr().out == expected
+
+
+def test_merge_does_not_read_source_files(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+
+    file = src / "file.py"
+    file.write_text("x = [1]\ndel x[:]\ny = list(x)\n")
+
+    result = str(tmp_path / "shard.json")
+
+    assert main([str(file), "--shard", "1/1", "--shard-results", result]) == 1
+
+    expected = capsys.readouterr().out
+
+    # The merge job might not have a checkout of the code
+    file.unlink()
+
+    assert main(["merge", result]) == 1
+    assert capsys.readouterr().out == expected
+
+    config_file = tmp_path / "pyproject.toml"
+    config_file.write_text('[[tool.refurb.amend]]\npath = "src"\nignore = ["FURB123"]\n')
+
+    assert main(["merge", "--config-file", str(config_file), result]) == 1
+
+    output = capsys.readouterr().out
+
+    assert "FURB123" not in output
+    assert "FURB131" in output
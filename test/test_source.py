@@ -0,0 +1,109 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from mypy.build import BuildSource
+from mypy.options import Options
+from mypy.util import decode_python_encoding
+
+from refurb.analysis import parse_files
+from refurb.error import AnalysisTier
+from refurb.main import get_mypy_options, run_mypy, run_refurb
+from refurb.settings import Settings
+from refurb.source import SourceStore
+
+
+def test_lines_are_looked_up_by_line_number(tmp_path: Path) -> None:
+    file = tmp_path / "file.py"
+    file.write_bytes(b"a = 1\r\nb = 2\n\nc = 3")
+
+    store = SourceStore()
+
+    assert store.get_source(str(file)) == "a = 1\r\nb = 2\n\nc = 3"
+
+    lines = [store.get_line(str(file), line) for line in range(6)]
+
+    assert lines == ["", "a = 1", "b = 2", "", "c = 3", ""]
+
+
+def test_least_recently_used_files_are_evicted(tmp_path: Path) -> None:
+    files = []
+
+    for i in range(3):
+        file = tmp_path / f"file_{i}.py"
+        file.write_text(f"x = {i}\n" * 100)
+
+        files.append(str(file))
+
+    store = SourceStore(max_size=1_500)
+
+    store.get_source(files[0])
+    store.get_source(files[1])
+    store.get_source(files[0])
+    store.get_source(files[2])
+
+    assert list(store.files) == [files[0], files[2]]
+    assert store.size == sum(file.size for file in store.files.values())
+
+    # Building the line index counts towards the size of the store as well
+    assert store.get_line(files[0], 100) == "x = 0"
+
+    assert list(store.files) == [files[0]]
+    assert store.size == store.files[files[0]].size
+
+    # Evicted files are read again when needed
+    assert store.get_line(files[1], 1) == "x = 1"
+
+
+def test_source_is_taken_from_mypy_file_system_cache() -> None:
+    mypy_options = get_mypy_options(Settings(files=["test/e2e/dummy.py"]))
+    assert isinstance(mypy_options, tuple)
+
+    files, opt = mypy_options
+
+    for tier in AnalysisTier:
+        store = SourceStore.from_result(run_mypy(files, opt, tier))
+
+        assert "test/e2e/dummy.py" in store.fscache.read_cache
+
+
+def test_source_passed_as_text_is_not_added_to_file_system_cache() -> None:
+    result = parse_files([BuildSource(None, "mod", text="x = 1")], Options())
+
+    assert not SourceStore.from_result(result).fscache.read_cache
+
+
+def test_source_of_build_source_is_looked_up(tmp_path: Path) -> None:
+    file = tmp_path / "file.py"
+    file.write_text("x = 1\ny = 2\n")
+
+    store = SourceStore()
+
+    source = store.get_build_source_file(BuildSource(str(file), "file"))
+
+    assert source
+    assert source.get_line(2) == "y = 2"
+    assert store.files[str(file)] is source
+
+    text = store.get_build_source_file(BuildSource(None, "mod", text="z = 3"))
+
+    assert text
+    assert text.get_line(1) == "z = 3"
+    assert str(file) in store.files
+    assert len(store.files) == 1
+
+    assert not store.get_build_source_file(BuildSource(None, "mod"))
+    assert not store.get_build_source_file(BuildSource(str(tmp_path / "missing.py"), "missing"))
+
+
+def test_each_file_is_decoded_once_per_run(tmp_path: Path) -> None:
+    file = tmp_path / "file.py"
+    file.write_text("x = str('x')\ny = str('y')  # noqa: FURB123\n")
+
+    with patch("refurb.source.decode_python_encoding", wraps=decode_python_encoding) as decode:
+        errors = run_refurb(Settings(files=[str(file)]))
+
+    # The source is used both for the error message and for finding the `noqa` comments
+    assert [str(error) for error in errors] == [
+        f"{file}:1:5 [FURB123]: Replace `str('x')` with `'x'`",
+    ]
+    assert decode.call_count == 1
@@ -0,0 +1,85 @@
+from pathlib import Path
+
+from refurb.error import ErrorClassifier, ErrorCode
+from refurb.main import run_refurb
+from refurb.settings import Settings
+from refurb.suppressions import NoqaComment, parse_noqa_comments
+
+CODE = """\
+x = int(0)  # noqa: FURB123
+y = 1  # noqa: FURB123, XYZ100
+z = list()  # noqa
+w = int(0)  # noqa: FURB123 FURB145
+"""
+
+
+def test_noqa_comments_are_indexed_by_line() -> None:
+    lines = [
+        "a = 1  # noqa",
+        "b = 2  # noqa: FURB123",
+        'c = "# noqa"',
+        "d = 3  # noqa: FURB123,FURB145  ",
+        "e = 4  # noqa but not at the end",
+    ]
+
+    source = "\n".join(lines)
+
+    assert parse_noqa_comments(source) == {
+        1: NoqaComment(7, None),
+        2: NoqaComment(7, frozenset({"FURB123"})),
+        4: NoqaComment(7, frozenset({"FURB123", "FURB145"})),
+    }
+
+
+def test_unused_noqa_codes_are_reported(tmp_path: Path) -> None:
+    file = tmp_path / "file.py"
+    file.write_text(CODE)
+
+    errors = run_refurb(Settings(files=[str(file)], report_unused_noqa=True))
+
+    assert [str(error) for error in errors] == [
+        f"{file}:2:8 [NOQA100]: Unused `noqa` code(s): FURB123",
+        f"{file}:4:13 [NOQA100]: Unused `noqa` code(s): FURB145",
+    ]
+
+
+def test_unused_noqa_codes_for_disabled_checks_are_not_reported(tmp_path: Path) -> None:
+    file = tmp_path / "file.py"
+    file.write_text(CODE)
+
+    disable: set[ErrorClassifier] = {ErrorCode(145)}
+    settings = Settings(files=[str(file)], report_unused_noqa=True, disable=disable)
+
+    errors = run_refurb(settings)
+
+    assert [str(error) for error in errors] == [
+        f"{file}:2:8 [NOQA100]: Unused `noqa` code(s): FURB123",
+    ]
+
+
+def test_unused_noqa_codes_are_not_reported_by_default(tmp_path: Path) -> None:
+    file = tmp_path / "file.py"
+    file.write_text(CODE)
+
+    assert not run_refurb(Settings(files=[str(file)]))
+
+
+def test_unused_noqa_errors_can_be_ignored(tmp_path: Path) -> None:
+    file = tmp_path / "file.py"
+    file.write_text(CODE)
+
+    for ignore in (ErrorCode(100, "NOQA"), ErrorCode(100, "NOQA", path=file)):
+        settings = Settings(files=[str(file)], report_unused_noqa=True, ignore={ignore})
+
+        assert not run_refurb(settings)
+
+
+def test_unused_noqa_errors_can_be_ignored_via_noqa_comment(tmp_path: Path) -> None:
+    file = tmp_path / "file.py"
+    file.write_text(CODE.replace("FURB123, XYZ100", "FURB123, NOQA100"))
+
+    errors = run_refurb(Settings(files=[str(file)], report_unused_noqa=True))
+
+    assert [str(error) for error in errors] == [
+        f"{file}:4:13 [NOQA100]: Unused `noqa` code(s): FURB145",
+    ]
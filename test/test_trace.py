@@ -0,0 +1,97 @@
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from refurb.main import main
+
+FILES = ["test/data/err_123.py", "test/data/err_145.py"]
+
+
+def run_with_trace_file(tmp_path: Path, args: list[str]) -> list[dict[str, object]]:
+    trace_file = tmp_path / "trace.json"
+
+    with patch("builtins.print"):
+        main([*args, "--trace-file", str(trace_file)])
+
+    events: list[dict[str, object]] = json.loads(trace_file.read_text())["traceEvents"]
+
+    return events
+
+
+def get_spans(events: list[dict[str, object]], category: str) -> list[dict[str, object]]:
+    return [event for event in events if event["ph"] == "X" and event["cat"] == category]
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_trace_file_has_spans_for_each_phase_and_file(tmp_path: Path, jobs: str) -> None:
+    events = run_with_trace_file(tmp_path, [*FILES, "--jobs", jobs])
+
+    refurb_spans = {span["name"] for span in get_spans(events, "refurb")}
+    mypy_spans = {span["name"]: span for span in get_spans(events, "mypy")}
+    file_spans = {span["name"]: span for span in get_spans(events, "file")}
+
+    assert refurb_spans == {"load checks", "filter errors"}
+    assert mypy_spans.keys() == {
+        "mypy",
+        "load graph (parse)",
+        "semantic analysis and type checking",
+    }
+    assert file_spans.keys() == set(FILES)
+    assert not get_spans(events, "check")
+
+    match mypy_spans["mypy"]["args"]:
+        case {"tier": "types", "modules": int(), "time_spent_per_module_in_ms": dict(modules)}:
+            assert "test.data.err_123" in modules
+
+        case _:
+            pytest.fail("Mypy span is missing args")
+
+    assert file_spans["test/data/err_123.py"]["args"] == {
+        "module": "test.data.err_123",
+        "errors": 22,
+    }
+
+    threads = [event["args"] for event in events if event["ph"] == "M"]
+
+    if jobs == "1":
+        assert threads == [{"name": "refurb"}]
+
+    else:
+        assert {"name": "refurb"} in threads
+        assert len(threads) > 1
+
+
+def test_trace_checks_flag_adds_span_for_each_check(tmp_path: Path) -> None:
+    events = run_with_trace_file(tmp_path, [*FILES, "--trace-checks"])
+
+    check_spans = get_spans(events, "check")
+
+    assert {"name": "FURB123", "node_type": "CallExpr"} in [
+        {"name": span["name"], **span["args"]} for span in check_spans  # type: ignore[dict-item]
+    ]
+
+    for span in get_spans(events, "file"):
+        match span["args"]:
+            case {"nodes_visited": int(nodes)}:
+                assert nodes > 0
+
+            case _:
+                pytest.fail("File span is missing visited node count")
+
+
+def test_trace_file_only_has_spans_for_mypy_stages_that_ran(tmp_path: Path) -> None:
+    args = ["test/data/err_171.py", "--disable-all", "--enable", "FURB171"]
+    events = run_with_trace_file(tmp_path, args)
+
+    assert [span["name"] for span in get_spans(events, "mypy")] == ["mypy", "parse"]
+
+    args = ["test/data/err_108.py", "--disable-all", "--enable", "FURB108"]
+    events = run_with_trace_file(tmp_path, args)
+
+    assert [span["name"] for span in get_spans(events, "mypy")] == [
+        "mypy",
+        "load graph (parse)",
+        "semantic analysis",
+    ]
@@ -3,12 +3,21 @@ import typing
 from collections.abc import Iterable
 
 import pytest
-from mypy.nodes import Node
+from mypy.build import build
+from mypy.nodes import ArgKind, CallExpr, Context, Expression, IntExpr, NameExpr, Node, OpExpr
 
+from refurb.error import Error
+from refurb.main import get_mypy_options
 from refurb.settings import Settings
 from refurb.types import Checks
-from refurb.visitor import METHOD_NODE_MAPPINGS, RefurbVisitor
+from refurb.visitor import (
+    METHOD_NODE_MAPPINGS,
+    RefurbVisitor,
+    TraverserVisitor,
+    build_visitor_class,
+)
 from refurb.visitor.mapping import VisitorNodeTypeMap
+from refurb.visitor.traverser import IterativeTraverserVisitor
 
 from .mypy_visitor import get_mypy_visitor_mapping
 
@@ -21,17 +30,16 @@ def dummy_visitor() -> RefurbVisitor:
 
     This forces method generation but calling the methods does nothing.
     """
-    checks = Checks(list, {ty: [] for ty in METHOD_NODE_MAPPINGS.values()})
-    return RefurbVisitor(checks, Settings())
+    checks = Checks(list, {ty: [lambda *_: None] for ty in METHOD_NODE_MAPPINGS.values()})
+    return build_visitor_class(checks)(checks, Settings())
 
 
 def get_visit_methods(
     visitor: RefurbVisitor,
 ) -> Iterable[tuple[str, type[Node]]]:
     """
-    Find visitor methods in the instance (those that have been generated in
-    __init__) and in the class' __dict__ (the ones that are overridden
-    directly in the class).
+    Find visitor methods in the instance and in the class' __dict__ (the ones
+    that have been generated by build_visitor_class).
 
     Not using inspect.getmembers because that goes too deep into the parents
     and that would deafeat the purpose of this, which is testing that the
@@ -79,3 +87,153 @@ def test_mypy_consistence() -> None:
     """
 
     assert get_mypy_visitor_mapping() == METHOD_NODE_MAPPINGS
+
+
+def test_visitor_class_only_has_methods_for_checked_node_types() -> None:
+    checks = Checks(list, {CallExpr: [lambda *_: None]})
+
+    visitor_type = build_visitor_class(checks)
+
+    assert issubclass(visitor_type, RefurbVisitor)
+    assert "visit_call_expr" in visitor_type.__dict__
+    assert "visit_name_expr" not in visitor_type.__dict__
+
+
+def test_checks_are_ran_before_visiting_child_nodes() -> None:
+    visited: list[str] = []
+
+    def check(node: Node, errors: list[Error]) -> None:
+        visited.append(type(node).__name__)
+
+    checks = Checks(list, {CallExpr: [check], IntExpr: [check], NameExpr: [check]})
+
+    node = CallExpr(NameExpr("f"), [IntExpr(1)], [ArgKind.ARG_POS], [None])
+
+    build_visitor_class(checks)(checks, Settings()).accept(node)
+
+    # Call arguments are visited before the callee
+    assert visited == ["CallExpr", "IntExpr", "NameExpr"]
+
+
+def test_visitor_without_checks_visits_call_exprs() -> None:
+    node = CallExpr(NameExpr("f"), [IntExpr(1)], [ArgKind.ARG_POS], [None])
+
+    visitor = build_visitor_class(Checks(list))(Checks(list), Settings())
+    visitor.accept(node)
+
+    assert not visitor.errors
+
+
+def record_visited_nodes(base: type[TraverserVisitor], node: Context) -> list[Context]:
+    visited: list[Context] = []
+
+    def make_method(name: str) -> typing.Callable[[TraverserVisitor, Context], None]:
+        traverse = getattr(TraverserVisitor, name)
+
+        def inner(self: TraverserVisitor, o: Context) -> None:
+            visited.append(o)
+
+            traverse(self, o)
+
+        return inner
+
+    methods = {name: make_method(name) for name in METHOD_NODE_MAPPINGS}
+
+    type("RecordingVisitor", (base,), methods)().accept(node)
+
+    return visited
+
+
+def test_iterative_visitor_visits_nodes_in_same_order_as_recursive_visitor() -> None:
+    files = ["test/data/err_115.py", "test/data/err_145.py", "test/data/err_184.py"]
+
+    mypy_options = get_mypy_options(Settings(files=files))
+    assert not isinstance(mypy_options, list)
+
+    sources, options = mypy_options
+    result = build(sources, options=options)
+
+    for source in sources:
+        tree = result.graph[source.module].tree
+        assert tree
+
+        visited = record_visited_nodes(IterativeTraverserVisitor, tree)
+
+        assert visited == record_visited_nodes(TraverserVisitor, tree)
+        assert len(visited) > 100
+
+
+def test_deeply_nested_code_is_fully_checked() -> None:
+    expr: Expression = IntExpr(1)
+
+    for _ in range(10_000):
+        expr = OpExpr("+", expr, IntExpr(1))
+
+    op_exprs: list[Node] = []
+
+    def check(node: Node, errors: list[Error]) -> None:
+        op_exprs.append(node)
+
+    checks = Checks(list, {OpExpr: [check]})
+
+    build_visitor_class(checks)(checks, Settings()).accept(expr)
+
+    assert len(op_exprs) == 10_000
+
+
+def test_recursion_error_in_check_only_skips_that_check() -> None:
+    visited: list[Node] = []
+
+    def bad_check(node: Node, errors: list[Error]) -> None:
+        raise RecursionError
+
+    def good_check(node: Node, errors: list[Error]) -> None:
+        visited.append(node)
+
+    checks = Checks(list, {CallExpr: [bad_check, good_check], IntExpr: [bad_check, good_check]})
+
+    node = CallExpr(NameExpr("f"), [IntExpr(1)], [ArgKind.ARG_POS], [None])
+
+    visitor = build_visitor_class(checks)(checks, Settings())
+    visitor.accept(node)
+
+    assert visited == [node, node.args[0]]
+    assert visitor.skipped_checks == {bad_check}
+
+
+def test_timed_visitor_records_stats_for_checks_and_nodes() -> None:
+    def check(node: Node, errors: list[Error]) -> None:
+        if isinstance(node, IntExpr):
+            errors.append(Error(node.line, node.column, "int"))
+
+        else:
+            raise RecursionError
+
+    checks = Checks(list, {CallExpr: [check], IntExpr: [check]})
+
+    node = CallExpr(NameExpr("f"), [IntExpr(1), IntExpr(2)], [ArgKind.ARG_POS] * 2, [None] * 2)
+
+    visitor = build_visitor_class(checks, timed=True)(checks, Settings())
+    visitor.accept(node)
+
+    assert len(visitor.errors) == 2
+    assert visitor.skipped_checks == {check}
+
+    assert visitor.stats
+    assert visitor.stats.nodes_visited == 4
+
+    stats = visitor.stats.checks["test.test_visitor"]
+
+    assert stats.calls == 3
+    assert stats.errors == 2
+    assert stats.node_types == {"CallExpr", "IntExpr"}
+    assert stats.time_in_ns > 0
+
+
+def test_untimed_visitor_does_not_record_stats() -> None:
+    checks = Checks(list, {CallExpr: [lambda *_: None]})
+
+    visitor = build_visitor_class(checks)(checks, Settings())
+    visitor.accept(CallExpr(NameExpr("f"), [], [], []))
+
+    assert visitor.stats is None